@@ -0,0 +1,127 @@
+"""Micro-benchmark for clean_navigation_content.
+
+크롤링된 마크다운 코퍼스(예: crawl_docs 출력 디렉토리)에 대해 현재 구현과
+기존 구현(패턴별 re.search)을 비교한다. 모든 문서의 출력이 바이트 단위로
+같은지 먼저 확인한 뒤 시간을 잰다.
+
+Run with:
+    uv run python benchmarks/bench_clean.py docs_crawl4ai_com
+    uv run python benchmarks/bench_clean.py            # 합성 코퍼스 사용
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+from crawl4ai_mcp_server.strategies.content import clean_navigation_content
+
+
+def legacy_clean_navigation_content(markdown: str) -> str:
+    """최적화 이전 구현 (비교 기준)"""
+    lines = markdown.split("\n")
+    content_start = 0
+    content_end = len(lines)
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("*") or stripped.startswith("["):
+            continue
+        if stripped.startswith("#") and i > 0:
+            content_start = i
+            break
+
+    footer_patterns = [
+        r"Was this page helpful\?",
+        r"ON THIS PAGE",
+        r"\[Next\s+.*\]",
+        r"\[Previous\s+.*\]",
+        r"Community Forum",
+        r"Discord Server",
+        r"GitHub Samples",
+        r"FigJam.*Enterprise.*Learn",
+    ]
+
+    for i in range(len(lines) - 1, content_start, -1):
+        line = lines[i]
+        for pattern in footer_patterns:
+            if re.search(pattern, line):
+                content_end = i
+                break
+        if content_end < len(lines):
+            break
+
+    result = "\n".join(lines[content_start:content_end]).strip()
+    result = re.sub(r"\n{3,}", "\n\n", result)
+    return result
+
+
+def load_corpus(corpus_dir: Path) -> list[str]:
+    return [p.read_text(encoding="utf-8") for p in sorted(corpus_dir.rglob("*.md"))]
+
+
+def synthetic_corpus(pages: int, lines_per_page: int, seed: int = 0) -> list[str]:
+    """API 레퍼런스 형태의 긴 마크다운 페이지 생성 (푸터 유무 섞음)"""
+    rng = random.Random(seed)
+    words = ["request", "response", "token", "parameter", "string", "integer", "returns", "optional"]
+    corpus = []
+
+    for n in range(pages):
+        lines = ["* [Home](/)", "* [API](/api)", "", f"# Endpoint {n}", ""]
+        for i in range(lines_per_page):
+            if i % 40 == 0:
+                lines.append(f"## Section {i // 40}")
+            elif i % 7 == 0:
+                lines.append("")
+            else:
+                lines.append(" ".join(rng.choice(words) for _ in range(12)))
+        if n % 3:
+            lines += ["", "Was this page helpful?", "[Next Endpoint](/next)", "Community Forum"]
+        corpus.append("\n".join(lines))
+
+    return corpus
+
+
+def bench(func, corpus: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in corpus:
+            func(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="?", type=Path, help="크롤링된 마크다운 디렉토리 (없으면 합성 코퍼스)")
+    parser.add_argument("--pages", type=int, default=50, help="합성 코퍼스 페이지 수")
+    parser.add_argument("--lines", type=int, default=10_000, help="합성 페이지당 줄 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages, args.lines)
+    if not corpus:
+        print(f"No markdown files found in {args.corpus}", file=sys.stderr)
+        sys.exit(1)
+
+    # 출력이 바이트 단위로 같은지 확인
+    for i, doc in enumerate(corpus):
+        if clean_navigation_content(doc).encode() != legacy_clean_navigation_content(doc).encode():
+            print(f"❌ Output differs for document #{i}", file=sys.stderr)
+            sys.exit(1)
+
+    total_lines = sum(doc.count("\n") + 1 for doc in corpus)
+    legacy = bench(legacy_clean_navigation_content, corpus, args.repeat)
+    current = bench(clean_navigation_content, corpus, args.repeat)
+
+    print(f"documents: {len(corpus)}  lines: {total_lines:,}  (outputs byte-identical)")
+    print(f"legacy : {legacy * 1000:9.1f} ms")
+    print(f"current: {current * 1000:9.1f} ms")
+    print(f"speedup: {legacy / current:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
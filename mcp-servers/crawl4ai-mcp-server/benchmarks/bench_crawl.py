@@ -0,0 +1,239 @@
+"""End-to-end crawl benchmark against a local fixture site.
+
+fixture_site.py의 합성 문서 사이트를 로컬에 띄우고 crawl_documentation을
+전략(bfs / dfs / best_first) × 브라우저 프리셋(fast / stealth) 조합으로 실행한다.
+조합마다 새 프로세스에서 크롤링하므로 peak RSS가 이전 실행의 영향을 받지 않는다.
+
+측정 항목:
+    pages/s      저장한 페이지 수 / 전체 시간 (브라우저 시작 포함)
+    p50 / p95    페이지 지연: fixture 서버가 요청을 받은 시각부터 페이지가 저장된 시각까지
+    rss          크롤러 프로세스(Python)와 가장 큰 자식 프로세스(브라우저)의 peak RSS
+    written      출력 디렉토리에 쓴 바이트 수
+
+--json으로 결과를 저장해 두고 다음 실행에서 --baseline으로 넘기면
+pages/s가 --tolerance 이상 떨어진 조합이 있을 때 종료 코드 1로 끝난다.
+
+Run with:
+    uv run python benchmarks/bench_crawl.py
+    uv run python benchmarks/bench_crawl.py --pages 500 --fanout 8 --js-ratio 0.2 --json bench.json
+    uv run python benchmarks/bench_crawl.py --strategies bfs --presets fast --baseline bench.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from fixture_site import FixtureServer, FixtureSite
+
+STRATEGIES = ("bfs", "dfs", "best_first")
+PRESETS = ("fast", "stealth")
+
+
+def percentile(values: list[float], q: float) -> float:
+    """nearest-rank 백분위수 (값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def dir_bytes(path: Path) -> int:
+    """디렉토리 아래 파일 크기 합 (링크는 링크 자체 크기)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+
+async def _crawl(start_url: str, preset: str, strategy: str, max_pages: int, max_depth: int, output_dir: Path) -> dict:
+    from crawl4ai_mcp_server.configs.browser import FAST_CONFIG, STEALTH_CONFIG
+    from crawl4ai_mcp_server.core import crawl_documentation
+
+    browser_config = {"fast": FAST_CONFIG, "stealth": STEALTH_CONFIG}[preset]
+    saved_at: dict[str, float] = {}
+
+    async def on_progress(record: dict) -> None:
+        saved_at[urlparse(record["url"]).path] = time.time()
+
+    start = time.perf_counter()
+    results = await crawl_documentation(
+        start_url,
+        output_dir=str(output_dir),
+        max_pages=max_pages,
+        max_depth=max_depth,
+        strategy=strategy,
+        browser_config=browser_config,
+        on_progress=on_progress,
+    )
+    elapsed = time.perf_counter() - start
+
+    return {
+        "pages": len(results),
+        "elapsed": elapsed,
+        "saved_at": saved_at,
+        "bytes_written": dir_bytes(output_dir),
+        # ru_maxrss는 Linux에서 KB 단위 (자식은 종료된 프로세스 중 가장 큰 것)
+        "rss_self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "rss_children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024,
+    }
+
+
+def run_child(args: argparse.Namespace) -> None:
+    """자식 프로세스: 크롤링 한 번 실행 후 결과 JSON을 stdout 마지막 줄로 출력"""
+    with contextlib.ExitStack() as stack:
+        tmp = stack.enter_context(tempfile.TemporaryDirectory(prefix="bench-crawl-"))
+        # 크롤러의 진행 로그가 결과 JSON과 섞이지 않도록 stderr(또는 버림)로
+        sink = sys.stderr if args.verbose else stack.enter_context(open(os.devnull, "w"))
+        with contextlib.redirect_stdout(sink):
+            result = asyncio.run(
+                _crawl(args.child, args.preset, args.strategy, args.max_pages, args.max_depth, Path(tmp) / "out")
+            )
+    print(json.dumps(result))
+
+
+def run_one(server: FixtureServer, preset: str, strategy: str, args: argparse.Namespace) -> dict:
+    """조합 하나를 새 프로세스에서 실행하고 지표 계산"""
+    server.site.reset()
+    cmd = [
+        sys.executable,
+        __file__,
+        "--child", server.start_url,
+        "--preset", preset,
+        "--strategy", strategy,
+        "--max-pages", str(args.pages),
+        "--max-depth", str(server.site.depth()),
+    ]
+    if args.verbose:
+        cmd.append("--verbose")
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{preset}/{strategy} crawl failed (exit code {proc.returncode})")
+
+    child = json.loads(proc.stdout.strip().splitlines()[-1])
+    latencies = [
+        done - server.site.requested_at[path]
+        for path, done in child["saved_at"].items()
+        if path in server.site.requested_at
+    ]
+    return {
+        "preset": preset,
+        "strategy": strategy,
+        "pages": child["pages"],
+        "requests": server.site.requests,
+        "elapsed": child["elapsed"],
+        "pages_per_sec": child["pages"] / child["elapsed"] if child["elapsed"] else 0.0,
+        "p50_latency": percentile(latencies, 50),
+        "p95_latency": percentile(latencies, 95),
+        "rss_self": child["rss_self"],
+        "rss_children": child["rss_children"],
+        "bytes_written": child["bytes_written"],
+    }
+
+
+def check_baseline(rows: list[dict], baseline_path: Path, tolerance: float) -> list[str]:
+    """기준 결과보다 pages/s가 tolerance 이상 떨어진 조합"""
+    baseline = {(r["preset"], r["strategy"]): r for r in json.loads(baseline_path.read_text())["results"]}
+    regressions = []
+    for row in rows:
+        base = baseline.get((row["preset"], row["strategy"]))
+        if base is None or not base["pages_per_sec"]:
+            continue
+        change = row["pages_per_sec"] / base["pages_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append(
+                f"{row['preset']}/{row['strategy']}: {base['pages_per_sec']:.1f} -> {row['pages_per_sec']:.1f} pages/s ({change:+.0%})"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100, help="fixture 사이트 페이지 수 (= max_pages)")
+    parser.add_argument("--fanout", type=int, default=5, help="페이지당 하위 페이지 링크 수")
+    parser.add_argument("--page-bytes", type=int, default=8_000, help="페이지 본문 크기 (바이트)")
+    parser.add_argument("--js-ratio", type=float, default=0.1, help="스크립트로 본문을 그리는 페이지 비율")
+    parser.add_argument("--latency", type=float, default=0.0, help="fixture 서버 응답 지연 (초)")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help="쉼표로 구분한 전략 목록")
+    parser.add_argument("--presets", default=",".join(PRESETS), help="쉼표로 구분한 브라우저 프리셋 목록")
+    parser.add_argument("--json", type=Path, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", type=Path, help="비교할 이전 --json 결과")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용하는 pages/s 하락 비율")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그를 stderr로 출력")
+    # 내부용: 자식 프로세스 모드
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--preset", help=argparse.SUPPRESS)
+    parser.add_argument("--strategy", help=argparse.SUPPRESS)
+    parser.add_argument("--max-pages", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--max-depth", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    strategies = [s for s in args.strategies.split(",") if s]
+    presets = [p for p in args.presets.split(",") if p]
+    unknown = [s for s in strategies if s not in STRATEGIES] + [p for p in presets if p not in PRESETS]
+    if unknown:
+        print(f"Unknown strategy/preset: {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(2)
+
+    site = FixtureSite(
+        pages=args.pages,
+        fanout=args.fanout,
+        page_bytes=args.page_bytes,
+        js_ratio=args.js_ratio,
+        latency=args.latency,
+    )
+    print(
+        f"fixture: {args.pages} pages, fanout {args.fanout}, ~{args.page_bytes:,} B/page, "
+        f"js {args.js_ratio:.0%}, depth {site.depth()}"
+    )
+
+    rows = []
+    with FixtureServer(site) as server:
+        for preset in presets:
+            for strategy in strategies:
+                rows.append(run_one(server, preset, strategy, args))
+
+    mb = 1024 * 1024
+    print(
+        f"\n{'preset':<8} {'strategy':<11} {'pages':>5} {'pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'rss py MB':>9} {'rss br MB':>9} {'written MB':>10}"
+    )
+    for r in rows:
+        print(
+            f"{r['preset']:<8} {r['strategy']:<11} {r['pages']:>5} {r['pages_per_sec']:>8.1f} "
+            f"{r['p50_latency'] * 1000:>8.0f} {r['p95_latency'] * 1000:>8.0f} "
+            f"{r['rss_self'] / mb:>9.0f} {r['rss_children'] / mb:>9.0f} {r['bytes_written'] / mb:>10.2f}"
+        )
+
+    if args.json:
+        fixture = {k: getattr(site, k) for k in ("pages", "fanout", "page_bytes", "js_ratio", "latency")}
+        args.json.write_text(json.dumps({"fixture": fixture, "results": rows}, indent=2))
+        print(f"\nSaved to {args.json}")
+
+    if args.baseline:
+        regressions = check_baseline(rows, args.baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ pages/s regressed by more than {args.tolerance:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n✅ No regression beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
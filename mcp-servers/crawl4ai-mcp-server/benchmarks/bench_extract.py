@@ -0,0 +1,159 @@
+"""Benchmark for extract_main_content (lxml) against the BeautifulSoup version.
+
+HTML 파일(또는 디렉토리)을 넘기면 그 페이지들로, 생략하면 fixture_site.py의
+합성 문서 페이지를 크기별로 만들어서 측정한다. 먼저 두 구현의 결과 텍스트가
+같은지(공백 정규화 후) 확인한 뒤, 구현마다 새 프로세스에서 시간과 peak RSS를 잰다.
+lxml은 C 메모리를 쓰므로 tracemalloc 대신 프로세스 peak RSS 증가분을 비교한다.
+
+Run with:
+    uv run python benchmarks/bench_extract.py
+    uv run python benchmarks/bench_extract.py --sizes 100000,1000000,5000000 --repeat 5
+    uv run python benchmarks/bench_extract.py saved_pages/
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_site import FixtureSite
+
+IMPLEMENTATIONS = ("bs4", "lxml")
+
+
+def legacy_extract_main_content(html: str) -> str:
+    """lxml 이전 구현 (비교 기준)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(["nav", "header", "footer", "aside"]):
+        tag.decompose()
+    return str(soup)
+
+
+def _extract(name: str):
+    if name == "bs4":
+        return legacy_extract_main_content
+
+    from crawl4ai_mcp_server.strategies.content import extract_main_content
+
+    return extract_main_content
+
+
+def _text(html: str) -> str:
+    """비교용 텍스트 (태그 제거, 공백 정규화)"""
+    import lxml.html
+
+    if not html.strip():
+        return ""
+    return " ".join(lxml.html.fromstring(html).text_content().split())
+
+
+def synthetic_pages(sizes: list[int]) -> list[tuple[str, str]]:
+    """크기별 합성 문서 페이지 (nav/footer 포함)"""
+    pages = []
+    for size in sizes:
+        site = FixtureSite(pages=50, page_bytes=size)
+        pages.append((f"synthetic-{size // 1000}k", site.page_html(7)))
+    return pages
+
+
+def load_pages(paths: list[Path]) -> list[tuple[str, str]]:
+    files = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.htm*")) if path.is_dir() else [path])
+    return [(str(f), f.read_text(encoding="utf-8", errors="replace")) for f in files]
+
+
+def _peak_rss() -> int:
+    """현재 프로세스의 peak RSS (바이트)
+
+    Linux에서는 /proc의 VmHWM을 쓴다. ru_maxrss는 fork 때 부모의 값을 이어받아서
+    검증 단계에서 커진 부모의 peak가 자식 측정에 섞인다.
+    """
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    # macOS는 바이트, 그 외는 KB 단위
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def run_child(args: argparse.Namespace) -> None:
+    """자식 프로세스: 한 구현으로 모든 페이지를 처리하고 결과 JSON을 출력"""
+    pages = json.loads(Path(args.child).read_text(encoding="utf-8"))
+    extract = _extract(args.impl)
+    extract("<div><nav>warm</nav><p>up</p></div>")
+
+    baseline = _peak_rss()
+    rows = []
+    for name, html in pages:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            extract(html)
+            times.append(time.perf_counter() - start)
+        rows.append({"page": name, "bytes": len(html.encode("utf-8")), "median": statistics.median(times)})
+
+    print(json.dumps({"rows": rows, "peak_rss": _peak_rss() - baseline}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", type=Path, help="HTML 파일 또는 디렉토리 (생략하면 합성 페이지)")
+    parser.add_argument("--sizes", default="100000,1000000,4000000", help="합성 페이지 본문 크기 (바이트, 쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3, help="페이지당 반복 횟수 (중앙값 사용)")
+    # 내부용: 자식 프로세스 모드
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--impl", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    pages = load_pages(args.paths) if args.paths else synthetic_pages([int(s) for s in args.sizes.split(",") if s])
+    if not pages:
+        print("No HTML pages found", file=sys.stderr)
+        sys.exit(1)
+
+    # 결과 텍스트가 같은지 먼저 확인
+    new_extract = _extract("lxml")
+    for name, html in pages:
+        if _text(new_extract(html)) != _text(legacy_extract_main_content(html)):
+            print(f"❌ Output text differs: {name}", file=sys.stderr)
+            sys.exit(1)
+    print(f"✅ Same text output for {len(pages)} pages")
+
+    results = {}
+    with tempfile.NamedTemporaryFile("w", suffix=".json", encoding="utf-8") as f:
+        json.dump(pages, f)
+        f.flush()
+        for impl in IMPLEMENTATIONS:
+            cmd = [sys.executable, __file__, "--child", f.name, "--impl", impl, "--repeat", str(args.repeat)]
+            proc = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True)
+            results[impl] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    mb = 1024 * 1024
+    print(f"\n{'page':<24} {'size KB':>8} {'bs4 ms':>9} {'lxml ms':>9} {'speedup':>8}")
+    for old, new in zip(results["bs4"]["rows"], results["lxml"]["rows"]):
+        speedup = old["median"] / new["median"] if new["median"] else float("inf")
+        print(
+            f"{Path(old['page']).name[:24]:<24} {old['bytes'] / 1024:>8.0f} "
+            f"{old['median'] * 1000:>9.1f} {new['median'] * 1000:>9.1f} {speedup:>7.1f}x"
+        )
+    print(
+        f"\npeak RSS growth: bs4 {results['bs4']['peak_rss'] / mb:.1f} MB, "
+        f"lxml {results['lxml']['peak_rss'] / mb:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Synthetic documentation site served from a local HTTP server.
+
+벤치마크용 가짜 문서 사이트. 페이지는 요청 시 결정적으로 생성되며
+(같은 인자면 항상 같은 HTML), 네트워크 없이 크롤러 처리량을 잴 수 있다.
+
+- 페이지 i의 하위 페이지는 i * fanout + 1 ... i * fanout + fanout (트리 구조)
+- 모든 페이지에 사이드바/푸터 링크(홈, 부모, 섹션 첫 페이지)가 있어 중복 링크가 생긴다
+- js_ratio 비율의 페이지는 빈 <div id="root">에 스크립트로 본문과 링크를 채운다
+- /robots.txt, /sitemap.xml도 제공한다
+
+Run standalone:
+    uv run python benchmarks/fixture_site.py --pages 200 --port 8765
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SECTIONS = ("guide", "api", "reference", "tutorial", "blog", "changelog", "community", "pricing")
+
+_WORDS = (
+    "request response token parameter string integer returns optional crawler page browser "
+    "markdown session config header cache timeout selector element schema client server"
+).split()
+
+_PAGE_RE = re.compile(r"^/docs/[a-z]+/page-(\d+)\.html$")
+
+
+@dataclass
+class FixtureSite:
+    """합성 문서 사이트 설정과 요청 기록
+
+    Args:
+        pages: 전체 페이지 수
+        fanout: 페이지당 하위 페이지 링크 수
+        page_bytes: 페이지 본문 목표 크기 (바이트, 사이드바/푸터 제외)
+        js_ratio: 스크립트로 본문을 그리는 페이지 비율 (0~1)
+        latency: 응답 전 지연 (초, 원격 서버 흉내)
+        seed: 본문 생성 시드
+    """
+
+    pages: int = 200
+    fanout: int = 5
+    page_bytes: int = 8_000
+    js_ratio: float = 0.0
+    latency: float = 0.0
+    seed: int = 0
+    # 경로 -> 첫 요청 시각 (time.time, 다른 프로세스의 완료 시각과 비교하므로 wall clock)
+    requested_at: dict[str, float] = field(default_factory=dict)
+    requests: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def path(self, i: int) -> str:
+        return f"/docs/{SECTIONS[i % len(SECTIONS)]}/page-{i}.html"
+
+    def depth(self) -> int:
+        """모든 페이지에 닿는 데 필요한 최대 깊이"""
+        depth, last, width = 0, 0, 1
+        while last < self.pages - 1:
+            width *= self.fanout
+            last += width
+            depth += 1
+        return depth
+
+    def is_js(self, i: int) -> bool:
+        return i > 0 and random.Random(self.seed * 1_000_003 + i).random() < self.js_ratio
+
+    def children(self, i: int) -> list[int]:
+        first = i * self.fanout + 1
+        return [c for c in range(first, first + self.fanout) if c < self.pages]
+
+    def body_html(self, i: int) -> str:
+        """본문 HTML (heading, 문단, 코드 블록, 하위 페이지 링크)"""
+        rng = random.Random(self.seed * 1_000_003 + i)
+        section = SECTIONS[i % len(SECTIONS)]
+        parts = [f"<h1>{section.title()} page {i}</h1>"]
+        size = 0
+        n = 0
+        while size < self.page_bytes:
+            if n % 6 == 0:
+                parts.append(f"<h2>Section {n // 6}</h2>")
+            if n % 9 == 8:
+                code = "\n".join(f"client.{rng.choice(_WORDS)}({rng.randint(0, 99)})" for _ in range(6))
+                parts.append(f"<pre><code>{code}</code></pre>")
+            else:
+                parts.append("<p>" + " ".join(rng.choice(_WORDS) for _ in range(40)) + "</p>")
+            size += len(parts[-1])
+            n += 1
+
+        links = "".join(f'<li><a href="{self.path(c)}">Child page {c}</a></li>' for c in self.children(i))
+        if links:
+            parts.append(f"<h2>Next steps</h2><ul>{links}</ul>")
+        return "\n".join(parts)
+
+    def page_html(self, i: int) -> str:
+        parent = (i - 1) // self.fanout if i else 0
+        nav = (
+            '<nav><ul><li><a href="/docs/guide/page-0.html">Home</a></li>'
+            f'<li><a href="{self.path(parent)}">Up</a></li>'
+            + "".join(f'<li><a href="{self.path(s)}">{SECTIONS[s].title()}</a></li>' for s in range(min(len(SECTIONS), self.pages)))
+            + "</ul></nav>"
+        )
+        footer = f'<footer><p>Was this page helpful?</p><a href="{self.path(0)}">Community Forum</a></footer>'
+
+        if self.is_js(i):
+            # 본문이 스크립트 실행 후에만 나타나는 페이지 (HTTP 단계에서는 js_shell로 판정됨)
+            main = (
+                '<div id="root"></div>'
+                f"<script>document.getElementById('root').innerHTML = {json.dumps('<main>' + self.body_html(i) + '</main>')};</script>"
+            )
+        else:
+            main = f"<main>{self.body_html(i)}</main>"
+
+        return (
+            "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<title>Page {i}</title></head><body>{nav}{main}{footer}</body></html>"
+        )
+
+    def sitemap_xml(self) -> str:
+        urls = "".join(f"<url><loc>{{base}}{self.path(i)}</loc></url>" for i in range(self.pages))
+        return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.requested_at.clear()
+
+    def record(self, path: str) -> None:
+        with self._lock:
+            self.requests += 1
+            self.requested_at.setdefault(path, time.time())
+
+
+def _handler(site: FixtureSite):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            site.record(path)
+            if site.latency:
+                time.sleep(site.latency)
+
+            base = f"http://{self.headers.get('Host', 'localhost')}"
+            match = _PAGE_RE.match(path)
+            if match and int(match.group(1)) < site.pages:
+                self._send(200, "text/html; charset=utf-8", site.page_html(int(match.group(1))))
+            elif path == "/":
+                self.send_response(302)
+                self.send_header("Location", site.path(0))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            elif path == "/robots.txt":
+                self._send(200, "text/plain", f"User-agent: *\nAllow: /\nSitemap: {base}/sitemap.xml\n")
+            elif path == "/sitemap.xml":
+                self._send(200, "application/xml", site.sitemap_xml().replace("{base}", base))
+            else:
+                self._send(404, "text/plain", "not found")
+
+        def _send(self, status: int, content_type: str, body: str):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+class FixtureServer:
+    """FixtureSite를 백그라운드 스레드의 HTTP 서버로 제공 (with 블록 동안)"""
+
+    def __init__(self, site: FixtureSite, host: str = "127.0.0.1", port: int = 0):
+        self.site = site
+        self._server = ThreadingHTTPServer((host, port), _handler(site))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def start_url(self) -> str:
+        return self.base_url + self.site.path(0)
+
+    def __enter__(self) -> "FixtureServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--page-bytes", type=int, default=8_000)
+    parser.add_argument("--js-ratio", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    site = FixtureSite(pages=args.pages, fanout=args.fanout, page_bytes=args.page_bytes, js_ratio=args.js_ratio)
+    with FixtureServer(site, port=args.port) as server:
+        print(f"Serving {args.pages} pages at {server.start_url} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Concurrent multi-site crawling under shared resource limits."""
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+from .core import DEFAULT_BROWSER_CONFIG, count_statuses, crawl_documentation
+from .strategies.politeness import HostScheduler
+from .strategies.timing import StageTimings
+from .utils.domain import extract_domain, extract_output_dir_name
+from .utils.fs import write_json_atomic
+from .utils.memory import process_tree_rss
+
+STRATEGIES = ("bfs", "dfs", "best_first", "sitemap")
+
+# 기본 리포트 파일명 (현재 디렉토리)
+BATCH_REPORT_FILENAME = "crawl-batch-report.json"
+
+# 리포트의 peak 메모리 측정 간격 (초)
+MEMORY_SAMPLE_INTERVAL = 1.0
+
+
+@dataclass
+class BatchJob:
+    """crawl-batch의 사이트 하나
+
+    Args:
+        start_url: 크롤링 시작 URL
+        prefix: URL 프리픽스 필터
+        depth: 최대 크롤링 깊이
+        max_pages: 최대 크롤링 페이지 수
+        strategy: bfs / dfs / best_first / sitemap
+        output_dir: 출력 디렉토리 (None이면 도메인명)
+        incremental: 변경된 페이지만 다시 저장
+    """
+
+    start_url: str
+    prefix: str | None = None
+    depth: int = 2
+    max_pages: int = 100
+    strategy: str = "bfs"
+    output_dir: str | None = None
+    incremental: bool = False
+
+    @property
+    def resolved_output_dir(self) -> str:
+        return self.output_dir or extract_output_dir_name(extract_domain(self.start_url))
+
+
+def load_batch_jobs(path: Path) -> list[BatchJob]:
+    """작업 목록 파일(JSON 또는 YAML) 읽기
+
+    최상위가 작업 리스트이거나 {"jobs": [...]} 형태. 각 작업은 BatchJob 필드
+    (start_url 필수, prefix, depth, max_pages, strategy, output_dir, incremental)를 가진다.
+
+    Raises:
+        ValueError: 형식이 잘못됐거나 출력 디렉토리가 겹침
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: {e}") from e
+    else:
+        data = json.loads(text)
+
+    if isinstance(data, dict):
+        data = data.get("jobs")
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"{path}: expected a non-empty list of jobs (or {{'jobs': [...]}})")
+
+    known = {f.name for f in fields(BatchJob)}
+    jobs = []
+    for i, entry in enumerate(data, 1):
+        if not isinstance(entry, dict) or not entry.get("start_url"):
+            raise ValueError(f"{path}: job {i} needs a start_url")
+        unknown = set(entry) - known
+        if unknown:
+            raise ValueError(f"{path}: job {i} has unknown keys: {', '.join(sorted(unknown))}")
+        job = BatchJob(**entry)
+        if job.strategy not in STRATEGIES:
+            raise ValueError(f"{path}: job {i} has unknown strategy {job.strategy!r} ({', '.join(STRATEGIES)})")
+        if not isinstance(job.depth, int) or not isinstance(job.max_pages, int) or job.depth < 0 or job.max_pages < 1:
+            raise ValueError(f"{path}: job {i} needs depth >= 0 and max_pages >= 1")
+        jobs.append(job)
+
+    # 같은 디렉토리에 쓰면 매니페스트/체크포인트가 섞임
+    seen: dict[str, str] = {}
+    for job in jobs:
+        output_dir = job.resolved_output_dir
+        if output_dir in seen:
+            raise ValueError(
+                f"{path}: {job.start_url} and {seen[output_dir]} both write to {output_dir}/ (set output_dir)"
+            )
+        seen[output_dir] = job.start_url
+
+    return jobs
+
+
+async def _run_job(job: BatchJob, crawler: AsyncWebCrawler, scheduler: HostScheduler, slots: asyncio.Semaphore) -> dict:
+    """작업 하나 실행 (실패해도 예외 대신 리포트 항목으로 반환)"""
+    async with slots:
+        print(f"\n▶ {job.start_url} -> {job.resolved_output_dir}/")
+        timings = StageTimings()
+        start = time.perf_counter()
+        entry = {**asdict(job), "output_dir": job.resolved_output_dir}
+        try:
+            results = await crawl_documentation(
+                job.start_url,
+                job.resolved_output_dir,
+                max_pages=job.max_pages,
+                max_depth=job.depth,
+                url_prefix=job.prefix,
+                strategy=job.strategy,
+                crawler=crawler,
+                incremental=job.incremental,
+                scheduler=scheduler,
+                stage_timings=timings,
+            )
+        except Exception as e:
+            print(f"❌ {job.start_url} failed: {e}")
+            return {**entry, "status": "failed", "error": str(e), "elapsed_s": round(time.perf_counter() - start, 2)}
+
+        stages = {
+            stage: {k: v for k, v in stats.items() if k != "histogram"}
+            for stage, stats in timings.report()["stages"].items()
+            if stats["count"]
+        }
+        return {
+            **entry,
+            "status": "ok",
+            "pages": len([r for r in results if r["status"] != "removed"]),
+            "statuses": count_statuses(results),
+            "elapsed_s": round(time.perf_counter() - start, 2),
+            "stages": stages,
+        }
+
+
+async def crawl_batch(
+    jobs: list[BatchJob],
+    max_jobs: int = 4,
+    max_contexts: int = 8,
+    max_per_host: int = 2,
+    max_memory_mb: int | None = None,
+    min_delay: float = 0.0,
+    respect_crawl_delay: bool = False,
+    browser_config: BrowserConfig = None,
+    report_path: Path | None = None,
+) -> dict:
+    """여러 사이트를 하나의 브라우저와 공유 제한 아래에서 동시에 Deep Crawl
+
+    - 브라우저는 하나만 띄우고 모든 작업이 공유한다 (사이트마다 브라우저를 띄우지 않음)
+    - max_jobs: 동시에 진행하는 사이트 수
+    - max_contexts: 모든 사이트를 합쳐 동시에 여는 페이지 수 (공유 HostScheduler의 전체 제한)
+    - max_per_host: 호스트당 동시 요청 수 (여러 작업이 같은 호스트를 크롤링해도 함께 적용)
+    - max_memory_mb: 이 프로세스와 브라우저의 RSS 합이 넘으면 새 요청을 잠시 멈춤
+
+    한 작업이 실패해도 나머지는 계속 진행하고, 실패는 리포트에 기록된다.
+
+    Args:
+        jobs: 크롤링할 사이트 목록 (load_batch_jobs)
+        max_jobs: 동시에 진행하는 최대 작업 수
+        max_contexts: 전체 동시 요청(페이지) 수
+        max_per_host: 호스트당 동시 요청 수
+        max_memory_mb: 메모리 상한 (MB, None이면 제한 없음)
+        min_delay: 호스트당 요청 간 최소 간격 (초)
+        respect_crawl_delay: robots.txt Crawl-delay 준수
+        browser_config: 브라우저 설정 (None이면 기본 설정)
+        report_path: 합친 리포트를 저장할 경로 (None이면 저장 안 함)
+
+    Returns:
+        합친 리포트 dict (totals, limits, peak_memory_mb, jobs)
+
+    Raises:
+        ValueError: 제한 값이 잘못됨
+    """
+    if max_jobs < 1 or max_contexts < 1 or max_per_host < 1:
+        raise ValueError(f"max_jobs, max_contexts and max_per_host must be >= 1 (got {max_jobs}, {max_contexts}, {max_per_host})")
+    if max_memory_mb is not None and max_memory_mb <= 0:
+        raise ValueError(f"max_memory_mb must be positive (got {max_memory_mb})")
+
+    scheduler = HostScheduler(
+        max_per_host=max_per_host,
+        min_delay=min_delay,
+        respect_crawl_delay=respect_crawl_delay,
+        max_concurrency=max_contexts,
+        max_memory_mb=max_memory_mb,
+    )
+    slots = asyncio.Semaphore(max_jobs)
+    peak_memory = 0
+
+    async def sample_memory() -> None:
+        nonlocal peak_memory
+        while True:
+            peak_memory = max(peak_memory, await asyncio.to_thread(process_tree_rss))
+            await asyncio.sleep(MEMORY_SAMPLE_INTERVAL)
+
+    start = time.perf_counter()
+    async with AsyncWebCrawler(config=browser_config or DEFAULT_BROWSER_CONFIG) as crawler:
+        sampler = asyncio.create_task(sample_memory())
+        try:
+            entries = await asyncio.gather(*(_run_job(job, crawler, scheduler, slots) for job in jobs))
+        finally:
+            sampler.cancel()
+
+    ok = [e for e in entries if e["status"] == "ok"]
+    statuses = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+    for e in ok:
+        for status, n in e["statuses"].items():
+            statuses[status] += n
+
+    report = {
+        "elapsed_s": round(time.perf_counter() - start, 2),
+        "limits": {
+            "max_jobs": max_jobs,
+            "max_contexts": max_contexts,
+            "max_per_host": max_per_host,
+            "max_memory_mb": max_memory_mb,
+        },
+        "peak_memory_mb": round(peak_memory / 1024 / 1024, 1),
+        "memory_waits": scheduler.memory_waits,
+        "totals": {
+            "jobs": len(entries),
+            "succeeded": len(ok),
+            "failed": len(entries) - len(ok),
+            "pages": sum(e["pages"] for e in ok),
+            "statuses": statuses,
+        },
+        "jobs": entries,
+    }
+    if report_path is not None:
+        write_json_atomic(Path(report_path), report)
+    return report
+
+
+def format_batch_report(report: dict) -> str:
+    """작업별 한 줄 요약 표"""
+    lines = [f"{'status':<7} {'pages':>6} {'time s':>8}  site"]
+    for e in report["jobs"]:
+        pages = e.get("pages", "-")
+        lines.append(f"{e['status']:<7} {pages:>6} {e['elapsed_s']:>8.1f}  {e['start_url']} -> {e['output_dir']}/")
+        if e["status"] == "failed":
+            lines.append(f"{'':<24}{e['error']}")
+    totals = report["totals"]
+    lines.append(
+        f"\n{totals['succeeded']}/{totals['jobs']} sites, {totals['pages']} pages in {report['elapsed_s']:.1f} s "
+        f"(peak memory {report['peak_memory_mb']:.0f} MB)"
+    )
+    return "\n".join(lines)
@@ -1,10 +1,21 @@
 """CLI interface for the crawler."""
 
 import asyncio
+import json
+from pathlib import Path
 
 import typer
 
+from .batch import BATCH_REPORT_FILENAME, crawl_batch, format_batch_report, load_batch_jobs
+from .configs.browser import FAST_CONFIG, STEALTH_CONFIG
 from .core import crawl_documentation, crawl_single_page
+from .storage.packed import OUTPUT_FORMATS
+from .storage.search_index import search_pages
+from .strategies.chunking import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_TOKENS
+from .strategies.parallel import DEFAULT_CLEAN_BATCH
+from .strategies.content import check_footer_patterns
+from .strategies.rule_packs import list_rule_packs
+from .strategies.timing import StageTimings
 
 app = typer.Typer(help="공식문서 크롤러 - 웹사이트를 크롤링하여 디렉토리 구조로 저장")
 
@@ -17,7 +28,29 @@ def crawl(
     max_pages: int = typer.Option(100, "--max-pages", "-p", help="최대 크롤링 페이지 수 (--recursive 사용 시)"),
     max_depth: int = typer.Option(2, "--max-depth", "-d", help="최대 크롤링 깊이 (--recursive 사용 시)"),
     prefix: str = typer.Option(None, "--prefix", "-px", help="URL 프리픽스 필터 (--recursive 사용 시, 지정 시 해당 프리픽스로 시작하는 URL만 크롤링)"),
-    strategy: str = typer.Option("bfs", "--strategy", "-s", help="크롤링 전략: bfs (너비 우선) 또는 dfs (깊이 우선)"),
+    strategy: str = typer.Option("bfs", "--strategy", "-s", help="크롤링 전략: bfs (너비 우선), dfs (깊이 우선), best_first (키워드 관련도 우선), sitemap (사이트맵 URL만)"),
+    incremental: bool = typer.Option(False, "--incremental", "-i", help="증분 크롤링: 변경된 페이지만 다시 저장 (--recursive 사용 시)"),
+    resume: bool = typer.Option(False, "--resume", help="중단된 크롤링을 체크포인트에서 이어서 진행 (--recursive 사용 시)"),
+    max_per_host: int = typer.Option(None, "--max-per-host", help="호스트당 최대 동시 요청 수 (--recursive 사용 시)"),
+    min_delay: float = typer.Option(None, "--min-delay", help="호스트당 요청 간 최소 간격(초) (--recursive 사용 시)"),
+    respect_crawl_delay: bool = typer.Option(False, "--respect-crawl-delay", help="robots.txt Crawl-delay 준수 (--recursive 사용 시)"),
+    footer_pattern: list[str] = typer.Option(None, "--footer-pattern", "-fp", help="사이트별 푸터 정규식 (여러 번 지정 가능, 기본: 룰 팩 패턴)"),
+    rule_pack: str = typer.Option(None, "--rule-pack", "-rp", help="컨텐츠 정리 룰 팩 (기본: 도메인으로 자동 선택)"),
+    dedupe: bool = typer.Option(False, "--dedupe", help="여러 페이지에 반복되는 블록 제거 (--recursive 사용 시)"),
+    dedupe_threshold: float = typer.Option(0.5, "--dedupe-threshold", help="반복 블록 판정 비율 0~1 (--dedupe 사용 시)"),
+    content_store: bool = typer.Option(False, "--content-store", help="같은 내용의 페이지를 한 번만 저장하고 링크로 연결 (--recursive 사용 시)"),
+    keyword: list[str] = typer.Option(None, "--keyword", "-k", help="best_first 전략의 우선순위 키워드 (여러 번 지정 가능, 기본: 문서 키워드)"),
+    score_threshold: float = typer.Option(0.0, "--score-threshold", help="best_first 전략에서 이 점수(키워드 비율 0~1) 미만인 링크는 크롤링 안 함"),
+    output_format: str = typer.Option("markdown", "--output-format", "-f", help="저장 형식: markdown (URL별 .md), jsonl, jsonl.zst, parquet (단일 파일, --recursive 사용 시)"),
+    index: bool = typer.Option(False, "--index", help="크롤링 후 전문 검색 인덱스 갱신 (search 명령용, --recursive 사용 시)"),
+    chunks: bool = typer.Option(False, "--chunks", help="heading 기준 검색용 청크를 chunks.jsonl에 기록 (--recursive 사용 시)"),
+    chunk_tokens: int = typer.Option(DEFAULT_CHUNK_TOKENS, "--chunk-tokens", help="청크 목표 크기 (토큰 추정치, --chunks 사용 시)"),
+    chunk_overlap: int = typer.Option(DEFAULT_CHUNK_OVERLAP, "--chunk-overlap", help="이어지는 청크 간 겹치는 최대 토큰 수 (--chunks 사용 시)"),
+    timings: bool = typer.Option(False, "--timings", help="크롤링 후 단계별 시간(fetch/scrape/clean/write) 리포트를 JSON으로 출력 (--recursive 사용 시)"),
+    clean_workers: int = typer.Option(0, "--clean-workers", help="정리/청크 분할을 실행할 워커 프로세스 수 (0: writer 스레드에서 실행, --recursive 사용 시)"),
+    clean_batch: int = typer.Option(DEFAULT_CLEAN_BATCH, "--clean-batch", help="워커 프로세스에 한 번에 넘기는 최대 페이지 수 (--clean-workers 사용 시)"),
+    lowercase_paths: bool = typer.Option(False, "--lowercase-paths", help="URL 경로 대소문자 무시: 경로를 소문자로 정규화해 /Foo와 /foo를 한 번만 크롤링 (대소문자를 구분하지 않는 사이트용, --recursive 사용 시)"),
+    browser_only: bool = typer.Option(False, "--browser-only", help="HTTP 단계 없이 항상 브라우저로 크롤링 (단일 페이지 모드)"),
 ):
     """웹사이트 크롤링 실행"""
     # 유효성 검사: --prefix는 --recursive와 함께만 사용 가능
@@ -30,21 +63,236 @@ def crawl(
         typer.echo("❌ Error: --strategy 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
         raise typer.Exit(code=1)
 
-    if strategy not in ("bfs", "dfs"):
-        typer.echo(f"❌ Error: 지원하지 않는 전략입니다: {strategy} (bfs 또는 dfs)", err=True)
+    # 유효성 검사: --incremental은 --recursive와 함께만 사용 가능
+    if incremental and not recursive:
+        typer.echo("❌ Error: --incremental 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --resume은 --recursive와 함께만 사용 가능
+    if resume and not recursive:
+        typer.echo("❌ Error: --resume 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: 속도 조절 옵션은 --recursive와 함께만 사용 가능
+    if (max_per_host or min_delay or respect_crawl_delay) and not recursive:
+        typer.echo("❌ Error: 속도 조절 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --dedupe는 --recursive와 함께만 사용 가능
+    if dedupe and not recursive:
+        typer.echo("❌ Error: --dedupe 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --content-store는 --recursive와 함께만 사용 가능
+    if content_store and not recursive:
+        typer.echo("❌ Error: --content-store 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --output-format은 --recursive와 함께만 사용 가능
+    if output_format != "markdown" and not recursive:
+        typer.echo("❌ Error: --output-format 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if output_format not in OUTPUT_FORMATS:
+        typer.echo(f"❌ Error: 지원하지 않는 저장 형식입니다: {output_format} ({', '.join(OUTPUT_FORMATS)})", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: 단일 파일 형식은 .md 파일을 다루는 옵션과 함께 사용 불가
+    # 유효성 검사: --index는 --recursive와 함께만 사용 가능
+    if index and not recursive:
+        typer.echo("❌ Error: --index 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --chunks는 --recursive와 함께만 사용 가능
+    if chunks and not recursive:
+        typer.echo("❌ Error: --chunks 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --timings는 --recursive와 함께만 사용 가능
+    if timings and not recursive:
+        typer.echo("❌ Error: --timings 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --clean-workers는 --recursive와 함께만 사용 가능
+    if clean_workers and not recursive:
+        typer.echo("❌ Error: --clean-workers 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --lowercase-paths는 --recursive와 함께만 사용 가능
+    if lowercase_paths and not recursive:
+        typer.echo("❌ Error: --lowercase-paths 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if clean_workers < 0 or clean_batch < 1:
+        typer.echo(f"❌ Error: --clean-workers는 0 이상, --clean-batch는 1 이상이어야 합니다: {clean_workers} / {clean_batch}", err=True)
+        raise typer.Exit(code=1)
+
+    if not 0 <= chunk_overlap < chunk_tokens:
+        typer.echo(f"❌ Error: --chunk-overlap은 0 이상 --chunk-tokens 미만이어야 합니다: {chunk_overlap} / {chunk_tokens}", err=True)
+        raise typer.Exit(code=1)
+
+    if output_format != "markdown" and (incremental or dedupe or content_store):
+        typer.echo("❌ Error: --incremental, --dedupe, --content-store는 --output-format markdown에서만 사용할 수 있습니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --keyword, --score-threshold는 best_first 전략에서만 사용 가능
+    if (keyword or score_threshold) and strategy != "best_first":
+        typer.echo("❌ Error: --keyword / --score-threshold 옵션은 --strategy best_first와 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if not 0 <= score_threshold <= 1:
+        typer.echo(f"❌ Error: --score-threshold는 0 이상 1 이하여야 합니다: {score_threshold}", err=True)
+        raise typer.Exit(code=1)
+
+    if not 0 < dedupe_threshold <= 1:
+        typer.echo(f"❌ Error: --dedupe-threshold는 0보다 크고 1 이하여야 합니다: {dedupe_threshold}", err=True)
+        raise typer.Exit(code=1)
+
+    if rule_pack and rule_pack not in list_rule_packs():
+        typer.echo(f"❌ Error: 알 수 없는 룰 팩입니다: {rule_pack} ({', '.join(list_rule_packs())})", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --footer-pattern은 정규식이어야 함
+    if footer_pattern:
+        try:
+            check_footer_patterns(footer_pattern)
+        except ValueError as e:
+            typer.echo(f"❌ Error: 잘못된 --footer-pattern입니다: {e}", err=True)
+            raise typer.Exit(code=1)
+
+    if strategy not in ("bfs", "dfs", "best_first", "sitemap"):
+        typer.echo(f"❌ Error: 지원하지 않는 전략입니다: {strategy} (bfs, dfs, best_first 또는 sitemap)", err=True)
         raise typer.Exit(code=1)
 
     if recursive:
         # Deep Crawl 모드
-        asyncio.run(crawl_documentation(url, output_dir, max_pages, max_depth, prefix, strategy))
+        stage_timings = StageTimings()
+        asyncio.run(
+            crawl_documentation(
+                url,
+                output_dir,
+                max_pages,
+                max_depth,
+                prefix,
+                strategy,
+                incremental=incremental,
+                resume=resume,
+                max_per_host=max_per_host,
+                min_delay=min_delay,
+                respect_crawl_delay=respect_crawl_delay,
+                footer_patterns=footer_pattern,
+                rule_pack=rule_pack,
+                dedupe=dedupe,
+                dedupe_threshold=dedupe_threshold,
+                content_store=content_store,
+                keywords=keyword,
+                score_threshold=score_threshold,
+                output_format=output_format,
+                search_index=index,
+                chunks=chunks,
+                chunk_tokens=chunk_tokens,
+                chunk_overlap=chunk_overlap,
+                stage_timings=stage_timings,
+                clean_workers=clean_workers,
+                clean_batch=clean_batch,
+                lowercase_paths=lowercase_paths,
+            )
+        )
+        if timings:
+            typer.echo(json.dumps(stage_timings.report(), indent=2))
     else:
         # 단일 페이지 모드
-        markdown = asyncio.run(crawl_single_page(url, output_dir))
+        markdown = asyncio.run(
+            crawl_single_page(
+                url,
+                output_dir,
+                footer_patterns=footer_pattern,
+                rule_pack=rule_pack,
+                http_first=not browser_only,
+            )
+        )
         if not output_dir:
             # 출력 디렉토리가 없으면 마크다운 출력
             typer.echo("\n" + markdown)
 
 
+@app.command()
+def search(
+    query: str = typer.Argument(..., help="검색어"),
+    output_dir: str = typer.Option(..., "--output-dir", "-o", help="크롤링 결과 디렉토리"),
+    k: int = typer.Option(10, "--limit", "-n", help="최대 결과 수"),
+):
+    """크롤링한 문서에서 전문 검색 (인덱스가 없으면 먼저 생성)"""
+    if not Path(output_dir).is_dir():
+        typer.echo(f"❌ Error: 출력 디렉토리가 없습니다: {output_dir}", err=True)
+        raise typer.Exit(code=1)
+
+    if k < 1:
+        typer.echo(f"❌ Error: --limit은 1 이상이어야 합니다: {k}", err=True)
+        raise typer.Exit(code=1)
+
+    results = search_pages(Path(output_dir), query, k)
+    if not results:
+        typer.echo(f"검색 결과 없음: {query}")
+        return
+
+    for i, r in enumerate(results, 1):
+        typer.echo(f"{i}. {r['title']} — {r['url']}")
+        if r["file"]:
+            typer.echo(f"   {r['file']}")
+        typer.echo(f"   {r['snippet']}\n")
+
+
+@app.command("crawl-batch")
+def crawl_batch_command(
+    jobs_file: Path = typer.Argument(..., help="작업 목록 파일 (.json / .yaml, 항목: start_url, prefix, depth, max_pages, strategy, output_dir, incremental)"),
+    max_jobs: int = typer.Option(4, "--max-jobs", "-j", help="동시에 크롤링하는 최대 사이트 수"),
+    max_contexts: int = typer.Option(8, "--max-contexts", "-c", help="모든 사이트를 합쳐 동시에 여는 최대 페이지 수"),
+    max_per_host: int = typer.Option(2, "--max-per-host", help="호스트당 최대 동시 요청 수"),
+    max_memory_mb: int = typer.Option(None, "--max-memory-mb", help="크롤러 + 브라우저 메모리 상한 (MB, 넘으면 새 요청 대기)"),
+    min_delay: float = typer.Option(0.0, "--min-delay", help="호스트당 요청 간 최소 간격(초)"),
+    respect_crawl_delay: bool = typer.Option(False, "--respect-crawl-delay", help="robots.txt Crawl-delay 준수"),
+    stealth: bool = typer.Option(False, "--stealth", help="스텔스 브라우저 설정 사용"),
+    report: Path = typer.Option(Path(BATCH_REPORT_FILENAME), "--report", help="합친 리포트 JSON 경로"),
+):
+    """여러 사이트를 하나의 브라우저로 동시에 Deep Crawl (전체 페이지 수 / 메모리 / 호스트별 제한 공유)"""
+    if not jobs_file.is_file():
+        typer.echo(f"❌ Error: 작업 목록 파일이 없습니다: {jobs_file}", err=True)
+        raise typer.Exit(code=1)
+
+    if max_jobs < 1 or max_contexts < 1 or max_per_host < 1:
+        typer.echo("❌ Error: --max-jobs, --max-contexts, --max-per-host는 1 이상이어야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if max_memory_mb is not None and max_memory_mb <= 0:
+        typer.echo(f"❌ Error: --max-memory-mb는 0보다 커야 합니다: {max_memory_mb}", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        jobs = load_batch_jobs(jobs_file)
+    except ValueError as e:
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    result = asyncio.run(
+        crawl_batch(
+            jobs,
+            max_jobs=max_jobs,
+            max_contexts=max_contexts,
+            max_per_host=max_per_host,
+            max_memory_mb=max_memory_mb,
+            min_delay=min_delay,
+            respect_crawl_delay=respect_crawl_delay,
+            browser_config=STEALTH_CONFIG if stealth else FAST_CONFIG,
+            report_path=report,
+        )
+    )
+    typer.echo("\n" + format_batch_report(result))
+    typer.echo(f"📊 Report: {report}")
+    if result["totals"]["failed"]:
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def config_list():
     """사용 가능한 설정 프리셋 목록"""
@@ -61,6 +309,12 @@ def config_list():
     print("\n=== Deep Crawl Strategies ===")
     print("- bfs: 너비 우선 탐색 (기본값)")
     print("- dfs: 깊이 우선 탐색")
+    print("- best_first: URL 키워드 관련도 우선 탐색 (--keyword, --score-threshold)")
+    print("- sitemap: 사이트맵의 URL만 동시에 크롤링 (링크 탐색 없음)")
+
+    print("\n=== Rule Packs ===")
+    for name in list_rule_packs():
+        print(f"- {name}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 """Deep crawling strategy configurations."""
 
+from collections.abc import Awaitable, Callable
+from urllib.parse import urldefrag, urljoin
+
 from crawl4ai.deep_crawling import (
     BFSDeepCrawlStrategy,
     BestFirstCrawlingStrategy,
@@ -9,28 +12,187 @@ from crawl4ai.deep_crawling.filters import (
     ContentTypeFilter,
     DomainFilter,
     FilterChain,
-    URLPatternFilter,
+    URLFilter,
 )
 from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
+from crawl4ai.utils import normalize_url_for_deep_crawl
+
+from ..strategies.politeness import HostScheduler, PoliteCrawler
+from ..utils.url import canonical_prefix, canonicalize_url, extract_canonical_link, matches_prefix
+
+
+class CanonicalPrefixFilter(URLFilter):
+    """정규화된 URL이 프리픽스로 시작하는지 확인
+
+    호스트 대소문자, 기본 포트, 중복 슬래시 차이로 프리픽스 필터를 빠져나가지 않도록
+    URL과 프리픽스를 모두 canonicalize_url 형태로 비교한다.
+    lowercase_path면 경로 대소문자도 무시한다.
+    """
+
+    def __init__(self, prefix: str, lowercase_path: bool = False):
+        super().__init__()
+        self.lowercase_path = lowercase_path
+        self.prefix = canonical_prefix(prefix, lowercase_path)
+
+    def apply(self, url: str) -> bool:
+        passed = matches_prefix(url, self.prefix, self.lowercase_path)
+        self._update_stats(passed)
+        return passed
+
+
+class _CanonicalLinksMixin:
+    """canonicalize_url 기준으로 이미 본 페이지의 링크를 frontier에 넣지 않음
+
+    crawl4ai의 기본 정규화는 쿼리 순서, 기본 포트, index.html, 일부 추적 파라미터를
+    구분하므로 같은 페이지를 여러 번 받는다. 정규화한 URL은 중복 판정 키로만 쓰고
+    요청은 페이지에 있던 원래 링크로 한다 (index.html이나 트레일링 슬래시를 지운 URL은
+    리다이렉트나 404가 날 수 있음). 페이지의 <link rel="canonical">이 가리키는 URL도
+    방문한 것으로 처리한다. lowercase_path면 키의 경로를 소문자로 바꿔서 /Foo와 /foo를
+    같은 페이지로 본다 (대소문자를 구분하지 않는 서버용).
+    """
+
+    def __init__(self, *args, lowercase_path: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lowercase_path = lowercase_path
+        # 큐에 넣었거나 방문한 페이지의 정규화 키 (첫 link_discovery에서 visited로 채움)
+        self._canonical_seen: set[str] | None = None
+
+    def _canonical_key(self, url: str, base: str | None = None) -> str:
+        return canonicalize_url(url, base=base, lowercase_path=self.lowercase_path)
+
+    async def link_discovery(self, result, source_url, current_depth, visited, next_level, depths):
+        # DFS는 visited 대신 _dfs_seen으로 중복을 거름
+        seen = getattr(self, "_dfs_seen", visited)
+        if self._canonical_seen is None:
+            # 시작 URL과 resume으로 복원된 방문 집합
+            self._canonical_seen = {self._canonical_key(url) for url in seen}
+        self._canonical_seen.add(self._canonical_key(source_url))
+        if result.url:
+            self._canonical_seen.add(self._canonical_key(result.url))
+
+        canonical = extract_canonical_link(result.html, source_url, self.lowercase_path)
+        if canonical:
+            self._canonical_seen.add(canonical)
+
+        # 이미 본 페이지와 한 페이지 안의 중복 링크를 버림
+        # (crawl4ai가 큐에 넣는 정규화 URL -> 원래 링크, 키)
+        originals: dict[str, tuple[str, str]] = {}
+        page_keys: set[str] = set()
+        links = result.links or {}
+        for kind in ("internal", "external"):
+            if kind not in links:
+                continue
+            kept = []
+            for link in links[kind]:
+                href = link.get("href")
+                if not href:
+                    continue
+                key = self._canonical_key(href, source_url)
+                if key in self._canonical_seen or key in page_keys:
+                    continue
+                page_keys.add(key)
+                original = urldefrag(urljoin(source_url, href.strip())).url
+                originals[normalize_url_for_deep_crawl(href, source_url)] = (original, key)
+                kept.append(link)
+            links[kind] = kept
+
+        start = len(next_level)
+        await super().link_discovery(result, source_url, current_depth, visited, next_level, depths)
+
+        # 큐에 들어간 링크는 원래 URL로 요청하고 키를 본 것으로 기록. 방문 집합에도 원래 URL을
+        # 남겨야 체크포인트가 처리 완료 URL(요청한 URL)과 비교할 수 있음
+        for i in range(start, len(next_level)):
+            url, parent = next_level[i]
+            if url not in originals:
+                continue
+            original, key = originals[url]
+            self._canonical_seen.add(key)
+            if original != url:
+                next_level[i] = (original, parent)
+                depths[original] = depths.pop(url, current_depth + 1)
+                if url in seen:
+                    seen.discard(url)
+                    seen.add(original)
+
+
+class _DocsBFSStrategy(_CanonicalLinksMixin, BFSDeepCrawlStrategy):
+    pass
+
+
+class _DocsDFSStrategy(_CanonicalLinksMixin, DFSDeepCrawlStrategy):
+    pass
+
+
+class _DocsBestFirstStrategy(_CanonicalLinksMixin, BestFirstCrawlingStrategy):
+    """점수가 score_threshold 미만인 링크는 큐에 넣지 않는 Best-First 전략
+
+    crawl4ai의 Best-First는 점수가 낮은 링크도 큐에 쌓아 두었다가 방문하므로
+    max_pages 예산이 관련 없는 가지에 쓰인다. 임계값 미만 링크는 발견 시점에 버린다.
+    """
+
+    def __init__(self, *args, score_threshold: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.score_threshold = score_threshold
+
+    async def link_discovery(self, result, source_url, current_depth, visited, next_level, depths):
+        await super().link_discovery(result, source_url, current_depth, visited, next_level, depths)
+        if self.score_threshold <= 0 or self.url_scorer is None:
+            return
+
+        kept = [(url, parent) for url, parent in next_level if self.url_scorer.score(url) >= self.score_threshold]
+        self.stats.urls_skipped += len(next_level) - len(kept)
+        next_level[:] = kept
+
+
+class _HostScheduledMixin:
+    """전략이 사용하는 크롤러를 PoliteCrawler로 감싸 모든 요청이 HostScheduler를 거치게 함"""
+
+    def __init__(self, *args, scheduler: HostScheduler, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scheduler = scheduler
+
+    async def arun(self, start_url, crawler, config=None):
+        return await super().arun(start_url, PoliteCrawler(crawler, self.scheduler), config)
+
+
+class _ScheduledBFSStrategy(_HostScheduledMixin, _DocsBFSStrategy):
+    pass
+
+
+class _ScheduledDFSStrategy(_HostScheduledMixin, _DocsDFSStrategy):
+    pass
+
+
+class _ScheduledBestFirstStrategy(_HostScheduledMixin, _DocsBestFirstStrategy):
+    pass
+
+
+def _create_strategy(strategy_cls, scheduled_cls, scheduler: HostScheduler | None, **kwargs):
+    """scheduler가 있으면 스케줄링 버전의 전략 클래스로 생성"""
+    if scheduler is None:
+        return strategy_cls(**kwargs)
+    return scheduled_cls(scheduler=scheduler, **kwargs)
 
 
 def _build_filter_chain(
     domain: str,
     url_prefix: str = None,
+    lowercase_path: bool = False,
 ) -> FilterChain:
     """공통 필터 체인 생성
 
     Args:
         domain: 허용할 도메인
-        url_prefix: URL 프리픽스 필터
+        url_prefix: URL 프리픽스 필터 (정규화된 URL 기준으로 비교)
+        lowercase_path: 프리픽스를 경로 대소문자 구분 없이 비교
     """
     filters = [
-        DomainFilter(allowed_domains=[domain]),
+        DomainFilter(allowed_domains=[domain.lower()]),
         ContentTypeFilter(allowed_types=["text/html"]),
     ]
 
     if url_prefix:
-        filters.append(URLPatternFilter(patterns=[f"{url_prefix}*"], use_glob=True))
+        filters.append(CanonicalPrefixFilter(url_prefix, lowercase_path))
 
     return FilterChain(filters)
 
@@ -41,6 +203,10 @@ def create_bfs_strategy(
     max_pages: int = 100,
     include_external: bool = False,
     url_prefix: str = None,
+    resume_state: dict = None,
+    on_state_change: Callable[[dict], Awaitable[None]] = None,
+    scheduler: HostScheduler = None,
+    lowercase_paths: bool = False,
 ) -> BFSDeepCrawlStrategy:
     """BFS(너비 우선 탐색) 전략 생성
 
@@ -50,14 +216,24 @@ def create_bfs_strategy(
         max_pages: 최대 크롤링 페이지 수
         include_external: 외부 링크 포함 여부
         url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
+        resume_state: 이어서 크롤링할 저장된 전략 상태 (체크포인트)
+        on_state_change: 페이지마다 전략 상태를 받는 비동기 콜백
+        scheduler: 호스트별 동시성/간격/backoff 스케줄러 (None이면 crawl4ai 기본 디스패처)
+        lowercase_paths: URL 경로 대소문자를 구분하지 않음 (/Foo와 /foo를 한 번만 크롤링)
     """
-    filter_chain = _build_filter_chain(domain, url_prefix)
+    filter_chain = _build_filter_chain(domain, url_prefix, lowercase_paths)
 
-    return BFSDeepCrawlStrategy(
+    return _create_strategy(
+        _DocsBFSStrategy,
+        _ScheduledBFSStrategy,
+        scheduler,
         max_depth=max_depth,
         include_external=include_external,
         filter_chain=filter_chain,
         max_pages=max_pages,
+        resume_state=resume_state,
+        on_state_change=on_state_change,
+        lowercase_path=lowercase_paths,
     )
 
 
@@ -67,6 +243,10 @@ def create_dfs_strategy(
     max_pages: int = 100,
     include_external: bool = False,
     url_prefix: str = None,
+    resume_state: dict = None,
+    on_state_change: Callable[[dict], Awaitable[None]] = None,
+    scheduler: HostScheduler = None,
+    lowercase_paths: bool = False,
 ) -> DFSDeepCrawlStrategy:
     """DFS(깊이 우선 탐색) 전략 생성
 
@@ -76,14 +256,24 @@ def create_dfs_strategy(
         max_pages: 최대 크롤링 페이지 수
         include_external: 외부 링크 포함 여부
         url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
+        resume_state: 이어서 크롤링할 저장된 전략 상태 (체크포인트)
+        on_state_change: 페이지마다 전략 상태를 받는 비동기 콜백
+        scheduler: 호스트별 동시성/간격/backoff 스케줄러 (None이면 crawl4ai 기본 디스패처)
+        lowercase_paths: URL 경로 대소문자를 구분하지 않음 (/Foo와 /foo를 한 번만 크롤링)
     """
-    filter_chain = _build_filter_chain(domain, url_prefix)
+    filter_chain = _build_filter_chain(domain, url_prefix, lowercase_paths)
 
-    return DFSDeepCrawlStrategy(
+    return _create_strategy(
+        _DocsDFSStrategy,
+        _ScheduledDFSStrategy,
+        scheduler,
         max_depth=max_depth,
         include_external=include_external,
         filter_chain=filter_chain,
         max_pages=max_pages,
+        resume_state=resume_state,
+        on_state_change=on_state_change,
+        lowercase_path=lowercase_paths,
     )
 
 
@@ -94,6 +284,11 @@ def create_best_first_strategy(
     max_pages: int = 100,
     keyword_weight: float = 0.8,
     url_prefix: str = None,
+    score_threshold: float = 0.0,
+    resume_state: dict = None,
+    on_state_change: Callable[[dict], Awaitable[None]] = None,
+    scheduler: HostScheduler = None,
+    lowercase_paths: bool = False,
 ) -> BestFirstCrawlingStrategy:
     """Best-First 전략 생성 (키워드 기반 우선순위)
 
@@ -104,28 +299,43 @@ def create_best_first_strategy(
         max_pages: 최대 크롤링 페이지 수
         keyword_weight: 키워드 가중치
         url_prefix: URL 프리픽스 필터
+        score_threshold: 이 점수 미만인 링크는 크롤링하지 않음
+            (점수 = URL에 포함된 키워드 비율 x keyword_weight, 0이면 모두 크롤링)
+        resume_state: 이어서 크롤링할 저장된 전략 상태 (체크포인트)
+        on_state_change: 페이지마다 전략 상태를 받는 비동기 콜백
+        scheduler: 호스트별 동시성/간격/backoff 스케줄러 (None이면 crawl4ai 기본 디스패처)
+        lowercase_paths: URL 경로 대소문자를 구분하지 않음 (/Foo와 /foo를 한 번만 크롤링)
     """
-    filter_chain = _build_filter_chain(domain, url_prefix)
+    filter_chain = _build_filter_chain(domain, url_prefix, lowercase_paths)
 
     scorer = KeywordRelevanceScorer(keywords=keywords, weight=keyword_weight)
 
-    return BestFirstCrawlingStrategy(
+    return _create_strategy(
+        _DocsBestFirstStrategy,
+        _ScheduledBestFirstStrategy,
+        scheduler,
         max_depth=max_depth,
         include_external=False,
         filter_chain=filter_chain,
         url_scorer=scorer,
+        score_threshold=score_threshold,
         max_pages=max_pages,
+        resume_state=resume_state,
+        on_state_change=on_state_change,
+        lowercase_path=lowercase_paths,
     )
 
 
+# 문서 사이트에서 우선 크롤링할 경로 키워드 (best_first에 키워드를 주지 않으면 사용)
+DOCS_KEYWORDS = ["guide", "tutorial", "documentation", "api", "reference", "docs", "example"]
+
+
 # 프리셋: 문서 사이트 크롤링용
 def create_docs_strategy(domain: str, max_pages: int = 100) -> BestFirstCrawlingStrategy:
     """문서 사이트 크롤링 전략
 
     API 문서, 튜토리얼 등을 우선적으로 크롤링
     """
-    keywords = ["guide", "tutorial", "documentation", "api", "reference", "docs", "example"]
-
     return create_best_first_strategy(
-        domain=domain, keywords=keywords, max_depth=3, max_pages=max_pages, keyword_weight=0.9
+        domain=domain, keywords=DOCS_KEYWORDS, max_depth=3, max_pages=max_pages, keyword_weight=0.9
     )
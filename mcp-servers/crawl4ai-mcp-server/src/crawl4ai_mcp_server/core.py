@@ -1,14 +1,40 @@
 """Core crawler module (refactored)."""
 
 import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
+from urllib.parse import urlparse
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
-
-from .configs.deep_crawl import create_bfs_strategy, create_dfs_strategy
-from .strategies.content import clean_navigation_content
+from crawl4ai.async_dispatcher import SemaphoreDispatcher
+
+from .configs.deep_crawl import DOCS_KEYWORDS, create_best_first_strategy, create_bfs_strategy, create_dfs_strategy
+from .storage.chunks import CHUNKS_FILENAME, ChunkWriter
+from .storage.checkpoint import CrawlCheckpoint, checkpoint_path
+from .storage.content_store import ContentStore, raw_hash
+from .storage.manifest import CrawlManifest, content_hash
+from .storage.packed import open_pack_writer, utc_now
+from .storage.page_cache import PageCache
+from .storage.results import RESULTS_FILENAME, write_results
+from .storage.search_index import SEARCH_INDEX_FILENAME, build_search_index, remove_search_index, update_search_index
+from .storage.writer import PageWriter
+from .strategies.boilerplate import dedupe_files, load_known_boilerplate
+from .strategies.chunking import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_TOKENS, check_chunk_sizes
+from .strategies.content import check_footer_patterns
+from .strategies.http_fetch import HttpFetcher, HttpPage, supports_config
+from .strategies.parallel import DEFAULT_CLEAN_BATCH, CleaningPool
+from .strategies.pipeline import CleaningPipeline
+from .strategies.politeness import HostScheduler, PoliteCrawler, create_host_scheduler
+from .strategies.rule_packs import resolve_pipeline
+from .strategies.sitemap import collect_sitemap_entries, parse_lastmod
+from .strategies.timing import TIMINGS_FILENAME, StageTimings, instrument_crawler, timed_config
 from .utils.domain import extract_domain, extract_output_dir_name
+from .utils.fs import write_json_atomic
 from .utils.path import url_to_filepath
+from .utils.url import canonicalize_url, extract_canonical_link
 
 # 기본 BrowserConfig: 빠른 텍스트 크롤링에 최적화
 DEFAULT_BROWSER_CONFIG = BrowserConfig(
@@ -19,11 +45,135 @@ DEFAULT_BROWSER_CONFIG = BrowserConfig(
 )
 
 
+@asynccontextmanager
+async def _crawler_session(
+    crawler: AsyncWebCrawler | Callable[[], Awaitable[AsyncWebCrawler]] | None,
+    browser_config: BrowserConfig,
+):
+    """크롤러 세션 컨텍스트
+
+    crawler가 주어지면 (예: 서버의 CrawlerPool) 그대로 사용하고 닫지 않는다.
+    crawler가 크롤러를 반환하는 async 함수면 이 시점에 호출한다 (HTTP 단계에서
+    끝나면 브라우저를 띄우지 않도록). 없으면 browser_config로 새 크롤러를 띄우고
+    끝나면 종료한다.
+    """
+    if callable(crawler):
+        crawler = await crawler()
+
+    if crawler is not None:
+        yield crawler
+        return
+
+    async with AsyncWebCrawler(config=browser_config) as owned_crawler:
+        yield owned_crawler
+
+
+@asynccontextmanager
+async def _fetcher_session(fetcher: HttpFetcher | None, http_first: bool):
+    """HTTP fetch 단계 컨텍스트
+
+    fetcher가 주어지면 (예: 서버의 공유 fetcher) 그대로 사용하고 닫지 않는다.
+    없고 http_first면 새로 만들고 끝나면 커넥션 풀을 닫는다.
+    """
+    if fetcher is not None or not http_first:
+        yield fetcher
+        return
+
+    async with HttpFetcher() as owned_fetcher:
+        yield owned_fetcher
+
+
+def _raw_markdown(result) -> str:
+    """크롤링 결과(CrawlResult 또는 HttpPage)의 정리 전 마크다운"""
+    markdown_content = result.markdown
+    if not isinstance(markdown_content, str):
+        # CrawlResult의 markdown은 MarkdownGenerationResult (HttpPage는 문자열)
+        markdown_content = markdown_content.raw_markdown if markdown_content else ""
+    return markdown_content
+
+
+def _clean_result(result, pipeline: CleaningPipeline) -> str:
+    """크롤링 결과(CrawlResult 또는 HttpPage)의 마크다운을 정리 파이프라인으로 정리"""
+    html = result.cleaned_html if pipeline.needs_html else None
+    return pipeline.run(_raw_markdown(result), html=html, url=result.url)
+
+
+def _cache_page(result) -> HttpPage:
+    """페이지 캐시에 저장할 형태로 변환 (HttpPage는 그대로)"""
+    if isinstance(result, HttpPage):
+        return result
+    return HttpPage(
+        url=result.url,
+        status_code=result.status_code or 200,
+        headers=dict(result.response_headers or {}),
+        html="",
+        cleaned_html=result.cleaned_html or "",
+        markdown=_raw_markdown(result),
+    )
+
+
+def _requested_url(result, requested_urls: dict[str, str]) -> str:
+    """브라우저 결과에 해당하는 요청 URL (리다이렉트돼도 요청한 URL로 캐시하기 위해)
+
+    Args:
+        result: CrawlResult (url 또는 redirected_url 중 하나가 요청 URL)
+        requested_urls: 정규 URL -> 요청 URL
+    """
+    for candidate in (result.url, getattr(result, "redirected_url", None)):
+        if candidate:
+            requested_url = requested_urls.get(canonicalize_url(candidate))
+            if requested_url is not None:
+                return requested_url
+    return result.url
+
+
+def _page_text(url: str, markdown: str) -> str:
+    """저장 파일 내용 (URL 헤더 + 정리된 마크다운)"""
+    return f"# {url}\n\n{markdown}"
+
+
+def _read_page_markdown(path: Path) -> str:
+    """저장 파일에서 URL 헤더를 뺀 마크다운 읽기 (_page_text의 역)"""
+    return path.read_text(encoding="utf-8").partition("\n\n")[2]
+
+
+def _save_markdown(url: str, markdown: str, output_path: Path) -> Path:
+    """정리된 마크다운을 URL 헤더와 함께 파일로 저장
+
+    Args:
+        url: 원본 URL (파일 경로 계산 및 헤더에 사용)
+        markdown: 정리된 마크다운 텍스트
+        output_path: 출력 디렉토리
+
+    Returns:
+        저장된 파일 경로
+    """
+    file_path = url_to_filepath(url, output_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 컨텐츠 저장소 링크였던 파일에 쓰면 공유 객체가 바뀌므로 링크를 먼저 제거
+    if file_path.is_symlink():
+        file_path.unlink()
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(_page_text(url, markdown))
+
+    return file_path
+
+
 async def crawl_single_page(
     url: str,
     output_dir: str = None,
     crawler_config: CrawlerRunConfig = None,
     browser_config: BrowserConfig = None,
+    crawler: AsyncWebCrawler | Callable[[], Awaitable[AsyncWebCrawler]] | None = None,
+    footer_patterns: list[str] = None,
+    rule_pack: str = None,
+    http_first: bool = True,
+    fetcher: HttpFetcher = None,
+    cache: PageCache = None,
+    cache_preset: str = "default",
+    max_age: float = None,
 ) -> str:
     """단일 페이지 크롤링하여 마크다운 반환
 
@@ -32,6 +182,16 @@ async def crawl_single_page(
         output_dir: 출력 디렉토리 (None이면 파일 저장 안 함)
         crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
         browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        crawler: 재사용할 크롤러 또는 크롤러를 반환하는 async 함수
+            (None이면 browser_config로 새로 띄우고 종료)
+        footer_patterns: 사이트별 푸터 정규식 패턴 (지정 시 룰 팩의 푸터 패턴 대신 사용)
+        rule_pack: 정리 룰 팩 이름 (None이면 도메인으로 자동 선택)
+        http_first: 브라우저 없이 HTTP로 먼저 가져오고, JS 렌더링이 필요해 보일 때만 브라우저 사용
+        fetcher: 재사용할 HttpFetcher (None이면 필요할 때 새로 만들고 종료)
+        cache: 페이지 캐시 (None이면 캐시 안 함). 캐시에 있으면 fetch 없이 정리만 하고,
+            새로 가져온 페이지는 캐시에 저장한다
+        cache_preset: 캐시 키로 쓰는 브라우저 프리셋 이름 (같은 URL도 프리셋마다 따로 저장)
+        max_age: 캐시를 쓸 최대 나이 (초). None이면 도메인 TTL, 0이면 항상 새로 가져옴
 
     Returns:
         정리된 마크다운 텍스트
@@ -44,34 +204,208 @@ async def crawl_single_page(
     if browser_config is None:
         browser_config = DEFAULT_BROWSER_CONFIG
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        result = await crawler.arun(url, config=crawler_config)
+    pipeline = resolve_pipeline(url, rule_pack, footer_patterns)
+
+    # 캐시에 있으면 fetch 생략
+    result = await asyncio.to_thread(cache.get, url, cache_preset, max_age) if cache is not None else None
+
+    if result is None:
+        http_first = http_first and supports_config(crawler_config)
+
+        async with _fetcher_session(fetcher, http_first) as fetcher:
+            result = await fetcher.fetch(url, crawler_config) if http_first else None
 
-        if not result.success:
-            print(f"❌ Failed: {url}")
-            return ""
+        if result is None:
+            async with _crawler_session(crawler, browser_config) as crawler:
+                result = await crawler.arun(url, config=crawler_config)
+            if fetcher is not None:
+                fetcher.stats.record("browser")
 
-        # 마크다운 정리
-        markdown_content = result.markdown.raw_markdown if result.markdown else ""
-        cleaned_markdown = clean_navigation_content(markdown_content)
+            if not result.success:
+                print(f"❌ Failed: {url}")
+                return ""
 
-        # 파일 저장 (output_dir이 지정된 경우)
-        if output_dir:
-            domain = extract_domain(url)
-            output_dir = output_dir or extract_output_dir_name(domain)
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
+        if cache is not None:
+            await asyncio.to_thread(cache.put, url, cache_preset, _cache_page(result))
+
+    # 마크다운 정리
+    cleaned_markdown = _clean_result(result, pipeline)
+
+    # 파일 저장 (output_dir이 지정된 경우)
+    if output_dir:
+        domain = extract_domain(url)
+        output_dir = output_dir or extract_output_dir_name(domain)
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        file_path = _save_markdown(url, cleaned_markdown, output_path)
+        print(f"✅ Saved to {file_path}")
+
+    return cleaned_markdown
+
+
+async def crawl_pages(
+    urls: list[str],
+    output_dir: str = None,
+    concurrency: int = 5,
+    crawler_config: CrawlerRunConfig = None,
+    browser_config: BrowserConfig = None,
+    crawler: AsyncWebCrawler | Callable[[], Awaitable[AsyncWebCrawler]] | None = None,
+    footer_patterns: list[str] = None,
+    rule_pack: str = None,
+    http_first: bool = True,
+    fetcher: HttpFetcher = None,
+    cache: PageCache = None,
+    cache_preset: str = "default",
+    max_age: float = None,
+) -> AsyncIterator[dict]:
+    """여러 페이지를 하나의 크롤러로 동시에 크롤링 (완료되는 순서대로 yield)
+
+    http_first면 모든 URL을 먼저 HTTP로 동시에 가져오고, JS 렌더링이 필요해
+    보이는 URL만 모아서 브라우저로 크롤링한다.
+
+    Args:
+        urls: 크롤링할 URL 리스트 (중복은 한 번만 크롤링)
+        output_dir: 출력 디렉토리 (None이면 파일 저장 안 함)
+        concurrency: 동시에 여는 최대 탭 수 (HTTP 단계의 동시 요청 수도 같음)
+        crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
+        browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        crawler: 재사용할 크롤러 또는 크롤러를 반환하는 async 함수
+            (None이면 browser_config로 새로 띄우고 종료)
+        footer_patterns: 사이트별 푸터 정규식 패턴 (지정 시 룰 팩의 푸터 패턴 대신 사용)
+        rule_pack: 정리 룰 팩 이름 (None이면 URL마다 도메인으로 자동 선택)
+        http_first: 브라우저 없이 HTTP로 먼저 가져오고, JS 렌더링이 필요해 보일 때만 브라우저 사용
+        fetcher: 재사용할 HttpFetcher (None이면 필요할 때 새로 만들고 종료)
+        cache: 페이지 캐시 (None이면 캐시 안 함). 캐시에 있는 URL은 fetch 없이 먼저 yield하고,
+            새로 가져온 페이지는 캐시에 저장한다
+        cache_preset: 캐시 키로 쓰는 브라우저 프리셋 이름
+        max_age: 캐시를 쓸 최대 나이 (초). None이면 도메인 TTL, 0이면 항상 새로 가져옴
+
+    Yields:
+        URL별 결과 dict (url, success, markdown, file, error)
+    """
+    if crawler_config is None:
+        from .configs.crawler import DOCS_CRAWL_CONFIG
 
-            file_path = url_to_filepath(url, output_path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        crawler_config = DOCS_CRAWL_CONFIG
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"# {url}\n\n")
-                f.write(cleaned_markdown)
+    if browser_config is None:
+        browser_config = DEFAULT_BROWSER_CONFIG
 
+    # 순서를 유지하며 정규화된 URL 기준으로 중복 제거 (처음 주어진 URL로 요청)
+    unique_urls: dict[str, str] = {}
+    for url in urls:
+        unique_urls.setdefault(canonicalize_url(url), url)
+    urls = list(unique_urls.values())
+
+    output_path = None
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+    pipelines: dict[str, CleaningPipeline] = {}
+
+    def finish(result) -> dict:
+        # 마크다운 정리 (호스트별로 파이프라인을 한 번만 결정)
+        host = urlparse(result.url).netloc
+        if host not in pipelines:
+            pipelines[host] = resolve_pipeline(result.url, rule_pack, footer_patterns)
+        cleaned_markdown = _clean_result(result, pipelines[host])
+
+        file_path = None
+        if output_path is not None:
+            file_path = _save_markdown(result.url, cleaned_markdown, output_path)
             print(f"✅ Saved to {file_path}")
 
-        return cleaned_markdown
+        return {
+            "url": result.url,
+            "success": True,
+            "markdown": cleaned_markdown,
+            "file": str(file_path) if file_path else None,
+            "error": None,
+        }
+
+    if cache is not None:
+        # 캐시에 있는 페이지는 바로 결과로, 나머지만 가져옴
+        missing = []
+        for url in urls:
+            page = await asyncio.to_thread(cache.get, url, cache_preset, max_age)
+            if page is None:
+                missing.append(url)
+            else:
+                yield finish(page)
+        urls = missing
+        if not urls:
+            return
+
+    http_first = http_first and supports_config(crawler_config)
+
+    async with _fetcher_session(fetcher, http_first) as fetcher:
+        browser_urls = urls
+        if http_first:
+            browser_urls = []
+            async for url, page in _fetch_many(fetcher, urls, crawler_config, concurrency):
+                if page is None:
+                    browser_urls.append(url)
+                else:
+                    if cache is not None:
+                        await asyncio.to_thread(cache.put, url, cache_preset, page)
+                    yield finish(page)
+
+    if not browser_urls:
+        return
+
+    stream_config = crawler_config.clone(stream=True)
+    dispatcher = SemaphoreDispatcher(semaphore_count=max(1, concurrency))
+    # 결과는 완료 순서로 오므로 캐시 키(요청 URL)는 정규 URL로 되찾음
+    requested_urls = {canonicalize_url(url): url for url in browser_urls}
+
+    async with _crawler_session(crawler, browser_config) as crawler:
+        async for result in await crawler.arun_many(browser_urls, config=stream_config, dispatcher=dispatcher):
+            if fetcher is not None:
+                fetcher.stats.record("browser")
+
+            if not result.success:
+                print(f"❌ Failed: {result.url}")
+                yield {
+                    "url": result.url,
+                    "success": False,
+                    "markdown": "",
+                    "file": None,
+                    "error": result.error_message or "unknown error",
+                }
+                continue
+
+            if cache is not None:
+                requested_url = _requested_url(result, requested_urls)
+                await asyncio.to_thread(cache.put, requested_url, cache_preset, _cache_page(result))
+            yield finish(result)
+
+
+async def _fetch_many(fetcher: HttpFetcher, urls: list[str], crawler_config: CrawlerRunConfig, concurrency: int):
+    """URL들을 HTTP로 동시에 가져와서 완료 순서대로 (url, HttpPage 또는 None) yield
+
+    fetch가 예상하지 못한 예외를 내도 나머지 요청은 계속하고 그 URL은 None(브라우저로)으로 넘긴다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_one(url: str):
+        async with semaphore:
+            try:
+                return url, await fetcher.fetch(url, crawler_config)
+            except Exception as e:
+                print(f"⚠️ HTTP fetch failed for {url}: {e}")
+                fetcher.stats.record_fallback("error")
+                return url, None
+
+    tasks = [asyncio.create_task(fetch_one(url)) for url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 소비자가 중간에 멈추면 남은 요청 취소
+        for task in tasks:
+            task.cancel()
 
 
 async def crawl_documentation(
@@ -83,6 +417,32 @@ async def crawl_documentation(
     strategy: str = "bfs",
     crawler_config: CrawlerRunConfig = None,
     browser_config: BrowserConfig = None,
+    crawler: AsyncWebCrawler | Callable[[], Awaitable[AsyncWebCrawler]] | None = None,
+    incremental: bool = False,
+    resume: bool = False,
+    max_per_host: int = None,
+    min_delay: float = None,
+    respect_crawl_delay: bool = False,
+    scheduler: HostScheduler = None,
+    footer_patterns: list[str] = None,
+    rule_pack: str = None,
+    dedupe: bool = False,
+    dedupe_threshold: float = 0.5,
+    content_store: bool = False,
+    keywords: list[str] = None,
+    score_threshold: float = 0.0,
+    on_progress: Callable[[dict], Awaitable[None]] = None,
+    output_format: str = "markdown",
+    search_index: bool = False,
+    chunks: bool = False,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    stage_timings: StageTimings = None,
+    clean_workers: int = 0,
+    clean_batch: int = DEFAULT_CLEAN_BATCH,
+    cache: PageCache = None,
+    cache_preset: str = "default",
+    lowercase_paths: bool = False,
 ) -> list[dict]:
     """공식문서 크롤링
 
@@ -92,15 +452,91 @@ async def crawl_documentation(
         max_pages: 최대 크롤링 페이지 수
         max_depth: 최대 크롤링 깊이
         url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
-        strategy: 크롤링 전략 ("bfs" 또는 "dfs")
+        strategy: 크롤링 전략 ("bfs", "dfs", "best_first" 또는 "sitemap").
+            "best_first"는 URL에 keywords가 많이 포함된 링크부터 크롤링한다.
+            "sitemap"은 링크를 따라가지 않고 사이트맵(robots.txt의 Sitemap:,
+            없으면 /sitemap.xml, 시작 URL이 .xml이면 그 파일)의 URL을 동시에 크롤링한다
         crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
         browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        crawler: 재사용할 크롤러 또는 크롤러를 반환하는 async 함수
+            (None이면 browser_config로 새로 띄우고 종료)
+        incremental: 증분 모드. 출력 디렉토리의 매니페스트와 비교해
+            ETag/Last-Modified 또는 컨텐츠 해시가 같은 페이지는 다시 쓰지 않는다.
+            sitemap 전략에서는 lastmod가 마지막 확인 시각 이전인 페이지는 요청하지 않는다
+        resume: 출력 디렉토리 옆의 체크포인트({output_dir}.checkpoint.json)에서
+            visited/frontier를 복원해 이어서 크롤링한다. 체크포인트는 크롤링 중
+            주기적으로 저장되고 정상 종료 시 삭제된다
+        max_per_host: 호스트당 최대 동시 요청 수
+        min_delay: 호스트당 요청 시작 간 최소 간격 (초)
+        respect_crawl_delay: robots.txt의 Crawl-delay 준수
+        scheduler: 공유할 HostScheduler (지정 시 위 세 옵션은 무시).
+            스케줄러를 쓰면 429/503 응답에 AIMD 방식으로 간격을 늘리고 재시도한다
+        footer_patterns: 사이트별 푸터 정규식 패턴 (지정 시 룰 팩의 푸터 패턴 대신 사용)
+        rule_pack: 정리 룰 팩 이름 (None이면 시작 URL의 도메인으로 자동 선택)
+        dedupe: 크롤링이 끝난 뒤 여러 페이지에 반복되는 블록(사이드바, 배너 등)을 제거
+        dedupe_threshold: 전체 페이지 중 이 비율 이상에 나타난 블록을 반복으로 판정
+        content_store: 정리된 마크다운을 해시 이름의 객체({output_dir}/.objects/)로
+            한 번만 저장하고 URL별 파일은 객체로의 링크로 만든다. 같은 원문은 다시 정리하지 않는다
+        keywords: best_first 전략의 우선순위 키워드 (None이면 DOCS_KEYWORDS)
+        score_threshold: best_first 전략에서 URL에 포함된 키워드 비율이 이 값 미만인 링크는
+            크롤링하지 않는다 (0이면 모두 크롤링, 순서만 바꿈)
+        on_progress: 페이지가 저장될 때마다 호출되는 비동기 콜백. 결과 레코드(url, depth,
+            file, status)에 done(저장한 페이지 수)과 total(예상 전체 페이지 수)을 더해 넘긴다.
+            콜백에서 난 예외는 크롤링을 멈추지 않는다
+        output_format: 저장 형식. "markdown"은 URL별 .md 파일 트리, "jsonl" / "jsonl.zst" /
+            "parquet"은 출력 디렉토리의 단일 파일(pages.*)에 레코드(url, depth, score,
+            fetched_at, content_hash, markdown)를 추가하고 pages.index.jsonl에 위치를 기록한다.
+            단일 파일 형식은 incremental, dedupe, content_store와 함께 쓸 수 없다
+        search_index: 크롤링이 끝난 뒤 저장된 페이지로 전문 검색 인덱스
+            ({output_dir}/.search-index.sqlite, SQLite FTS5)를 만들거나 갱신한다.
+            False면 이전 크롤링에서 만든 인덱스는 이번에 바뀐 페이지를 반영하지 못하므로
+            지운다 (search_pages가 다음 검색 때 저장된 페이지로 새로 만듦)
+        chunks: 정리된 마크다운을 heading 경계에 맞춰 검색용 청크로 나누고
+            {output_dir}/chunks.jsonl에 청크(id, url, file, index, heading_path, tokens, text)를
+            기록한다. 페이지를 저장할 때 함께 나누므로 후처리에서 파일을 다시 파싱할 필요가 없다.
+            증분 모드의 unchanged 페이지는 이전 청크를 그대로 유지한다
+        chunk_tokens: 청크 목표 크기 (토큰 추정치)
+        chunk_overlap: 같은 섹션에서 이어지는 청크 간 겹치는 최대 토큰 수
+        stage_timings: 페이지별 단계 시간(fetch, scrape, clean, write)을 기록할 객체
+            (None이면 새로 만듦). 호출 측에서 넘기면 크롤링 후 report()로 집계를 읽거나
+            on_page 훅으로 페이지마다 받을 수 있다. 집계는 항상
+            {output_dir}/.crawl-timings.json에도 저장된다
+        clean_workers: 정리 파이프라인(룰 팩의 HTML 정리 + 마크다운 정리)과 청크 분할을
+            실행할 워커 프로세스 수. 0이면 writer 스레드에서 실행한다 (GIL 때문에 큰
+            페이지가 많으면 코어 하나에 묶임). 크롤링 속도가 정리 단계에 막힐 때 코어 수 정도로 지정
+        clean_batch: 워커 프로세스에 한 번에 넘기는 최대 페이지 수 (pickle 왕복 횟수를 줄임)
+        cache: 페이지 캐시 (None이면 캐시 안 함). 가져온 페이지를 writer 스레드에서 캐시에
+            저장해서 이후 crawl_single_page / crawl_pages가 fetch 없이 쓸 수 있게 한다.
+            링크를 따라가려면 브라우저 결과가 필요하므로 Deep Crawl 자체는 캐시를 읽지 않는다
+        cache_preset: 캐시 키로 쓰는 브라우저 프리셋 이름
+        lowercase_paths: URL 경로의 대소문자를 구분하지 않는 사이트용. 중복 판정 키,
+            url_prefix 비교, canonical URL과 저장 경로에서 경로를 소문자로 바꿔서 /Foo와 /foo를
+            한 페이지로 크롤링한다 (요청은 원래 링크로). 대소문자를 구분하는 사이트에서는
+            다른 페이지를 하나로 합치므로 쓰지 않는다
+
+    반환하는 결과 목록은 {output_dir}/crawl-results.jsonl에, 상태별 / URL 디렉토리별 집계는
+    {output_dir}/crawl-results.summary.json에도 저장된다 (storage.results.read_results로 페이지 단위 조회).
+
+    취소(asyncio.CancelledError)되면 그때까지 저장한 페이지와 체크포인트는 남겨 두므로
+    같은 인자에 resume=True로 이어서 크롤링할 수 있다.
 
     Returns:
-        크롤링 결과 리스트
+        크롤링 결과 리스트. 각 항목의 status는 "added" / "changed" / "unchanged"
+        (증분 모드가 아니면 항상 "added"). 증분 모드에서 이번에 보이지 않은
+        페이지는 status "removed" 항목으로 함께 반환된다
     """
+    if output_format != "markdown" and (incremental or dedupe or content_store):
+        raise ValueError(f"incremental, dedupe and content_store require output_format='markdown' (got {output_format!r})")
+    if chunks:
+        check_chunk_sizes(chunk_tokens, chunk_overlap)
+    if clean_workers < 0 or clean_batch < 1:
+        raise ValueError(f"clean_workers must be >= 0 and clean_batch >= 1 (got {clean_workers}, {clean_batch})")
+    if footer_patterns:
+        check_footer_patterns(footer_patterns)
+
     # 도메인 추출
     domain = extract_domain(start_url)
+    canonicalize = partial(canonicalize_url, lowercase_path=lowercase_paths)
 
     # 출력 디렉토리 설정
     if output_dir is None:
@@ -109,57 +545,456 @@ async def crawl_documentation(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Deep Crawl 전략 생성
-    strategy_factory = create_dfs_strategy if strategy == "dfs" else create_bfs_strategy
-    deep_crawl_strategy = strategy_factory(
-        domain=domain,
-        max_depth=max_depth,
-        max_pages=max_pages,
-        include_external=False,
-        url_prefix=url_prefix,
-    )
+    # 색인하지 않는 크롤링은 기존 인덱스를 낡게 만듦 (중간에 취소돼도 낡은 인덱스가 남지 않도록 먼저 지움)
+    if not search_index and remove_search_index(output_path):
+        print(f"🗑️ Removed stale search index {output_path / SEARCH_INDEX_FILENAME}")
+
+    # 체크포인트 (중단된 크롤링 이어하기)
+    checkpoint = CrawlCheckpoint(checkpoint_path(output_path), start_url, strategy)
+    resume_state = checkpoint.load() if resume else None
+    if resume_state:
+        print(f"↻ Resuming from {checkpoint.path} ({resume_state.get('pages_crawled', 0)} pages done)")
+
+    # 호스트별 속도 조절 (옵션이 없으면 crawl4ai 기본 디스패처 사용)
+    if scheduler is None:
+        scheduler = create_host_scheduler(max_per_host, min_delay, respect_crawl_delay)
 
     # 크롤러 설정
     if crawler_config is None:
         from .configs.crawler import DOCS_CRAWL_CONFIG
 
-        crawler_config = DOCS_CRAWL_CONFIG.clone(deep_crawl_strategy=deep_crawl_strategy)
-    else:
+        crawler_config = DOCS_CRAWL_CONFIG
+
+    if strategy != "sitemap":
+        # Deep Crawl 전략 생성
+        if strategy == "best_first":
+            # 가중치 1.0: 점수 = URL에 포함된 키워드 비율 (score_threshold와 같은 척도)
+            strategy_factory = create_best_first_strategy
+            strategy_options = {
+                "keywords": keywords or DOCS_KEYWORDS,
+                "keyword_weight": 1.0,
+                "score_threshold": score_threshold,
+            }
+        else:
+            strategy_factory = create_dfs_strategy if strategy == "dfs" else create_bfs_strategy
+            strategy_options = {"include_external": False}
+
+        deep_crawl_strategy = strategy_factory(
+            domain=domain,
+            max_depth=max_depth,
+            max_pages=max_pages,
+            url_prefix=url_prefix,
+            resume_state=resume_state,
+            on_state_change=checkpoint.on_state_change,
+            scheduler=scheduler,
+            lowercase_paths=lowercase_paths,
+            **strategy_options,
+        )
         crawler_config = crawler_config.clone(deep_crawl_strategy=deep_crawl_strategy)
 
     if browser_config is None:
         browser_config = DEFAULT_BROWSER_CONFIG
 
-    results = []
+    # 단계별 시간 측정 (scrape는 설정의 스크래핑 전략/마크다운 생성기를 감싸서 측정)
+    timings = stage_timings if stage_timings is not None else StageTimings()
+    crawler_config = timed_config(crawler_config)
+
+    # 정리 파이프라인 (룰 팩)
+    pipeline = resolve_pipeline(start_url, rule_pack, footer_patterns)
+
+    # 정리/청크 분할을 워커 프로세스로 (dedupe면 청크는 크롤링 후에 나눔)
+    cleaner = None
+    if clean_workers:
+        chunk_sizes = (chunk_tokens, chunk_overlap) if chunks and not dedupe else None
+        cleaner = CleaningPool(pipeline, clean_workers, chunk_sizes)
+
+    store = ContentStore(output_path) if content_store else None
+    manifest = CrawlManifest.load(output_path) if incremental else None
+    if manifest is not None:
+        # 이전 실행에서 이미 처리한 페이지가 removed로 잡히지 않도록
+        for url in checkpoint.processed:
+            manifest.mark_seen(canonicalize(url))
+
+    # 사이트맵 모드: 크롤링할 URL을 미리 확정 (lastmod로 변경 없는 페이지는 요청 생략)
+    sitemap_urls: list[str] = []
+    skipped_records: list[dict] = []
+    if strategy == "sitemap":
+        entries = await collect_sitemap_entries(start_url, url_prefix, max_pages, lowercase_path=lowercase_paths)
+        for entry in entries:
+            if entry.url in checkpoint.processed:
+                continue
+            # 매니페스트는 정규화된 URL 기준, 요청은 사이트맵에 적힌 URL로
+            url = canonicalize(entry.url)
+            if manifest is not None and manifest.is_fresh(url, parse_lastmod(entry.lastmod)):
+                manifest.mark_unchanged(url)
+                skipped_records.append({"url": url, "depth": 0, "file": str(manifest.file_for(url)), "status": "unchanged"})
+                continue
+            sitemap_urls.append(entry.url)
+        print(f"🗺️ {len(entries)} URLs in sitemap, {len(sitemap_urls)} to fetch")
+
+    # 단일 파일 출력 (markdown이면 None, 이어서 크롤링하면 기존 파일에 추가)
+    pack = open_pack_writer(output_path, output_format, resume=resume_state is not None)
+
+    # 청크 매니페스트 (dedupe는 크롤링 후 파일 내용을 바꾸므로 dedupe가 끝난 뒤에 나눔)
+    chunk_writer = ChunkWriter(output_path, chunk_tokens, chunk_overlap, resume=resume_state is not None) if chunks else None
+
+    # 정리/저장은 writer 스레드에서 처리 (이벤트 루프를 막지 않도록)
+    process_page = partial(
+        _write_page,
+        output_path=output_path,
+        manifest=manifest,
+        checkpoint=checkpoint,
+        pipeline=pipeline,
+        store=store,
+        pack=pack,
+        chunker=None if dedupe else chunk_writer,
+        timings=timings,
+        cache=cache,
+        cache_preset=cache_preset,
+    )
+
+    # 이번 크롤링에서 저장한 정규 URL (<link rel=canonical>이 같은 페이지는 한 번만 저장)
+    saved_urls: set[str] = set()
+
+    # 진행 상황 보고 (사이트맵은 확정된 URL 수, Deep Crawl은 max_pages가 전체 추정치)
+    total_pages = len(skipped_records) + len(sitemap_urls) if strategy == "sitemap" else max_pages
+
+    async def report_progress(record: dict) -> None:
+        try:
+            await on_progress({**record, "done": len(skipped_records) + len(writer.records), "total": total_pages})
+        except Exception as e:
+            # 클라이언트 연결 문제 등으로 보고가 실패해도 크롤링은 계속
+            print(f"⚠️ Progress report failed: {e}")
+
+    writer = PageWriter(
+        process_page,
+        on_record=report_progress if on_progress else None,
+        # 워커 프로세스마다 묶음 하나씩 넘길 수 있도록 writer 스레드도 같은 수로
+        workers=max(2, clean_workers),
+        batch_size=clean_batch if cleaner is not None else 1,
+        prepare=partial(_preclean_pages, cleaner=cleaner, manifest=manifest, store=store) if cleaner is not None else None,
+    )
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        async for result in await crawler.arun(start_url, config=crawler_config):
-            if result.success:
-                depth = result.metadata.get("depth", 0)
-                score = result.metadata.get("score", 0)
+    with timings.activate():
+        try:
+            async with (
+                _crawler_session(crawler, browser_config) as crawler,
+                writer,
+            ):
+                # fetch 단계는 크롤러 자체를 감싸서 측정 (풀에서 공유하는 크롤러면 한 번만 적용)
+                instrument_crawler(crawler)
+
+                if strategy == "sitemap":
+                    crawl_results = _crawl_urls(crawler, sitemap_urls, crawler_config, scheduler, checkpoint)
+                else:
+                    crawl_results = await crawler.arun(start_url, config=crawler_config)
+
+                async for result in crawl_results:
+                    if result.success:
+                        canonical_url = extract_canonical_link(result.html, result.url, lowercase_paths) or canonicalize(result.url)
+                        stages = timings.take(result.url, getattr(result, "redirected_url", None))
+                        if canonical_url in saved_urls:
+                            checkpoint.mark_processed(result.url)
+                            print(f"↪ Duplicate of {canonical_url}: {result.url}")
+                            continue
+                        saved_urls.add(canonical_url)
+
+                        await writer.submit(
+                            {
+                                # 매니페스트 키, 파일 경로, 헤더는 정규 URL 기준
+                                "url": canonical_url,
+                                "fetched_url": result.url,
+                                "depth": (result.metadata or {}).get("depth", 0),
+                                "score": (result.metadata or {}).get("score", 0),
+                                "headers": result.response_headers,
+                                "markdown": result.markdown.raw_markdown if result.markdown else "",
+                                # HTML 단계가 있는 룰 팩만 HTML을 writer로 넘김
+                                "html": result.cleaned_html if pipeline.needs_html else None,
+                                "fetched_at": utc_now(),
+                                "stages": stages,
+                                "cache_page": _cache_page(result) if cache is not None else None,
+                            }
+                        )
+                    else:
+                        timings.take(result.url, getattr(result, "redirected_url", None))
+                        checkpoint.mark_processed(result.url)
+                        if manifest is not None:
+                            # 일시적인 실패로 기존 기록이 removed 처리되지 않도록
+                            manifest.mark_seen(canonicalize(result.url))
+                        print(f"❌ Failed: {result.url}")
+        except BaseException as e:
+            # 비정상 종료 (브라우저 크래시, 취소 등): 최신 상태를 남겨서 resume 가능하게
+            if manifest is not None:
+                manifest.save()
+            if chunk_writer is not None:
+                # 이번 청크는 임시 파일에 남겨 resume 때 이어서 씀
+                chunk_writer.close()
+            stopped = "Cancelled" if isinstance(e, asyncio.CancelledError) else "Stopped"
+            print(f"⏹️ {stopped} after {len(writer.records)} pages; saved pages kept in {output_path}/ (use resume to continue)")
+            if pack is not None:
+                # footer까지 써야 이번 파일의 페이지가 처리 완료로 체크포인트에 들어감
+                pack.close()
+                pack = None
+            await checkpoint.flush()
+            raise
+        finally:
+            if pack is not None:
+                # 남은 row group과 footer까지 써야 파일을 읽을 수 있음
+                pack.close()
+            if cleaner is not None:
+                cleaner.close()
+
+    results = skipped_records + writer.records
+    checkpoint.clear()
+
+    if manifest is not None:
+        # max_pages에 걸려 중단된 경우 보이지 않은 페이지가 삭제됐다고 단정할 수 없음
+        pages_done = len(results) + (resume_state or {}).get("pages_crawled", 0)
+        if pages_done < max_pages:
+            for removed in manifest.prune_unseen():
+                results.append({"url": removed["url"], "depth": None, "file": removed["file"], "status": "removed"})
+        manifest.save()
+
+        counts = count_statuses(results)
+        print(
+            f"\n✅ Added {counts['added']} | Changed {counts['changed']} | "
+            f"Unchanged {counts['unchanged']} | Removed {counts['removed']}"
+        )
+
+    crawled = [r for r in results if r["status"] != "removed"]
+
+    if dedupe and crawled:
+        # 증분 모드에서는 이전에 판정된 반복 블록도 새 페이지에서 제거
+        known = load_known_boilerplate(output_path) if incremental else None
+        stats = await asyncio.to_thread(
+            dedupe_files,
+            [Path(r["file"]) for r in crawled],
+            output_path,
+            threshold=dedupe_threshold,
+            known=known,
+            # 컨텐츠 저장소 객체는 해시 이름이므로 고치지 않고 새 객체로 다시 연결
+            replace=store.replace if store is not None else None,
+        )
+        saved = 1 - stats["bytes_after"] / stats["bytes_before"] if stats["bytes_before"] else 0.0
+        print(
+            f"🧹 Removed {stats['blocks']} boilerplate blocks from {stats['files_changed']} pages "
+            f"({saved:.0%} smaller)"
+        )
+
+    if store is not None:
+        # dedupe로 교체된 객체도 함께 정리
+        removed_objects = await asyncio.to_thread(store.gc)
+        print(f"🗃️ Content store: {store.duplicates} duplicate pages linked, {removed_objects} stale objects removed")
+
+    if chunk_writer is not None:
+        if dedupe:
+            # dedupe가 끝난 파일 내용으로 나눔
+            await asyncio.to_thread(_chunk_saved_pages, chunk_writer, crawled)
+        removed_urls = [r["url"] for r in results if r["status"] == "removed"]
+        await asyncio.to_thread(chunk_writer.finish, removed_urls)
+        print(f"🧩 Wrote {chunk_writer.chunks} chunks to {output_path / CHUNKS_FILENAME}")
+
+    if search_index and results:
+        if pack is not None:
+            indexed = await asyncio.to_thread(build_search_index, output_path)
+        else:
+            # dedupe가 파일 내용을 바꿨으면 unchanged 페이지도 다시 색인
+            indexed = await asyncio.to_thread(update_search_index, output_path, results, reindex_all=dedupe)
+        print(f"🔎 Indexed {indexed} pages into {output_path / SEARCH_INDEX_FILENAME}")
+    elif not search_index:
+        # 크롤링 중에 검색해서 일부 페이지로 만들어진 인덱스도 지움
+        remove_search_index(output_path)
+
+    # 단계별 시간 집계
+    write_json_atomic(output_path / TIMINGS_FILENAME, timings.report())
+    if timings.pages:
+        print(f"\n⏱️ Stage timings ({output_path / TIMINGS_FILENAME}):\n{timings.format_summary()}")
+
+    # 결과 목록 (큰 크롤링에서 응답 대신 파일로 페이지 목록을 넘기기 위해)
+    await asyncio.to_thread(write_results, output_path, results)
+
+    print(f"\n✅ Crawled {len(crawled)} pages")
+    print(f"✅ Saved to {output_path}/")
+    print(f"📄 Results: {output_path / RESULTS_FILENAME}")
 
-                # URL을 파일 경로로 변환
-                file_path = url_to_filepath(result.url, output_path)
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+    return results
 
-                # 마크다운 정리
-                markdown_content = result.markdown.raw_markdown if result.markdown else ""
-                cleaned_markdown = clean_navigation_content(markdown_content)
 
-                # 파일 저장
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(f"# {result.url}\n\n")
-                    f.write(cleaned_markdown)
+async def _crawl_urls(
+    crawler: AsyncWebCrawler,
+    urls: list[str],
+    crawler_config: CrawlerRunConfig,
+    scheduler: HostScheduler | None,
+    checkpoint: CrawlCheckpoint,
+):
+    """정해진 URL 목록을 링크 탐색 없이 동시에 크롤링 (완료 순서대로 yield)
 
-                print(f"✅ Depth {depth} | Score: {score:.2f} | {file_path}")
-                results.append({"url": result.url, "depth": depth, "file": str(file_path)})
+    스케줄러가 있으면 PoliteCrawler를 거치고, 없으면 crawl4ai 기본 디스패처를 쓴다.
+    Deep Crawl 전략의 상태 콜백 대신 처리한 URL을 체크포인트에 주기적으로 남긴다.
+    """
+    if not urls:
+        return
+
+    fetcher = PoliteCrawler(crawler, scheduler) if scheduler is not None else crawler
+    stream_config = crawler_config.clone(stream=True)
+
+    async for result in await fetcher.arun_many(urls, config=stream_config):
+        yield result
+        await checkpoint.on_state_change({"strategy_type": "sitemap", "pages_crawled": len(checkpoint.processed)})
+
+
+def _write_page(
+    page: dict,
+    output_path: Path,
+    manifest: CrawlManifest | None,
+    checkpoint: CrawlCheckpoint,
+    pipeline: CleaningPipeline,
+    store: ContentStore | None = None,
+    pack=None,
+    chunker: ChunkWriter | None = None,
+    timings: StageTimings | None = None,
+    cache: PageCache | None = None,
+    cache_preset: str = "default",
+) -> dict:
+    """페이지 하나를 정리해서 저장 (PageWriter 워커 스레드에서 실행)
+
+    증분 모드(manifest 지정)에서는 검증자나 컨텐츠 해시가 같으면 쓰기를 생략한다.
+    컨텐츠 저장소(store 지정)를 쓰면 같은 원문은 정리하지 않고 기존 객체에 연결한다.
+    단일 파일 출력(pack 지정)이면 .md 파일 대신 pack에 레코드를 추가한다.
+    chunker가 있으면 새로 저장한 페이지를 청크로 나눠 기록한다 (unchanged 페이지는 제외).
+    timings가 있으면 정리(clean)와 나머지 저장 작업(write) 시간을 페이지의 fetch/scrape
+    시간과 함께 기록한다 (정리를 건너뛴 페이지는 clean 없음).
+    cache가 있으면 가져온 페이지를 페이지 캐시에 저장한다 (요청 URL 기준).
+
+    Returns:
+        결과 레코드 (url, depth, file, status)
+    """
+    url = page["url"]
+    headers = page["headers"]
+    started = time.perf_counter()
+    clean_seconds = None
+
+    if cache is not None:
+        cache.put(page["fetched_url"], cache_preset, page["cache_page"])
+
+    if pack is not None:
+        cleaned_markdown, clean_seconds = _clean_page(page, pipeline)
+        # Parquet은 footer를 쓴 뒤(close)에야 처리 완료로 기록해야 강제 종료 후 resume에서 누락이 없음
+        file_path = pack.write(
+            {
+                "url": url,
+                "depth": page["depth"],
+                "score": page["score"],
+                "fetched_at": page["fetched_at"],
+                "content_hash": content_hash(cleaned_markdown),
+                "markdown": cleaned_markdown,
+            },
+            on_saved=partial(checkpoint.mark_processed, page["fetched_url"]),
+        )
+        status = "added"
+    elif manifest is not None and manifest.validators_match(url, headers):
+        # ETag/Last-Modified가 같으면 정리/저장 생략
+        manifest.mark_unchanged(url, headers)
+        file_path = manifest.file_for(url)
+        status = "unchanged"
+    else:
+        cleaned_markdown = None
+        digest = None
+        raw_digest = None
+
+        if store is not None:
+            # 다른 URL에서 같은 원문을 이미 정리했으면 그 결과를 재사용
+            raw_digest = raw_hash(page["markdown"])
+            digest = store.digest_for_raw(raw_digest)
+
+        if digest is None:
+            # 마크다운 정리
+            cleaned_markdown, clean_seconds = _clean_page(page, pipeline)
+            if manifest is not None or store is not None:
+                digest = content_hash(cleaned_markdown)
+
+        if manifest is not None and manifest.hash_matches(url, digest):
+            # 내용이 같으면 파일을 다시 쓰지 않음
+            manifest.mark_unchanged(url, headers)
+            file_path = manifest.file_for(url)
+            status = "unchanged"
+        else:
+            if store is None:
+                file_path = _save_markdown(url, cleaned_markdown, output_path)
             else:
-                print(f"❌ Failed: {result.url}")
+                if cleaned_markdown is not None:
+                    store.put(digest, _page_text(url, cleaned_markdown), raw_digest)
+                file_path = store.link(url_to_filepath(url, output_path), digest)
 
-    print(f"\n✅ Crawled {len(results)} pages")
-    print(f"✅ Saved to {output_path}/")
+            status = manifest.record(url, file_path, digest, headers) if manifest is not None else "added"
 
-    return results
+    if chunker is not None and status != "unchanged":
+        if cleaned_markdown is None:
+            # 컨텐츠 저장소의 기존 객체에 연결된 페이지
+            cleaned_markdown = _read_page_markdown(Path(file_path))
+        chunker.write(url, str(file_path), cleaned_markdown, chunks=page.get("chunks"))
+
+    if timings is not None:
+        stages = dict(page.get("stages") or {})
+        if clean_seconds is not None:
+            stages["clean"] = clean_seconds
+        stages["write"] = time.perf_counter() - started - (clean_seconds or 0.0)
+        timings.page_done(url, stages)
+
+    # 파일까지 써진 뒤에 처리 완료로 기록해야 resume 시 누락이 없음 (단일 파일은 on_saved에서)
+    if pack is None:
+        checkpoint.mark_processed(page["fetched_url"])
+
+    status_label = f" | {status}" if manifest is not None else ""
+    print(f"✅ Depth {page['depth']} | Score: {page['score']:.2f}{status_label} | {file_path}")
+    return {"url": url, "depth": page["depth"], "file": str(file_path), "status": status}
+
+
+def _clean_page(page: dict, pipeline: CleaningPipeline) -> tuple[str, float]:
+    """페이지 정리 (CleaningPool이 미리 정리했으면 그 결과 사용)
+
+    Returns:
+        (정리된 마크다운, 정리 시간(초))
+    """
+    if "cleaned" in page:
+        return page["cleaned"], page["clean_seconds"]
+    start = time.perf_counter()
+    cleaned_markdown = pipeline.run(page["markdown"], html=page["html"], url=page["url"])
+    return cleaned_markdown, time.perf_counter() - start
+
+
+def _preclean_pages(
+    pages: list[dict],
+    cleaner: CleaningPool,
+    manifest: CrawlManifest | None,
+    store: ContentStore | None,
+) -> None:
+    """PageWriter 묶음 중 정리가 필요한 페이지를 워커 프로세스에서 한 번에 정리
+
+    _write_page가 정리를 건너뛸 페이지(검증자가 같은 unchanged 페이지, 컨텐츠 저장소에
+    같은 원문이 있는 페이지)는 보내지 않는다.
+    """
+    todo = [
+        page
+        for page in pages
+        if not (manifest is not None and manifest.validators_match(page["url"], page["headers"]))
+        and not (store is not None and store.has_raw(raw_hash(page["markdown"])))
+    ]
+    cleaner.clean_pages(todo)
+
+
+def _chunk_saved_pages(chunker: ChunkWriter, records: list[dict]) -> None:
+    """저장된 .md 파일들을 읽어 청크로 기록"""
+    for r in records:
+        chunker.write(r["url"], r["file"], _read_page_markdown(Path(r["file"])))
+
+
+def count_statuses(results: list[dict]) -> dict[str, int]:
+    """크롤링 결과의 status별 개수"""
+    counts = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    return counts
 
 
 if __name__ == "__main__":
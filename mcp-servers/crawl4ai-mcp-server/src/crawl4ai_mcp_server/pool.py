@@ -0,0 +1,80 @@
+"""Long-lived crawler pool shared across MCP tool calls."""
+
+import asyncio
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+
+def _is_healthy(crawler: AsyncWebCrawler) -> bool:
+    """크롤러의 브라우저가 아직 살아있는지 확인
+
+    crawl4ai 내부 구조가 버전마다 조금씩 달라서 속성은 모두 getattr로 접근한다.
+    확인할 수 없는 경우 정상으로 간주한다.
+    """
+    if not getattr(crawler, "ready", False):
+        return False
+
+    strategy = getattr(crawler, "crawler_strategy", None)
+    browser_manager = getattr(strategy, "browser_manager", None)
+    browser = getattr(browser_manager, "browser", None)
+    if browser is not None and not browser.is_connected():
+        return False
+
+    return True
+
+
+async def _safe_close(crawler: AsyncWebCrawler) -> None:
+    """이미 죽은 브라우저를 닫다가 발생하는 예외는 무시"""
+    try:
+        await crawler.close()
+    except Exception as e:
+        print(f"⚠️ Failed to close crawler: {e}")
+
+
+class CrawlerPool:
+    """BrowserConfig 프리셋별로 AsyncWebCrawler를 재사용하는 풀
+
+    - 첫 요청 시 브라우저를 띄우고 (lazy), 이후 호출은 같은 인스턴스를 공유
+    - 가져올 때마다 헬스체크, 브라우저가 죽었으면 새로 띄움
+    - close()로 모든 브라우저 종료 (서버 종료 시)
+    """
+
+    def __init__(self):
+        self._crawlers: dict[str, AsyncWebCrawler] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, preset: str, browser_config: BrowserConfig) -> AsyncWebCrawler:
+        """프리셋에 해당하는 크롤러 반환 (없거나 죽었으면 새로 시작)
+
+        Args:
+            preset: 프리셋 이름 (예: "fast", "stealth")
+            browser_config: 크롤러를 새로 띄울 때 사용할 브라우저 설정
+
+        Returns:
+            시작된 AsyncWebCrawler (호출자가 닫으면 안 됨)
+        """
+        lock = self._locks.setdefault(preset, asyncio.Lock())
+
+        async with lock:
+            crawler = self._crawlers.get(preset)
+
+            if crawler is not None and not _is_healthy(crawler):
+                print(f"⚠️ Crawler '{preset}' is unhealthy, restarting")
+                self._crawlers.pop(preset, None)
+                await _safe_close(crawler)
+                crawler = None
+
+            if crawler is None:
+                crawler = AsyncWebCrawler(config=browser_config)
+                await crawler.start()
+                self._crawlers[preset] = crawler
+
+            return crawler
+
+    async def close(self) -> None:
+        """풀에 있는 모든 크롤러 종료"""
+        crawlers = list(self._crawlers.values())
+        self._crawlers.clear()
+
+        for crawler in crawlers:
+            await _safe_close(crawler)
@@ -6,12 +6,27 @@ Run with:
     uv run mcp run mcp_server.py
 """
 
+import asyncio
+import json
 import sys
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 
-from .core import crawl_documentation, crawl_single_page
+from .core import count_statuses, crawl_documentation, crawl_pages as crawl_pages_core, crawl_single_page
 from .configs.browser import FAST_CONFIG, STEALTH_CONFIG
-from mcp.server.fastmcp import FastMCP
+from .pool import CrawlerPool
+from .storage.packed import OUTPUT_FORMATS
+from .storage.page_cache import PageCache
+from .storage.results import RESULTS_FILENAME, RESULTS_SUMMARY_FILENAME, read_results, summarize_results
+from .strategies.chunking import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_TOKENS
+from .strategies.content import check_footer_patterns
+from .storage.search_index import search_pages
+from .strategies.http_fetch import HttpFetcher
+from .strategies.rule_packs import list_rule_packs
+from .strategies.timing import StageTimings
+from .utils.domain import extract_domain, extract_output_dir_name
+from mcp.server.fastmcp import Context, FastMCP
 
 # Redirect print to stderr (STDIO transport uses stdout for JSON-RPC)
 _original_print = print
@@ -33,21 +48,88 @@ def _get_browser_config(stealth: bool):
     return STEALTH_CONFIG if stealth else FAST_CONFIG
 
 
+# 서버 수명 동안 유지되는 크롤러 풀 (프리셋별 브라우저 재사용)
+_pool = CrawlerPool()
+
+# 브라우저 없이 먼저 시도하는 HTTP 단계 (커넥션 풀 재사용, 단계별 통계 집계)
+_fetcher = HttpFetcher()
+
+# 디스크 페이지 캐시 (crawl_page / crawl_pages가 읽고, crawl_docs까지 세 도구가 채움)
+_cache = PageCache()
+
+# crawl_docs가 summary를 지정하지 않았을 때 페이지 목록 대신 요약을 돌려주는 결과 수
+SUMMARY_THRESHOLD = 200
+
+# 요약 응답에 보여주는 URL 디렉토리 rollup 수 (전체는 crawl-results.summary.json)
+SUMMARY_TOP_DIRECTORIES = 20
+
+
+def _preset(stealth: bool) -> str:
+    """stealth 옵션에 해당하는 프리셋 이름 (크롤러 풀과 페이지 캐시의 키)"""
+    return "stealth" if stealth else "fast"
+
+
+async def _get_crawler(stealth: bool):
+    """stealth 옵션에 해당하는 프리셋의 공유 크롤러 반환"""
+    return await _pool.get(_preset(stealth), _get_browser_config(stealth))
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """서버 종료 시 풀에 남아있는 브라우저와 HTTP 커넥션, 캐시 DB 정리"""
+    try:
+        yield
+    finally:
+        await _fetcher.close()
+        await _pool.close()
+        _cache.close()
+
+
 # Create MCP server instance
 mcp = FastMCP(
     name="crawl4ai-mcp-server",
+    lifespan=_lifespan,
     instructions="""Crawl4AI MCP Server - Web document crawling tools.
 
 Available tools:
 - crawl_page: Crawl a single page and return markdown content
+- crawl_pages: Crawl a list of pages concurrently with one shared browser
 - crawl_docs: Recursively crawl documentation sites (Deep Crawl)
+- crawl_stats: Show how many pages were served by plain HTTP vs. the browser
+- cache_stats: Show the on-disk page cache size, TTLs and hit/miss counts
+- search_docs: Full-text search over a crawl_docs output_dir (no browser, no network)
+- crawl_results: Page through the page list of the last crawl_docs run (filter by status or directory)
 
 Use crawl_page for single page content extraction.
+Use crawl_pages when you already know the URLs (one call instead of many crawl_page calls).
 Use crawl_docs for crawling entire documentation sites with link following.
+Use search_docs to find the relevant pages of an already crawled site instead of reading every file.
+Use crawl_results to list what a large crawl_docs run saved (e.g. only changed pages) page by page.
+crawl_docs reports each saved page as a progress notification and log message while it
+runs; cancel the request to stop early (saved pages are kept).
+
+crawl_page and crawl_pages fetch over plain HTTP first and only launch the browser
+for pages that look JavaScript-rendered (empty app root, too little text).
+Pages fetched by any of the crawl tools are kept in an on-disk cache, so repeated
+crawl_page / crawl_pages lookups of the same URL return without fetching; pass
+max_age (seconds, 0 = always refetch) to control how old a cached page may be.
 
 Options:
-- stealth: Enable stealth mode (playwright-stealth) for sites with bot detection
-- strategy: Choose crawl strategy - "bfs" (breadth-first, default) or "dfs" (depth-first)""",
+- stealth: Enable stealth mode (playwright-stealth) for sites with bot detection (always uses the browser)
+- strategy: Choose crawl strategy - "bfs" (breadth-first, default), "dfs" (depth-first),
+  "best_first" (follow links whose URL matches `keywords` first; best with a small max_pages)
+  or "sitemap" (fetch the URLs listed in the site's sitemap, no link following; fastest)
+- keywords / score_threshold: Relevance keywords for best_first and the minimum score to follow a link
+- incremental: Re-crawl into an existing output_dir and only rewrite changed pages
+- resume: Continue an interrupted (or cancelled) crawl_docs run from its checkpoint
+- max_per_host / min_delay / respect_crawl_delay: Be polite to the origin (adaptive 429/503 backoff)
+- rule_pack: Content-cleaning rule pack (auto-selected by domain when omitted)
+- dedupe: Strip blocks repeated across most crawled pages (sidebars, banners) to save tokens
+- content_store: Store identical pages once (URL files become links to shared objects)
+- output_format: Write one packed jsonl / jsonl.zst / parquet file instead of a .md tree (large corpora)
+- search_index: Build the search_docs index while crawling (otherwise built on the first search)
+- chunks: Write heading-aware retrieval chunks (chunks.jsonl) while crawling
+- lowercase_paths: Treat URL paths case-insensitively (/Foo and /foo are one page)""",
 )
 
 
@@ -56,6 +138,7 @@ async def crawl_page(
     url: str,
     output_dir: str | None = None,
     stealth: bool = False,
+    max_age: float | None = None,
 ) -> str:
     """Crawl a single web page and return cleaned markdown content.
 
@@ -66,17 +149,109 @@ async def crawl_page(
         stealth: Enable stealth mode to bypass bot detection.
                 Uses playwright-stealth with random user-agent.
                 Slower but needed for sites that block automated crawlers.
+                Without stealth the page is fetched over plain HTTP first and the
+                browser is only used for JavaScript-rendered pages.
+        max_age: Maximum age in seconds of a cached copy to return instead of fetching.
+                Defaults to the domain's cache TTL (24 h unless configured);
+                0 always fetches a fresh copy (and updates the cache).
 
     Returns:
         Cleaned markdown content of the page
     """
-    browser_config = _get_browser_config(stealth)
-    markdown = await crawl_single_page(url, output_dir, browser_config=browser_config)
+    if max_age is not None and max_age < 0:
+        return f"Invalid max_age: {max_age}. Use seconds >= 0."
+
+    # 브라우저는 HTTP 단계에서 처리하지 못했을 때만 풀에서 가져옴
+    markdown = await crawl_single_page(
+        url,
+        output_dir,
+        crawler=partial(_get_crawler, stealth),
+        http_first=not stealth,
+        fetcher=_fetcher,
+        cache=_cache,
+        cache_preset=_preset(stealth),
+        max_age=max_age,
+    )
     if not markdown:
         return f"Failed to crawl: {url}"
     return markdown
 
 
+@mcp.tool()
+async def crawl_pages(
+    urls: list[str],
+    output_dir: str | None = None,
+    concurrency: int = 5,
+    stealth: bool = False,
+    max_age: float | None = None,
+    ctx: Context = None,
+) -> str:
+    """Crawl multiple web pages concurrently and return their cleaned markdown.
+
+    Pages are fetched over plain HTTP first; only JavaScript-rendered pages go
+    to the browser. All of those share one browser; at most `concurrency` tabs
+    are open at a time.
+    Each finished page is reported as a log message while the batch runs.
+
+    Args:
+        urls: The URLs to crawl (duplicates are crawled once)
+        output_dir: Optional directory to save markdown files.
+                   If provided, returns a per-URL summary with file paths.
+                   If not provided, returns the markdown of every page.
+        concurrency: Maximum number of pages fetched at the same time (default: 5)
+        stealth: Enable stealth mode to bypass bot detection.
+                Uses playwright-stealth with random user-agent.
+        max_age: Maximum age in seconds of cached copies to return instead of fetching.
+                Defaults to each domain's cache TTL; 0 always fetches fresh copies.
+
+    Returns:
+        Per-URL success/failure summary (and markdown content when output_dir is not set)
+    """
+    if not urls:
+        return "No URLs given."
+
+    if max_age is not None and max_age < 0:
+        return f"Invalid max_age: {max_age}. Use seconds >= 0."
+
+    results = []
+
+    async for r in crawl_pages_core(
+        urls,
+        output_dir,
+        concurrency=concurrency,
+        crawler=partial(_get_crawler, stealth),
+        http_first=not stealth,
+        fetcher=_fetcher,
+        cache=_cache,
+        cache_preset=_preset(stealth),
+        max_age=max_age,
+    ):
+        results.append(r)
+        if ctx is not None:
+            status = "ok" if r["success"] else f"failed ({r['error']})"
+            await ctx.info(f"[{len(results)}/{len(urls)}] {r['url']}: {status}")
+            await ctx.report_progress(len(results), len(urls))
+
+    succeeded = [r for r in results if r["success"]]
+    failed = [r for r in results if not r["success"]]
+
+    summary_lines = [f"Crawled {len(succeeded)}/{len(results)} pages:\n"]
+    for r in succeeded:
+        target = f" -> {r['file']}" if r["file"] else ""
+        summary_lines.append(f"- ✅ {r['url']}{target}")
+    for r in failed:
+        summary_lines.append(f"- ❌ {r['url']}: {r['error']}")
+
+    if output_dir:
+        return "\n".join(summary_lines)
+
+    # 저장하지 않는 경우 페이지별 마크다운을 함께 반환
+    sections = ["\n".join(summary_lines)]
+    for r in succeeded:
+        sections.append(f"# {r['url']}\n\n{r['markdown']}")
+    return "\n\n---\n\n".join(sections)
+
+
 @mcp.tool()
 async def crawl_docs(
     url: str,
@@ -86,10 +261,36 @@ async def crawl_docs(
     url_prefix: str | None = None,
     strategy: str = "bfs",
     stealth: bool = False,
+    incremental: bool = False,
+    resume: bool = False,
+    max_per_host: int | None = None,
+    min_delay: float | None = None,
+    respect_crawl_delay: bool = False,
+    footer_patterns: list[str] | None = None,
+    rule_pack: str | None = None,
+    dedupe: bool = False,
+    dedupe_threshold: float = 0.5,
+    content_store: bool = False,
+    keywords: list[str] | None = None,
+    score_threshold: float = 0.0,
+    output_format: str = "markdown",
+    search_index: bool = False,
+    chunks: bool = False,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    summary: bool | None = None,
+    clean_workers: int = 0,
+    lowercase_paths: bool = False,
+    ctx: Context = None,
 ) -> str:
     """Recursively crawl a documentation site (Deep Crawl).
 
     Follows links within the same domain and saves each page as a markdown file.
+    Every fetched page is also stored in the page cache, so crawl_page / crawl_pages
+    lookups of those URLs afterwards return without fetching.
+    Each saved page is reported while the crawl runs (progress notification plus a
+    log message with the page count, depth and file). Cancelling the request stops
+    the crawl; pages saved so far stay in output_dir and resume=True continues from there.
 
     Args:
         url: The starting URL to crawl
@@ -103,16 +304,124 @@ async def crawl_docs(
         strategy: Crawl strategy - "bfs" (breadth-first, default) or "dfs" (depth-first).
                  BFS explores all links at one depth before going deeper.
                  DFS explores as deep as possible before backtracking.
+                 "best_first" crawls links whose URL contains the most `keywords` first,
+                 so a limited max_pages budget goes to the relevant section.
+                 "sitemap" reads the site's sitemap (robots.txt Sitemap:, /sitemap.xml,
+                 or url itself if it is a .xml/.xml.gz sitemap) and fetches those URLs
+                 concurrently without link discovery. max_depth is ignored; with
+                 incremental, pages whose <lastmod> predates the last check are skipped.
         stealth: Enable stealth mode to bypass bot detection.
                 Uses playwright-stealth with random user-agent.
+        incremental: Only rewrite pages that changed since the last crawl into output_dir.
+                    Uses a manifest in output_dir (ETag/Last-Modified + content hash)
+                    and reports added/changed/unchanged/removed counts.
+        resume: Continue an interrupted crawl from its checkpoint
+               ({output_dir}.checkpoint.json, saved periodically during the crawl)
+               instead of starting over from url. Use the same url, output_dir and strategy.
+        max_per_host: Optional cap on concurrent requests to one host.
+        min_delay: Optional minimum delay in seconds between requests to one host.
+        respect_crawl_delay: Honor the Crawl-delay in the site's robots.txt.
+                            Setting any of these three enables adaptive backoff:
+                            429/503 responses slow the host down and are retried.
+        footer_patterns: Optional site-specific regexes marking where the page footer starts.
+                        The last matching line and everything below it are dropped.
+                        Defaults to the rule pack's patterns ("Was this page helpful?", "[Next ...]", ...).
+        rule_pack: Optional content-cleaning rule pack name. Defaults to the pack
+                  registered for the site's domain ("default" otherwise).
+                  "semantic" also drops nav/header/footer/aside from the HTML;
+                  "minimal" only collapses blank lines.
+        dedupe: After the crawl, remove paragraphs/blocks that repeat across pages
+               (sidebars, "ON THIS PAGE" lists, version banners). Headings and code
+               blocks are kept. Shrinks the corpus for LLM use.
+        dedupe_threshold: Fraction of pages (0-1] a block must appear on to be removed (default: 0.5).
+        content_store: Write each distinct page body once under its content hash
+                      ({output_dir}/.objects/) and make the per-URL files links to it.
+                      Pages served under several URLs (trailing slash, index.html,
+                      query variants) are detected at crawl time and not re-cleaned.
+        keywords: Relevance keywords for strategy="best_first", matched against link URLs
+                 (e.g. ["api", "authentication"]). Defaults to generic docs keywords
+                 (guide, tutorial, api, reference, ...).
+        score_threshold: For strategy="best_first", skip links whose URL matches less than
+                        this fraction of the keywords (0-1, default 0 = follow every link,
+                        only reorder). Prunes irrelevant branches early.
+        output_format: "markdown" (default, one .md file per URL) or a single packed file
+                      in output_dir: "jsonl", "jsonl.zst" (zstd, needs zstandard) or
+                      "parquet" (needs pyarrow). Records hold url, depth, score, fetched_at,
+                      content_hash and markdown; pages.index.jsonl maps each URL to its
+                      offset so one page can be read without scanning the file.
+                      Not combinable with incremental, dedupe or content_store.
+        search_index: After the crawl, update the full-text index in output_dir
+                     (.search-index.sqlite) used by search_docs. Incremental runs only
+                     re-index added/changed pages. When this is off, an existing index
+                     in output_dir is deleted (it would miss the re-crawled pages) and
+                     search_docs rebuilds it from the saved pages on first use.
+        chunks: Split each saved page along heading boundaries into retrieval chunks
+               and write them to {output_dir}/chunks.jsonl (one JSON object per line:
+               id, url, file, index, heading_path, tokens, text). IDs are stable across
+               re-crawls (URL + heading path + position in the section), so downstream
+               ingestion does not need to re-parse the markdown.
+        chunk_tokens: Target chunk size in estimated tokens (default: 512).
+        chunk_overlap: Max tokens repeated from the previous chunk of the same section (default: 64).
+        summary: Return aggregate stats instead of listing every page: counts by status
+                and depth, the URL directories with the most pages, and the path of the
+                full listing ({output_dir}/crawl-results.jsonl, one page per line) to read
+                with crawl_results page by page. Defaults to on when the crawl returns
+                more than 200 pages, so large crawls do not produce a huge response.
+        clean_workers: Run content cleaning (rule pack HTML pruning + markdown cleanup) and
+                      chunking in this many worker processes instead of the writer threads
+                      (default 0 = threads). Pages are sent in batches. Use about the number
+                      of CPU cores when large pages make cleaning the bottleneck.
+        lowercase_paths: Lowercase URL paths when deduplicating links, matching url_prefix
+                        and naming output files, so /Docs/Intro and /docs/intro are crawled
+                        once (pages are still requested by their original link). Only use this
+                        for sites that serve paths case-insensitively (default: False).
 
     Returns:
-        Summary of crawled pages with URLs and file paths
+        Summary of crawled pages with URLs and file paths (or aggregate stats in summary
+        mode), followed by per-stage timings (fetch / scrape / clean / write: count, p50,
+        p95, total) as JSON. The full report with histograms is saved to
+        {output_dir}/.crawl-timings.json.
     """
-    if strategy not in ("bfs", "dfs"):
-        return f"Invalid strategy: {strategy}. Use 'bfs' or 'dfs'."
+    if strategy not in ("bfs", "dfs", "best_first", "sitemap"):
+        return f"Invalid strategy: {strategy}. Use 'bfs', 'dfs', 'best_first' or 'sitemap'."
+
+    if output_format not in OUTPUT_FORMATS:
+        return f"Invalid output_format: {output_format}. Use one of: {', '.join(OUTPUT_FORMATS)}."
+
+    if output_format != "markdown" and (incremental or dedupe or content_store):
+        return "incremental, dedupe and content_store require output_format='markdown'."
+
+    if not 0 <= score_threshold <= 1:
+        return f"Invalid score_threshold: {score_threshold}. Use a value in [0, 1]."
+
+    if rule_pack and rule_pack not in list_rule_packs():
+        return f"Invalid rule_pack: {rule_pack}. Use one of: {', '.join(list_rule_packs())}."
+
+    if footer_patterns:
+        try:
+            check_footer_patterns(footer_patterns)
+        except ValueError as e:
+            return f"Invalid footer_patterns: {e}"
+
+    if not 0 < dedupe_threshold <= 1:
+        return f"Invalid dedupe_threshold: {dedupe_threshold}. Use a value in (0, 1]."
 
-    browser_config = _get_browser_config(stealth)
+    if clean_workers < 0:
+        return f"Invalid clean_workers: {clean_workers}. Use 0 (threads) or a positive process count."
+
+    if chunks and not 0 <= chunk_overlap < chunk_tokens:
+        return f"Invalid chunk sizes: chunk_tokens={chunk_tokens}, chunk_overlap={chunk_overlap}. Use 0 <= chunk_overlap < chunk_tokens."
+
+    async def report_progress(progress: dict) -> None:
+        depth = progress["depth"] if progress["depth"] is not None else "-"
+        await ctx.info(
+            f"[{progress['done']}/{progress['total']}] depth {depth} | {progress['url']} -> {progress['file']}"
+            f" ({progress['status']})"
+        )
+        await ctx.report_progress(progress["done"], progress["total"])
+
+    timings = StageTimings()
+    crawler = await _get_crawler(stealth)
     results = await crawl_documentation(
         start_url=url,
         output_dir=output_dir,
@@ -120,27 +429,228 @@ async def crawl_docs(
         max_depth=max_depth,
         url_prefix=url_prefix,
         strategy=strategy,
-        browser_config=browser_config,
+        crawler=crawler,
+        incremental=incremental,
+        resume=resume,
+        max_per_host=max_per_host,
+        min_delay=min_delay,
+        respect_crawl_delay=respect_crawl_delay,
+        footer_patterns=footer_patterns,
+        rule_pack=rule_pack,
+        dedupe=dedupe,
+        dedupe_threshold=dedupe_threshold,
+        content_store=content_store,
+        keywords=keywords,
+        score_threshold=score_threshold,
+        on_progress=report_progress if ctx is not None else None,
+        output_format=output_format,
+        search_index=search_index,
+        chunks=chunks,
+        chunk_tokens=chunk_tokens,
+        chunk_overlap=chunk_overlap,
+        stage_timings=timings,
+        clean_workers=clean_workers,
+        cache=_cache,
+        cache_preset=_preset(stealth),
+        lowercase_paths=lowercase_paths,
     )
 
-    if not results:
+    crawled = [r for r in results if r["status"] != "removed"]
+    if not crawled:
         return f"No pages crawled from: {url}"
 
-    # Format results as summary
-    summary_lines = [f"Crawled {len(results)} pages:\n"]
+    if summary is None:
+        summary = len(results) > SUMMARY_THRESHOLD
+
+    if summary:
+        summary_lines = _format_results_summary(results, output_dir or extract_output_dir_name(extract_domain(url)))
+    else:
+        summary_lines = _format_results_list(results, incremental, output_dir)
+
+    # 단계별 시간 (히스토그램은 파일에만, 응답에는 요약만)
+    report = timings.report()
+    stage_summary = {
+        stage: {k: v for k, v in stats.items() if k != "histogram"}
+        for stage, stats in report["stages"].items()
+        if stats["count"]
+    }
+    summary_lines.append(
+        f"\nStage timings ({report['pages']} pages, wall {report['wall_ms'] / 1000:.1f} s):\n"
+        + json.dumps(stage_summary, indent=2)
+    )
+
+    return "\n".join(summary_lines)
+
+
+def _format_results_list(results: list[dict], incremental: bool, output_dir: str | None) -> list[str]:
+    """crawl_docs 응답: 페이지마다 한 줄"""
+    crawled = [r for r in results if r["status"] != "removed"]
+
+    summary_lines = [f"Crawled {len(crawled)} pages:\n"]
+    if incremental:
+        counts = count_statuses(results)
+        summary_lines = [
+            f"Crawled {len(crawled)} pages "
+            f"(added {counts['added']}, changed {counts['changed']}, "
+            f"unchanged {counts['unchanged']}, removed {counts['removed']}):\n"
+        ]
+
     for r in results:
-        summary_lines.append(f"- [{r['depth']}] {r['url']} -> {r['file']}")
+        status = f" ({r['status']})" if incremental else ""
+        depth = r["depth"] if r["depth"] is not None else "-"
+        summary_lines.append(f"- [{depth}] {r['url']} -> {r['file']}{status}")
 
     # Add output directory info
-    if results:
-        output_path = Path(results[0]["file"]).parent
+    if crawled:
+        output_path = Path(crawled[0]["file"]).parent
         while output_path.parent != output_path and output_path.name != output_dir:
             if output_path.parent.name == "":
                 break
             output_path = output_path.parent
         summary_lines.append(f"\nSaved to: {output_path}/")
 
-    return "\n".join(summary_lines)
+    return summary_lines
+
+
+def _format_results_summary(results: list[dict], output_dir: str) -> list[str]:
+    """crawl_docs 요약 응답: 상태별 / 깊이별 개수, 페이지가 많은 URL 디렉토리, 결과 목록 경로"""
+    stats = summarize_results(results)
+    output_path = Path(output_dir)
+    crawled = stats["total"] - stats["statuses"].get("removed", 0)
+
+    statuses = ", ".join(f"{status} {n}" for status, n in stats["statuses"].items())
+    depths = ", ".join(f"{depth}: {n}" for depth, n in stats["depths"].items())
+    lines = [
+        f"Crawled {crawled} pages ({statuses}).",
+        f"Pages by depth: {depths}",
+        f"\nTop directories ({min(len(stats['directories']), SUMMARY_TOP_DIRECTORIES)} of {len(stats['directories'])}):",
+    ]
+    for directory, rollup in list(stats["directories"].items())[:SUMMARY_TOP_DIRECTORIES]:
+        counts = ", ".join(f"{status} {n}" for status, n in rollup.items() if status != "pages")
+        lines.append(f"- {directory}: {rollup['pages']} pages ({counts})")
+
+    lines.append(
+        f"\nFull listing: {output_path / RESULTS_FILENAME} ({stats['total']} lines: url, depth, file, status)"
+        f"\nAll directory rollups: {output_path / RESULTS_SUMMARY_FILENAME}"
+        f"\nUse crawl_results(output_dir=\"{output_path}\", page=1) to list pages."
+        f"\nSaved to: {output_path}/"
+    )
+    return lines
+
+
+@mcp.tool()
+async def search_docs(query: str, output_dir: str, k: int = 10) -> str:
+    """Full-text search over documentation saved by crawl_docs.
+
+    Uses a local SQLite FTS5 index in output_dir (BM25 ranking, title matches
+    weigh more than body matches). No browser or network access; the index is
+    built from the saved pages on first use if crawl_docs ran without search_index.
+    Pages containing every query word rank first; if none do, pages containing
+    any of the words are returned.
+
+    Args:
+        query: Search words (e.g. "authentication token refresh")
+        output_dir: The crawl_docs output directory to search
+        k: Maximum number of results (default: 10)
+
+    Returns:
+        Ranked results with title, URL, saved file and a matching snippet
+    """
+    if not query.strip():
+        return "Empty query."
+
+    if k < 1:
+        return f"Invalid k: {k}. Use a value >= 1."
+
+    if not Path(output_dir).is_dir():
+        return f"Output directory not found: {output_dir}. Run crawl_docs first."
+
+    results = await asyncio.to_thread(search_pages, Path(output_dir), query, k)
+    if not results:
+        return f"No pages match: {query}"
+
+    lines = [f"Found {len(results)} pages for: {query}\n"]
+    for i, r in enumerate(results, 1):
+        lines.append(f"{i}. {r['title']} — {r['url']}")
+        if r["file"]:
+            lines.append(f"   file: {r['file']}")
+        lines.append(f"   {r['snippet']}")
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def crawl_results(
+    output_dir: str,
+    page: int = 1,
+    page_size: int = 100,
+    status: str | None = None,
+    directory: str | None = None,
+) -> str:
+    """Page through the page listing of the last crawl_docs run in output_dir.
+
+    Reads {output_dir}/crawl-results.jsonl (written by every crawl_docs run) one
+    page at a time, so large crawls can be inspected without one huge response.
+
+    Args:
+        output_dir: The crawl_docs output directory
+        page: 1-based page number (default: 1)
+        page_size: Entries per page (default: 100)
+        status: Only list pages with this status ("added", "changed", "unchanged", "removed")
+        directory: Only list pages under this URL directory (e.g. "/docs/api")
+
+    Returns:
+        One line per page (depth, URL, file, status) with the page position and total count
+    """
+    if page < 1 or page_size < 1:
+        return f"Invalid page/page_size: {page}/{page_size}. Use values >= 1."
+
+    if status is not None and status not in ("added", "changed", "unchanged", "removed"):
+        return f"Invalid status: {status}. Use 'added', 'changed', 'unchanged' or 'removed'."
+
+    if not (Path(output_dir) / RESULTS_FILENAME).is_file():
+        return f"No crawl results in: {output_dir}. Run crawl_docs first."
+
+    items, total = await asyncio.to_thread(read_results, Path(output_dir), page, page_size, status, directory)
+    if not items:
+        return f"No entries on page {page} ({total} matching pages)."
+
+    pages = (total + page_size - 1) // page_size
+    first = (page - 1) * page_size + 1
+    lines = [f"Pages {first}-{first + len(items) - 1} of {total} (page {page}/{pages}):\n"]
+    for r in items:
+        depth = r["depth"] if r["depth"] is not None else "-"
+        lines.append(f"- [{depth}] {r['url']} -> {r['file']} ({r['status']})")
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def crawl_stats() -> str:
+    """Show which fetch tier served the pages crawled by crawl_page / crawl_pages.
+
+    Counts pages served by plain HTTP and by the browser since the server
+    started, and why pages fell back to the browser (js_shell, thin_content,
+    http_403, ...).
+
+    Returns:
+        JSON object with http, browser, http_ratio and fallbacks counts
+    """
+    return json.dumps(_fetcher.stats.as_dict(), indent=2)
+
+
+@mcp.tool()
+async def cache_stats() -> str:
+    """Show the state of the on-disk page cache shared by the crawl tools.
+
+    The cache location is $CRAWL4AI_MCP_CACHE_DIR (default ~/.cache/crawl4ai-mcp-server).
+    Per-domain TTLs are read from ttls.json in that directory
+    ({"docs.example.com": 604800, "news.example.com": 0}; 0 disables caching).
+
+    Returns:
+        JSON object with path, entries, bytes, max_bytes, per-preset entries/bytes,
+        oldest_age_s, default_ttl, domain_ttls and this server's hits, misses,
+        expired, hit_ratio, stores and evictions
+    """
+    return json.dumps(await asyncio.to_thread(_cache.stats), indent=2)
 
 
 def main():
@@ -0,0 +1,59 @@
+"""Storage helpers for crawl output (manifests, on-disk state)."""
+
+from .chunks import CHUNKS_FILENAME, ChunkWriter, iter_chunks
+from .checkpoint import CrawlCheckpoint, checkpoint_path
+from .content_store import OBJECTS_DIRNAME, ContentStore, raw_hash
+from .manifest import MANIFEST_FILENAME, CrawlManifest, content_hash
+from .packed import (
+    OUTPUT_FORMATS,
+    iter_packed_pages,
+    load_pack_index,
+    open_pack_writer,
+    read_packed_page,
+)
+from .page_cache import CACHE_DIR_ENV, TTLS_FILENAME, PageCache, default_cache_dir
+from .results import RESULTS_FILENAME, RESULTS_SUMMARY_FILENAME, read_results, summarize_results, write_results
+from .search_index import (
+    SEARCH_INDEX_FILENAME,
+    SearchIndex,
+    build_search_index,
+    remove_search_index,
+    search_pages,
+    update_search_index,
+)
+from .writer import PageWriter
+
+__all__ = [
+    "CACHE_DIR_ENV",
+    "CHUNKS_FILENAME",
+    "MANIFEST_FILENAME",
+    "OBJECTS_DIRNAME",
+    "OUTPUT_FORMATS",
+    "RESULTS_FILENAME",
+    "RESULTS_SUMMARY_FILENAME",
+    "SEARCH_INDEX_FILENAME",
+    "TTLS_FILENAME",
+    "ChunkWriter",
+    "ContentStore",
+    "CrawlCheckpoint",
+    "CrawlManifest",
+    "PageCache",
+    "PageWriter",
+    "SearchIndex",
+    "build_search_index",
+    "checkpoint_path",
+    "content_hash",
+    "default_cache_dir",
+    "iter_chunks",
+    "iter_packed_pages",
+    "load_pack_index",
+    "open_pack_writer",
+    "raw_hash",
+    "read_packed_page",
+    "read_results",
+    "remove_search_index",
+    "search_pages",
+    "summarize_results",
+    "update_search_index",
+    "write_results",
+]
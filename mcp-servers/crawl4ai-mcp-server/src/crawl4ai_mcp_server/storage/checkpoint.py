@@ -0,0 +1,154 @@
+"""On-disk frontier checkpoint for resumable deep crawls."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from ..utils.fs import write_json_atomic
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    """출력 디렉토리 옆에 두는 체크포인트 파일 경로
+
+    docs_example_com/ -> docs_example_com.checkpoint.json
+    """
+    output_path = Path(output_path)
+    return output_path.parent / f"{output_path.name}.checkpoint.json"
+
+
+class CrawlCheckpoint:
+    """Deep Crawl 전략의 상태(visited, frontier, depths, scores)를 주기적으로 저장
+
+    crawl4ai 전략의 on_state_change 콜백으로 넘겨서 사용한다.
+    콜백은 페이지마다 호출되므로 메모리에는 항상 최신 상태를 두고,
+    디스크에는 interval초마다 원자적으로 쓴다.
+    """
+
+    def __init__(self, path: Path, start_url: str, strategy: str, interval: float = 5.0):
+        self.path = Path(path)
+        self.start_url = start_url
+        self.strategy = strategy
+        self.interval = interval
+        self._state: dict | None = None
+        self._dirty = False
+        self._last_write = 0.0
+        self._processed: set[str] = set()
+
+    def load(self) -> dict | None:
+        """저장된 전략 상태 로드
+
+        시작 URL이나 전략이 다른 체크포인트는 무시한다.
+
+        Returns:
+            crawl4ai 전략의 resume_state로 넘길 dict (없으면 None)
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+        if data.get("start_url") != self.start_url or data.get("strategy") != self.strategy:
+            print(f"⚠️ Ignoring checkpoint {self.path}: different start URL or strategy")
+            return None
+
+        self._processed = set(data.get("processed", []))
+        return data.get("state")
+
+    @property
+    def processed(self) -> set[str]:
+        """처리가 끝난 URL (이전 실행분 포함)"""
+        return self._processed
+
+    def mark_processed(self, url: str) -> None:
+        """처리(저장)가 끝난 URL 기록 (PageWriter 워커 스레드에서도 호출됨)"""
+        self._processed.add(url)
+        self._dirty = True
+
+    async def on_state_change(self, state: dict) -> None:
+        """crawl4ai 전략 콜백: 최신 상태 보관, interval이 지났으면 디스크에 기록"""
+        # depths는 전략이 계속 갱신하는 dict라서 스레드에서 직렬화하기 전에 복사
+        self._state = {**state, "depths": dict(state.get("depths", {}))}
+        self._dirty = True
+
+        if time.monotonic() - self._last_write >= self.interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """보관 중인 최신 상태를 즉시 디스크에 기록"""
+        if not self._dirty or self._state is None:
+            return
+
+        # 워커 스레드가 계속 추가하므로 스냅샷으로 직렬화
+        processed = set(self._processed)
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "start_url": self.start_url,
+            "strategy": self.strategy,
+            "saved_at": time.time(),
+            "state": self._with_unfinished_level(self._state, processed),
+            "processed": sorted(processed),
+        }
+        self._dirty = False
+        self._last_write = time.monotonic()
+        await asyncio.to_thread(write_json_atomic, self.path, data)
+
+    def clear(self) -> None:
+        """크롤링이 정상 종료되면 체크포인트 삭제"""
+        self.path.unlink(missing_ok=True)
+
+    def _with_unfinished_level(self, state: dict, processed: set[str]) -> dict:
+        """BFS 스트리밍 상태에 현재 레벨의 미처리 URL을 frontier로 보충
+
+        crawl4ai의 BFS 상태는 다음 레벨(pending)만 담고 있어서 레벨 중간에
+        중단되면 현재 레벨의 남은 URL이 사라진다. 현재 레벨 URL은 이미 visited에
+        들어가 있으므로 visited - 처리 완료 - pending 이 남은 URL이다.
+        """
+        if state.get("strategy_type") == "best_first":
+            return self._with_unfinished_batch(state, processed)
+        if state.get("strategy_type") != "bfs":
+            return state
+
+        pending = state.get("pending", [])
+        pending_urls = {item["url"] for item in pending}
+        unfinished = [
+            {"url": url, "parent_url": None}
+            for url in state.get("visited", [])
+            if url not in processed and url not in pending_urls
+        ]
+        if not unfinished:
+            return state
+
+        return {**state, "pending": unfinished + pending}
+
+    def _with_unfinished_batch(self, state: dict, processed: set[str]) -> dict:
+        """Best-First 상태에 현재 배치의 미처리 URL을 큐로 되돌림
+
+        Best-First는 배치로 꺼낸 URL을 큐에서 빼고 visited에 넣은 뒤 크롤링한다.
+        visited에 남아 있으면 재개 시 건너뛰므로 visited에서 빼고, 원래 점수는
+        상태에 없으므로 큐의 가장 높은 우선순위로 다시 넣는다.
+        """
+        queue_items = state.get("queue_items", [])
+        queued_urls = {item["url"] for item in queue_items}
+        visited = state.get("visited", [])
+        unfinished = [url for url in visited if url not in processed and url not in queued_urls]
+        if not unfinished:
+            return state
+
+        depths = state.get("depths", {})
+        top_score = min((item["score"] for item in queue_items), default=0)
+        requeued = [
+            {"score": top_score, "depth": depths.get(url, 0), "url": url, "parent_url": None} for url in unfinished
+        ]
+        unfinished_set = set(unfinished)
+        return {
+            **state,
+            "visited": [url for url in visited if url not in unfinished_set],
+            "queue_items": requeued + queue_items,
+        }
@@ -0,0 +1,117 @@
+"""Chunk manifest (chunks.jsonl) written alongside crawl output."""
+
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from ..strategies.chunking import check_chunk_sizes, chunk_markdown
+
+# 출력 디렉토리 안의 청크 매니페스트 (한 줄에 청크 하나)
+CHUNKS_FILENAME = "chunks.jsonl"
+
+
+class ChunkWriter:
+    """크롤링 중 페이지별 청크를 {output_dir}/chunks.jsonl에 기록
+
+    이번 크롤링의 청크는 임시 파일(chunks.jsonl.partial)에 추가하다가 finish()에서
+    이전 매니페스트의 나머지 페이지(증분 모드의 unchanged 페이지 등) 청크와 합쳐
+    교체한다. 중간에 멈추면 임시 파일이 남아 있으므로 resume하면 거기에 이어서 쓴다.
+    PageWriter의 워커 스레드에서 동시에 호출되므로 쓰기는 lock으로 보호한다.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        target_tokens: int,
+        overlap_tokens: int,
+        resume: bool = False,
+    ):
+        check_chunk_sizes(target_tokens, overlap_tokens)
+        self.path = Path(output_path) / CHUNKS_FILENAME
+        self.partial_path = self.path.with_name(f"{self.path.name}.partial")
+        self.target_tokens = target_tokens
+        self.overlap_tokens = overlap_tokens
+        self.chunks = 0
+
+        if not resume:
+            self.partial_path.unlink(missing_ok=True)
+        elif self.partial_path.exists():
+            _truncate_partial_line(self.partial_path)
+        self._file = open(self.partial_path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, url: str, file: str, markdown: str, chunks: list[dict] | None = None) -> int:
+        """페이지 하나를 청크로 나눠 기록
+
+        Args:
+            chunks: 이미 나눈 청크 (CleaningPool이 워커 프로세스에서 나눈 경우, None이면 여기서 나눔)
+
+        Returns:
+            기록한 청크 수
+        """
+        if chunks is None:
+            chunks = chunk_markdown(markdown, url, self.target_tokens, self.overlap_tokens)
+        lines = "".join(json.dumps({**chunk, "file": file}, ensure_ascii=False) + "\n" for chunk in chunks)
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+            self.chunks += len(chunks)
+        return len(chunks)
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def finish(self, removed: Iterable[str] = ()) -> None:
+        """이번 크롤링의 청크와 이전 매니페스트의 나머지 청크를 합쳐 chunks.jsonl 교체
+
+        Args:
+            removed: 매니페스트에서 뺄 URL (증분 모드에서 사라진 페이지)
+        """
+        self.close()
+        written = {chunk["url"] for chunk in _read_lines(self.partial_path)}
+        dropped = written | set(removed)
+
+        with open(self.partial_path, "a", encoding="utf-8") as f:
+            for chunk in _read_lines(self.path):
+                if chunk["url"] not in dropped:
+                    f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+        os.replace(self.partial_path, self.path)
+
+
+def _truncate_partial_line(path: Path) -> None:
+    """쓰다가 중단된 마지막 줄 제거 (이어 쓰는 첫 줄과 합쳐지지 않도록)"""
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        # 끝에서부터 블록 단위로 읽어 마지막 줄바꿈 위치를 찾음
+        while pos > 0:
+            start = max(0, pos - 65536)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                pos = start + newline + 1
+                break
+            pos = start
+        if pos != end:
+            f.truncate(pos)
+
+
+def _read_lines(path: Path) -> Iterator[dict]:
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # 쓰다가 중단된 마지막 줄
+                continue
+
+
+def iter_chunks(output_path: Path) -> Iterator[dict]:
+    """청크 매니페스트의 모든 청크 읽기 (id, url, file, index, heading_path, tokens, text)"""
+    yield from _read_lines(Path(output_path) / CHUNKS_FILENAME)
@@ -0,0 +1,152 @@
+"""Content-addressed storage for crawl output."""
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from ..utils.fs import write_text_atomic
+from .manifest import content_hash
+
+# 출력 디렉토리 안의 컨텐츠 객체 디렉토리
+OBJECTS_DIRNAME = ".objects"
+
+
+def raw_hash(markdown: str) -> str:
+    """정리 전 마크다운의 해시 (같은 원문이면 정리를 건너뛰기 위한 키)"""
+    return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """정리된 마크다운을 해시 이름의 객체로 한 번만 저장하는 저장소
+
+    객체는 {output_dir}/.objects/ab/abcdef....md 에 저장되고, URL별 파일
+    (url_to_filepath 경로)은 객체를 가리키는 상대 심볼릭 링크가 된다.
+    심볼릭 링크를 만들 수 없는 환경에서는 하드 링크, 그것도 안 되면 복사한다.
+
+    트레일링 슬래시, index.html, 쿼리 변형처럼 같은 내용이 여러 URL로
+    제공되면 객체는 하나만 생기고, 같은 원문은 정리 단계도 다시 거치지 않는다.
+    객체 헤더의 URL은 그 내용을 처음 저장한 URL이다.
+    PageWriter의 워커 스레드에서 동시에 사용되므로 상태는 lock으로 보호한다.
+    """
+
+    def __init__(self, output_path: Path):
+        self.output_path = Path(output_path)
+        self.objects_path = self.output_path / OBJECTS_DIRNAME
+        # 정리 전 원문 해시 -> 정리된 컨텐츠 해시 (이번 크롤링에서 저장된 것만)
+        self._raw_digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+        # 이미 있는 객체를 다시 가리킨 URL 수
+        self.duplicates = 0
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_path / digest[:2] / f"{digest}.md"
+
+    def digest_for_raw(self, raw_digest: str) -> str | None:
+        """같은 원문을 이미 정리해서 저장했으면 그 컨텐츠 해시 (중복으로 집계)"""
+        with self._lock:
+            digest = self._raw_digests.get(raw_digest)
+            if digest is not None:
+                self.duplicates += 1
+            return digest
+
+    def has_raw(self, raw_digest: str) -> bool:
+        """같은 원문이 이미 저장됐는지 (digest_for_raw와 달리 중복으로 집계하지 않음)"""
+        with self._lock:
+            return raw_digest in self._raw_digests
+
+    def put(self, digest: str, text: str, raw_digest: str | None = None) -> Path:
+        """객체 저장 (이미 있으면 쓰지 않음)
+
+        Args:
+            digest: 정리된 마크다운 해시 (객체 이름)
+            text: 저장할 파일 내용
+            raw_digest: 정리 전 원문 해시 (지정 시 다음 같은 원문은 정리 생략)
+
+        Returns:
+            객체 경로
+        """
+        path = self.object_path(digest)
+        if path.exists():
+            with self._lock:
+                self.duplicates += 1
+        else:
+            write_text_atomic(path, text)
+
+        if raw_digest is not None:
+            # 객체가 써진 뒤에 등록해야 다른 스레드가 빈 객체를 가리키지 않음
+            with self._lock:
+                self._raw_digests[raw_digest] = digest
+        return path
+
+    def replace(self, file_paths: list[Path], text: str) -> None:
+        """URL별 파일들의 내용을 바꿈 (dedupe 등 저장 후 내용이 바뀐 경우)
+
+        객체 이름은 내용 해시라서 객체를 제자리에서 고치면 같은 해시를 다음에 put할 때
+        바뀐 내용에 연결된다. 그래서 새 내용을 새 객체로 저장하고 파일들을 다시 연결한다.
+        더 이상 가리키는 파일이 없는 기존 객체는 gc()에서 지워진다.
+
+        Args:
+            file_paths: 같은 객체를 가리키던 URL별 파일들
+            text: 새 파일 내용 (URL 헤더 포함)
+        """
+        # 크롤링 중 저장한 객체와 같은 규칙: 헤더를 뺀 정리된 마크다운의 해시
+        digest = content_hash(text.partition("\n\n")[2])
+        path = self.object_path(digest)
+        if not path.exists():
+            write_text_atomic(path, text)
+        for file_path in file_paths:
+            self.link(file_path, digest)
+
+    def link(self, file_path: Path, digest: str) -> Path:
+        """URL별 파일을 객체에 연결 (기존 파일/링크는 교체)
+
+        Returns:
+            URL별 파일 경로
+        """
+        file_path = Path(file_path)
+        target = self.object_path(digest)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 같은 객체를 이미 가리키고 있으면 그대로 둠
+        if file_path.is_symlink() and file_path.resolve() == target.resolve():
+            return file_path
+
+        tmp_path = file_path.with_name(f".{file_path.name}.link")
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.symlink(os.path.relpath(target, file_path.parent), tmp_path)
+        except OSError:
+            try:
+                os.link(target, tmp_path)
+            except OSError:
+                shutil.copyfile(target, tmp_path)
+        os.replace(tmp_path, file_path)
+        return file_path
+
+    def gc(self) -> int:
+        """어떤 URL 파일도 가리키지 않는 객체 삭제
+
+        Returns:
+            삭제한 객체 수
+        """
+        if not self.objects_path.exists():
+            return 0
+
+        referenced = set()
+        for root, dirs, files in os.walk(self.output_path):
+            dirs[:] = [d for d in dirs if d != OBJECTS_DIRNAME]
+            for name in files:
+                path = Path(root) / name
+                if path.is_symlink():
+                    referenced.add(path.resolve())
+
+        removed = 0
+        for obj in self.objects_path.glob("*/*.md"):
+            # 하드 링크/복사 폴백으로 연결된 객체는 링크 수로 판단
+            if obj.resolve() in referenced or obj.stat().st_nlink > 1:
+                continue
+            obj.unlink()
+            removed += 1
+        return removed
@@ -0,0 +1,175 @@
+"""Crawl manifest for incremental re-crawls."""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+from ..utils.fs import write_json_atomic
+
+# 출력 디렉토리 안에 저장되는 매니페스트 파일명
+MANIFEST_FILENAME = ".crawl-manifest.json"
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(text: str) -> str:
+    """정리된 마크다운의 해시 (sha256 hex)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _extract_validators(headers: dict | None) -> dict:
+    """응답 헤더에서 ETag / Last-Modified 추출 (헤더명 대소문자 무시)"""
+    validators = {"etag": None, "last_modified": None}
+    for key, value in (headers or {}).items():
+        name = key.lower()
+        if name == "etag":
+            validators["etag"] = value
+        elif name == "last-modified":
+            validators["last_modified"] = value
+    return validators
+
+
+class CrawlManifest:
+    """URL별 검증자(ETag, Last-Modified)와 컨텐츠 해시를 기록하는 매니페스트
+
+    이전 크롤링 결과와 비교해서 변경되지 않은 페이지는 정리/저장을 건너뛴다.
+    파일 경로는 출력 디렉토리 기준 상대 경로로 저장한다.
+    PageWriter의 워커 스레드에서 동시에 갱신되므로 쓰기는 lock으로 보호한다.
+    """
+
+    def __init__(self, output_path: Path, entries: dict[str, dict] | None = None):
+        self.output_path = Path(output_path)
+        self.path = self.output_path / MANIFEST_FILENAME
+        self.entries: dict[str, dict] = entries or {}
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, output_path: Path) -> "CrawlManifest":
+        """출력 디렉토리의 매니페스트 로드 (없거나 깨졌으면 빈 매니페스트)"""
+        path = Path(output_path) / MANIFEST_FILENAME
+        entries = {}
+
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                entries = data.get("pages", {})
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ Ignoring unreadable manifest {path}: {e}")
+
+        return cls(output_path, entries)
+
+    def get(self, url: str) -> dict | None:
+        return self.entries.get(url)
+
+    def file_for(self, url: str) -> Path | None:
+        """매니페스트에 기록된 파일 경로 (절대 경로)"""
+        entry = self.entries.get(url)
+        if not entry or not entry.get("file"):
+            return None
+        return self.output_path / entry["file"]
+
+    def is_fresh(self, url: str, modified_at: float | None) -> bool:
+        """modified_at(예: 사이트맵 lastmod) 이후에 확인한 기록이 있는지
+
+        수정 시각을 모르거나 기록된 파일이 사라졌으면 False (다시 받아야 함).
+        """
+        entry = self.entries.get(url)
+        if not entry or modified_at is None:
+            return False
+
+        file_path = self.file_for(url)
+        if file_path is None or not file_path.exists():
+            return False
+
+        return modified_at <= entry.get("checked_at", 0)
+
+    def validators_match(self, url: str, headers: dict | None) -> bool:
+        """응답의 ETag / Last-Modified가 이전 기록과 같은지 확인
+
+        검증자가 하나도 없으면 판단할 수 없으므로 False.
+        기록된 파일이 사라졌으면 다시 써야 하므로 False.
+        """
+        entry = self.entries.get(url)
+        if not entry:
+            return False
+
+        validators = _extract_validators(headers)
+        if not validators["etag"] and not validators["last_modified"]:
+            return False
+
+        file_path = self.file_for(url)
+        if file_path is None or not file_path.exists():
+            return False
+
+        return (
+            validators["etag"] == entry.get("etag")
+            and validators["last_modified"] == entry.get("last_modified")
+        )
+
+    def hash_matches(self, url: str, digest: str) -> bool:
+        """정리된 마크다운 해시가 이전 기록과 같은지 확인 (파일도 존재해야 함)"""
+        entry = self.entries.get(url)
+        if not entry or entry.get("hash") != digest:
+            return False
+
+        file_path = self.file_for(url)
+        return file_path is not None and file_path.exists()
+
+    def mark_unchanged(self, url: str, headers: dict | None = None) -> None:
+        """변경 없음으로 처리 (검증자와 확인 시각만 갱신)"""
+        with self._lock:
+            entry = self.entries[url]
+            if headers is not None:
+                entry.update(_extract_validators(headers))
+            entry["checked_at"] = time.time()
+            self._seen.add(url)
+
+    def record(self, url: str, file_path: Path, digest: str, headers: dict | None = None) -> str:
+        """새로 쓴 페이지 기록
+
+        Returns:
+            "added" (처음 본 URL) 또는 "changed"
+        """
+        now = time.time()
+        entry = {
+            "file": Path(file_path).relative_to(self.output_path).as_posix(),
+            "hash": digest,
+            **_extract_validators(headers),
+            "fetched_at": now,
+            "checked_at": now,
+        }
+
+        with self._lock:
+            status = "changed" if url in self.entries else "added"
+            self.entries[url] = entry
+            self._seen.add(url)
+        return status
+
+    def mark_seen(self, url: str) -> None:
+        """이번 크롤링에서 (실패 등으로) 확인은 했지만 기록은 유지할 URL"""
+        with self._lock:
+            self._seen.add(url)
+
+    def prune_unseen(self) -> list[dict]:
+        """이번 크롤링에서 보이지 않은 URL을 매니페스트에서 제거
+
+        파일은 삭제하지 않는다 (일시적인 장애로 누락된 페이지일 수 있음).
+
+        Returns:
+            제거된 URL의 {"url", "file"} 리스트
+        """
+        removed = []
+        with self._lock:
+            for url in [u for u in self.entries if u not in self._seen]:
+                entry = self.entries.pop(url)
+                removed.append({"url": url, "file": str(self.output_path / entry["file"])})
+        return removed
+
+    def save(self) -> None:
+        """매니페스트를 원자적으로 저장"""
+        with self._lock:
+            pages = dict(self.entries)
+        write_json_atomic(self.path, {"version": MANIFEST_VERSION, "pages": pages})
@@ -0,0 +1,316 @@
+"""Single-file packed crawl output (JSONL, zstd JSONL, Parquet)."""
+
+import io
+import json
+import threading
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..utils.url import canonicalize_url
+
+# "markdown"은 URL별 .md 파일 트리, 나머지는 출력 디렉토리 안의 단일 파일
+OUTPUT_FORMATS = ("markdown", "jsonl", "jsonl.zst", "parquet")
+
+PACK_BASENAME = "pages"
+
+# URL -> 레코드 위치 인덱스 (레코드를 쓸 때마다 한 줄씩 추가, 같은 URL은 마지막 줄이 유효)
+INDEX_FILENAME = "pages.index.jsonl"
+
+# Parquet row group 하나에 모으는 레코드 수
+PARQUET_ROW_GROUP_SIZE = 256
+
+
+def _require(module: str, package: str, output_format: str):
+    """선택 의존성 import (없으면 설치 방법을 담은 ImportError)"""
+    import importlib
+
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"output_format={output_format!r} requires the {package} package (uv sync --extra packed)"
+        ) from e
+
+
+def utc_now() -> str:
+    """레코드의 fetched_at 값 (UTC ISO 8601, 초 단위)"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class _IndexLog:
+    """인덱스 파일에 위치를 한 줄씩 추가 (중간에 죽어도 이미 쓴 레코드는 찾을 수 있도록 매번 flush)"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "a", encoding="utf-8")
+
+    def append(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _truncate_partial_line(path: Path) -> None:
+    """마지막 줄이 개행 없이 끊겨 있으면 잘라냄 (쓰다가 강제 종료된 인덱스 줄)"""
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+class JsonlPackWriter:
+    """레코드를 {output_dir}/pages.jsonl(.zst)에 한 줄씩 추가
+
+    압축할 때는 레코드마다 독립된 zstd 프레임으로 쓴다. 이어 붙인 프레임도 하나의
+    올바른 zstd 스트림이므로 zstdcat으로 전체를 읽을 수 있고, 인덱스의 offset/length로
+    페이지 하나만 읽어서 풀 수도 있다.
+    PageWriter의 워커 스레드에서 동시에 호출되므로 쓰기는 lock으로 보호한다.
+    이어서 크롤링(resume)하면 파일을 인덱스에 기록된 마지막 레코드 끝까지 잘라낸 뒤
+    추가한다 (강제 종료로 반쯤 써진 레코드에 새 레코드가 붙지 않도록).
+    """
+
+    def __init__(self, output_path: Path, compress: bool = False, resume: bool = False):
+        self.output_format = "jsonl.zst" if compress else "jsonl"
+        self.path = Path(output_path) / f"{PACK_BASENAME}.{self.output_format}"
+        index_path = Path(output_path) / INDEX_FILENAME
+
+        self._compressor = None
+        if compress:
+            zstd = _require("zstandard", "zstandard", self.output_format)
+            self._compressor = zstd.ZstdCompressor(level=3)
+
+        if not resume:
+            # 새 크롤링이면 이전 결과를 이어 붙이지 않음
+            self.path.unlink(missing_ok=True)
+            index_path.unlink(missing_ok=True)
+        elif self.path.exists():
+            _truncate_partial_line(index_path)
+            end = max(
+                (e["offset"] + e["length"] for e in load_pack_index(output_path).values() if e["file"] == self.path.name),
+                default=0,
+            )
+            if self.path.stat().st_size > end:
+                with open(self.path, "rb+") as f:
+                    f.truncate(end)
+
+        self._file = open(self.path, "ab")
+        self._index = _IndexLog(index_path)
+        self._lock = threading.Lock()
+
+    def write(self, record: dict, on_saved: Callable[[], None] | None = None) -> str:
+        """레코드 추가
+
+        Args:
+            record: 저장할 레코드
+            on_saved: 레코드가 파일에 써진 뒤 호출할 콜백 (바로 flush하므로 반환 전에 호출됨)
+
+        Returns:
+            저장 위치 표시 (파일명@offset)
+        """
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._compressor is not None:
+                data = self._compressor.compress(data)
+            offset = self._file.tell()
+            self._file.write(data)
+            self._file.flush()
+            self._index.append({"url": record["url"], "file": self.path.name, "offset": offset, "length": len(data)})
+        if on_saved is not None:
+            on_saved()
+        return f"{self.path}@{offset}"
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+            self._index.close()
+
+
+class ParquetPackWriter:
+    """레코드를 PARQUET_ROW_GROUP_SIZE개씩 row group으로 묶어 {output_dir}/pages.parquet에 저장
+
+    Parquet 파일은 닫을 때 footer가 써지고 그 전에는 읽을 수 없으므로, 인덱스 기록과
+    on_saved 콜백(체크포인트의 처리 완료 기록)은 close()에서 footer를 쓴 뒤에 한다.
+    강제 종료되면 그 파일의 페이지는 처리되지 않은 것으로 남아 resume 때 다시 가져온다.
+    이어서 크롤링(resume)하면 인덱스에 없는 파일(강제 종료로 footer가 없는 파일)은
+    지우고 pages.1.parquet, pages.2.parquet ... 처럼 새 파일에 쓴다.
+    """
+
+    output_format = "parquet"
+
+    def __init__(self, output_path: Path, resume: bool = False):
+        self._pa = _require("pyarrow", "pyarrow", self.output_format)
+        pq = _require("pyarrow.parquet", "pyarrow", self.output_format)
+
+        output_path = Path(output_path)
+        index_path = output_path / INDEX_FILENAME
+        if resume:
+            _truncate_partial_line(index_path)
+            indexed = {entry["file"] for entry in load_pack_index(output_path).values()}
+            for old in output_path.glob(f"{PACK_BASENAME}*.parquet"):
+                if old.name not in indexed:
+                    old.unlink()
+            part = 0
+            while (output_path / _parquet_name(part)).exists():
+                part += 1
+        else:
+            for old in output_path.glob(f"{PACK_BASENAME}*.parquet"):
+                old.unlink()
+            index_path.unlink(missing_ok=True)
+            part = 0
+        self.path = output_path / _parquet_name(part)
+
+        self._schema = self._pa.schema(
+            [
+                ("url", self._pa.string()),
+                ("depth", self._pa.int32()),
+                ("score", self._pa.float64()),
+                ("fetched_at", self._pa.string()),
+                ("content_hash", self._pa.string()),
+                ("markdown", self._pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(str(self.path), self._schema, compression="zstd")
+        self._index = _IndexLog(index_path)
+        self._rows: list[dict] = []
+        self._row_group = 0
+        # footer를 쓴 뒤에 기록할 인덱스 항목과 콜백
+        self._written: list[dict] = []
+        self._on_saved: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def write(self, record: dict, on_saved: Callable[[], None] | None = None) -> str:
+        """레코드 추가 (row group이 차면 파일에 씀)
+
+        Args:
+            record: 저장할 레코드
+            on_saved: 파일을 읽을 수 있게 된 뒤(close()에서 footer를 쓴 뒤) 호출할 콜백
+
+        Returns:
+            저장 위치 표시 (파일명#row_group:row)
+        """
+        with self._lock:
+            location = f"{self.path}#{self._row_group}:{len(self._rows)}"
+            self._rows.append(record)
+            if on_saved is not None:
+                self._on_saved.append(on_saved)
+            if len(self._rows) >= PARQUET_ROW_GROUP_SIZE:
+                self._flush()
+        return location
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        table = self._pa.Table.from_pylist(self._rows, schema=self._schema)
+        self._writer.write_table(table, row_group_size=len(self._rows))
+        for row, record in enumerate(self._rows):
+            self._written.append({"url": record["url"], "file": self.path.name, "row_group": self._row_group, "row": row})
+        self._rows = []
+        self._row_group += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._writer.close()
+            for entry in self._written:
+                self._index.append(entry)
+            self._index.close()
+            for on_saved in self._on_saved:
+                on_saved()
+
+
+def _parquet_name(part: int) -> str:
+    return f"{PACK_BASENAME}.parquet" if part == 0 else f"{PACK_BASENAME}.{part}.parquet"
+
+
+def open_pack_writer(output_path: Path, output_format: str, resume: bool = False):
+    """output_format에 맞는 단일 파일 writer 생성 ("markdown"이면 None)
+
+    Raises:
+        ValueError: 알 수 없는 output_format
+        ImportError: 필요한 선택 의존성(zstandard, pyarrow)이 없음
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format} (available: {', '.join(OUTPUT_FORMATS)})")
+    if output_format == "markdown":
+        return None
+    if output_format == "parquet":
+        return ParquetPackWriter(output_path, resume=resume)
+    return JsonlPackWriter(output_path, compress=output_format == "jsonl.zst", resume=resume)
+
+
+def load_pack_index(output_path: Path) -> dict[str, dict]:
+    """URL -> 레코드 위치 (같은 URL이 여러 번 쓰였으면 마지막 위치)"""
+    index_path = Path(output_path) / INDEX_FILENAME
+    index: dict[str, dict] = {}
+    if not index_path.exists():
+        return index
+
+    with open(index_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # 쓰다가 중단된 마지막 줄
+                continue
+            index[entry["url"]] = entry
+    return index
+
+
+def read_packed_page(output_path: Path, url: str, index: dict[str, dict] | None = None) -> dict | None:
+    """단일 파일 출력에서 URL 하나의 레코드만 읽기 (파일 전체를 읽지 않음)
+
+    Args:
+        output_path: 출력 디렉토리
+        url: 찾을 URL (정규화해서 찾음)
+        index: load_pack_index 결과 (여러 번 읽을 때 재사용)
+
+    Returns:
+        레코드 dict (없으면 None)
+    """
+    output_path = Path(output_path)
+    if index is None:
+        index = load_pack_index(output_path)
+    entry = index.get(canonicalize_url(url))
+    if entry is None:
+        return None
+
+    path = output_path / entry["file"]
+    if "row_group" in entry:
+        pq = _require("pyarrow.parquet", "pyarrow", "parquet")
+        table = pq.ParquetFile(path).read_row_group(entry["row_group"])
+        return table.slice(entry["row"], 1).to_pylist()[0]
+
+    with open(path, "rb") as f:
+        f.seek(entry["offset"])
+        data = f.read(entry["length"])
+    if path.name.endswith(".zst"):
+        zstd = _require("zstandard", "zstandard", "jsonl.zst")
+        data = zstd.ZstdDecompressor().decompress(data)
+    return json.loads(data)
+
+
+def iter_packed_pages(output_path: Path) -> Iterator[dict]:
+    """단일 파일 출력의 모든 레코드를 파일 순서대로 읽기 (인덱스에 나온 파일들)"""
+    output_path = Path(output_path)
+    files = list(dict.fromkeys(entry["file"] for entry in load_pack_index(output_path).values()))
+
+    for name in files:
+        path = output_path / name
+        if name.endswith(".parquet"):
+            pq = _require("pyarrow.parquet", "pyarrow", "parquet")
+            for batch in pq.ParquetFile(path).iter_batches():
+                yield from batch.to_pylist()
+        elif name.endswith(".zst"):
+            zstd = _require("zstandard", "zstandard", "jsonl.zst")
+            with open(path, "rb") as f:
+                reader = zstd.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+                for line in io.TextIOWrapper(reader, encoding="utf-8"):
+                    yield json.loads(line)
+        else:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
@@ -0,0 +1,298 @@
+"""On-disk page cache shared by crawl_page, crawl_pages and crawl_docs."""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from urllib.parse import urlparse
+
+from ..strategies.http_fetch import HttpPage
+from ..utils.url import canonicalize_url
+
+# 캐시 디렉토리를 바꾸는 환경 변수 (없으면 ~/.cache/crawl4ai-mcp-server)
+CACHE_DIR_ENV = "CRAWL4AI_MCP_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "crawl4ai-mcp-server"
+
+CACHE_FILENAME = "pages.sqlite"
+
+# 캐시 디렉토리 안의 도메인별 TTL 설정 ({"docs.python.org": 604800, "example.com": 0})
+TTLS_FILENAME = "ttls.json"
+
+# 도메인별 TTL이 없을 때 캐시를 쓰는 기간 (초)
+DEFAULT_TTL = 24 * 3600
+
+# 캐시 크기 상한 (압축된 본문 기준 바이트). 넘으면 가장 오래 안 쓴 페이지부터 삭제
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# (정규 URL, 브라우저 프리셋)마다 한 행. 본문은 zlib 압축 JSON (cleaned_html, markdown)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    fetched_url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (url, preset)
+);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at);
+"""
+
+
+def default_cache_dir() -> Path:
+    """캐시 디렉토리 ($CRAWL4AI_MCP_CACHE_DIR, 없으면 ~/.cache/crawl4ai-mcp-server)"""
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def load_domain_ttls(cache_dir: Path) -> dict[str, float]:
+    """캐시 디렉토리의 ttls.json 읽기 (없으면 빈 dict)
+
+    Raises:
+        ValueError: {도메인: 0 이상의 초} 형태가 아님
+    """
+    path = Path(cache_dir) / TTLS_FILENAME
+    if not path.exists():
+        return {}
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not all(
+        isinstance(ttl, (int, float)) and not isinstance(ttl, bool) and ttl >= 0 for ttl in data.values()
+    ):
+        raise ValueError(f"{path}: expected {{domain: ttl_seconds}} with non-negative numbers")
+    return {domain.lower(): float(ttl) for domain, ttl in data.items()}
+
+
+class PageCache:
+    """크롤링한 페이지를 (정규 URL, 브라우저 프리셋) 단위로 저장하는 디스크 캐시
+
+    crawl4ai의 cache_mode는 프리셋마다 켜고 끄는 것만 가능해서 기간/크기/위치를
+    정할 수 없다. 이 캐시는 HTTP 단계나 브라우저로 가져온 페이지의 cleaned_html과
+    정리 전 마크다운을 SQLite 한 파일에 압축해서 저장하고, 같은 페이지를 다시 요청하면
+    fetch 없이 돌려준다. 정리(룰 팩)는 캐시 밖에서 하므로 룰 팩을 바꿔도 캐시는 그대로 쓴다.
+    원본 HTML은 저장하지 않는다 (캐시에서 꺼낸 HttpPage의 html은 빈 문자열).
+
+    - TTL: 도메인별 (서브도메인 포함, 가장 구체적인 도메인 우선), 없으면 default_ttl.
+      TTL이 0인 도메인은 캐시하지 않는다. get의 max_age로 호출마다 덮어쓸 수 있다.
+      ttls.json은 처음 사용할 때 읽고, 읽을 수 없거나 형식이 잘못됐으면 경고만
+      출력하고 default_ttl을 쓴다 (서버 시작을 막지 않음)
+    - 크기: 압축된 본문 합이 max_bytes를 넘으면 가장 오래 안 쓴(LRU) 페이지부터 삭제
+    - 여러 스레드(PageWriter 워커)와 프로세스(서버, CLI)가 같은 파일을 함께 쓸 수 있다
+
+    Args:
+        cache_dir: 캐시 디렉토리 (None이면 default_cache_dir())
+        max_bytes: 캐시 크기 상한 (바이트)
+        default_ttl: 도메인별 TTL이 없을 때 쓰는 TTL (초)
+        domain_ttls: 도메인별 TTL (초). None이면 캐시 디렉토리의 ttls.json (처음 사용할 때 읽음)
+
+    Raises:
+        ValueError: max_bytes가 양수가 아니거나 TTL이 음수
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: float = DEFAULT_TTL,
+        domain_ttls: dict[str, float] | None = None,
+    ):
+        if max_bytes <= 0 or default_ttl < 0:
+            raise ValueError(f"max_bytes must be positive and default_ttl >= 0 (got {max_bytes}, {default_ttl})")
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.path = self.cache_dir / CACHE_FILENAME
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        if domain_ttls is not None:
+            if any(ttl < 0 for ttl in domain_ttls.values()):
+                raise ValueError(f"domain TTLs must be >= 0 (got {domain_ttls})")
+            domain_ttls = {domain.lower(): float(ttl) for domain, ttl in domain_ttls.items()}
+        self._domain_ttls = domain_ttls
+
+        # 이 프로세스에서의 조회/저장 횟수 (stats)
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stores = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._bytes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """처음 사용할 때 DB 열기 (self._lock을 잡은 상태에서 호출)"""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            # 서버와 CLI가 동시에 써도 읽기가 막히지 않도록
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    @property
+    def domain_ttls(self) -> dict[str, float]:
+        """도메인별 TTL (생성할 때 주지 않았으면 처음 접근할 때 ttls.json에서 읽음)"""
+        if self._domain_ttls is None:
+            try:
+                self._domain_ttls = load_domain_ttls(self.cache_dir)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring page cache TTLs, using default TTL {self.default_ttl:.0f} s: {e}", file=sys.stderr)
+                self._domain_ttls = {}
+        return self._domain_ttls
+
+    def ttl_for(self, url: str) -> float:
+        """URL의 호스트에 맞는 TTL (초, 가장 구체적인 도메인 우선)"""
+        domain_ttls = self.domain_ttls
+        parts = (urlparse(url).hostname or "").lower().split(".")
+        for i in range(len(parts)):
+            ttl = domain_ttls.get(".".join(parts[i:]))
+            if ttl is not None:
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str, preset: str, max_age: float | None = None) -> HttpPage | None:
+        """캐시된 페이지 조회
+
+        Args:
+            url: 요청 URL (정규화해서 찾음)
+            preset: 브라우저 프리셋 이름 (예: "fast", "stealth")
+            max_age: 허용할 최대 나이 (초). None이면 도메인 TTL, 0이면 캐시를 읽지 않음
+
+        Returns:
+            캐시된 페이지 (없거나 max_age보다 오래됐으면 None)
+
+        Raises:
+            ValueError: max_age가 음수
+        """
+        if max_age is not None and max_age < 0:
+            raise ValueError(f"max_age must be >= 0 (got {max_age})")
+
+        ttl = self.ttl_for(url) if max_age is None else max_age
+        if ttl <= 0:
+            return None
+
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT fetched_url, status_code, headers, body, fetched_at FROM pages WHERE url = ? AND preset = ?",
+                (key, preset),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if now - row[4] > ttl:
+                self.expired += 1
+                return None
+            conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ? AND preset = ?", (now, key, preset))
+            conn.commit()
+            self.hits += 1
+
+        fetched_url, status_code, headers, body, fetched_at = row
+        data = json.loads(zlib.decompress(body))
+        print(f"⚡ Cache hit: {url} ({now - fetched_at:.0f} s old)")
+        return HttpPage(
+            url=fetched_url,
+            status_code=status_code,
+            headers=json.loads(headers),
+            html="",
+            cleaned_html=data["cleaned_html"],
+            markdown=data["markdown"],
+        )
+
+    def put(self, url: str, preset: str, page: HttpPage) -> bool:
+        """페이지 저장 (같은 URL/프리셋의 이전 항목은 교체)
+
+        Args:
+            url: 요청 URL (정규화해서 키로 씀)
+            preset: 브라우저 프리셋 이름
+            page: 저장할 페이지 (cleaned_html, 정리 전 마크다운)
+
+        Returns:
+            저장했으면 True (TTL이 0인 도메인은 저장하지 않음)
+        """
+        if self.ttl_for(url) <= 0:
+            return False
+
+        body = zlib.compress(
+            json.dumps({"cleaned_html": page.cleaned_html, "markdown": page.markdown}, ensure_ascii=False).encode("utf-8")
+        )
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            old = conn.execute("SELECT size FROM pages WHERE url = ? AND preset = ?", (key, preset)).fetchone()
+            conn.execute(
+                """
+                INSERT INTO pages (url, preset, fetched_url, status_code, headers, body, size, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url, preset) DO UPDATE SET
+                    fetched_url = excluded.fetched_url, status_code = excluded.status_code,
+                    headers = excluded.headers, body = excluded.body, size = excluded.size,
+                    fetched_at = excluded.fetched_at, accessed_at = excluded.accessed_at
+                """,
+                (key, preset, page.url, page.status_code, json.dumps(page.headers), body, len(body), now, now),
+            )
+            self._bytes += len(body) - (old[0] if old else 0)
+            self.stores += 1
+            if self._bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+        return True
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """max_bytes 아래로 내려갈 때까지 가장 오래 안 쓴 페이지 삭제"""
+        # 다른 프로세스도 같은 파일에 쓰므로 실제 합계로 다시 계산
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        victims = []
+        for url, preset, size in conn.execute("SELECT url, preset, size FROM pages ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            victims.append((url, preset))
+            total -= size
+        conn.executemany("DELETE FROM pages WHERE url = ? AND preset = ?", victims)
+        self.evictions += len(victims)
+        self._bytes = total
+
+    def stats(self) -> dict:
+        """캐시 상태 (디스크의 항목 수/크기 + 이 프로세스의 조회 통계)"""
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT preset, COUNT(*), COALESCE(SUM(size), 0), MIN(fetched_at) FROM pages GROUP BY preset"
+            ).fetchall()
+
+        oldest = min((row[3] for row in rows), default=None)
+        lookups = self.hits + self.misses + self.expired
+        return {
+            "path": str(self.path),
+            "entries": sum(row[1] for row in rows),
+            "bytes": sum(row[2] for row in rows),
+            "max_bytes": self.max_bytes,
+            "presets": {preset: {"entries": count, "bytes": size} for preset, count, size, _ in rows},
+            "oldest_age_s": round(time.time() - oldest) if oldest is not None else None,
+            "default_ttl": self.default_ttl,
+            "domain_ttls": dict(self.domain_ttls),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,129 @@
+"""On-disk crawl result listing with directory rollups."""
+
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from urllib.parse import urlparse
+
+from ..utils.fs import write_json_atomic
+
+# 크롤링 결과 레코드 목록 (한 줄에 페이지 하나: url, depth, file, status)
+RESULTS_FILENAME = "crawl-results.jsonl"
+
+# 결과 집계 (상태별 / 깊이별 개수, URL 디렉토리별 rollup)
+RESULTS_SUMMARY_FILENAME = "crawl-results.summary.json"
+
+
+def url_directory(url: str) -> str:
+    """URL 경로의 디렉토리 부분 (https://x.com/docs/api/auth -> /docs/api)"""
+    path = urlparse(url).path or "/"
+    directory = path.rsplit("/", 1)[0]
+    return directory or "/"
+
+
+def summarize_results(results: Iterable[dict]) -> dict:
+    """결과 레코드 집계
+
+    Returns:
+        total, statuses(상태별 개수), depths(깊이별 개수), directories(URL 디렉토리별
+        페이지 수와 상태별 개수, 페이지 수 내림차순) dict
+    """
+    statuses: dict[str, int] = {}
+    depths: dict[str, int] = {}
+    directories: dict[str, dict[str, int]] = {}
+    total = 0
+
+    for r in results:
+        total += 1
+        statuses[r["status"]] = statuses.get(r["status"], 0) + 1
+        depth = str(r["depth"]) if r["depth"] is not None else "-"
+        depths[depth] = depths.get(depth, 0) + 1
+
+        rollup = directories.setdefault(url_directory(r["url"]), {"pages": 0})
+        rollup["pages"] += 1
+        rollup[r["status"]] = rollup.get(r["status"], 0) + 1
+
+    return {
+        "total": total,
+        "statuses": statuses,
+        "depths": dict(sorted(depths.items(), key=lambda item: (item[0] == "-", item[0].zfill(4)))),
+        "directories": dict(sorted(directories.items(), key=lambda item: (-item[1]["pages"], item[0]))),
+    }
+
+
+def write_results(output_path: Path, results: list[dict]) -> dict:
+    """결과 목록(crawl-results.jsonl)과 집계(crawl-results.summary.json) 저장
+
+    목록은 한 줄씩 임시 파일에 쓴 뒤 교체하므로 응답 문자열처럼 전체를 한 번에 만들지 않는다.
+
+    Returns:
+        summarize_results 결과
+    """
+    output_path = Path(output_path)
+    path = output_path / RESULTS_FILENAME
+
+    fd, tmp_path = tempfile.mkstemp(dir=output_path, prefix=f".{RESULTS_FILENAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for r in results:
+                record = {"url": r["url"], "depth": r["depth"], "file": r["file"], "status": r["status"]}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    summary = summarize_results(results)
+    write_json_atomic(output_path / RESULTS_SUMMARY_FILENAME, summary)
+    return summary
+
+
+def read_results(
+    output_path: Path,
+    page: int = 1,
+    page_size: int = 100,
+    status: str | None = None,
+    directory: str | None = None,
+) -> tuple[list[dict], int]:
+    """결과 목록의 한 페이지 읽기 (파일을 한 줄씩 읽으며 필요한 구간만 보관)
+
+    Args:
+        output_path: 출력 디렉토리
+        page: 1부터 시작하는 페이지 번호
+        page_size: 페이지당 레코드 수
+        status: 이 상태의 레코드만 (added / changed / unchanged / removed)
+        directory: 이 URL 디렉토리(와 그 하위)의 레코드만 (예: "/docs/api")
+
+    Returns:
+        (페이지의 레코드 리스트, 필터에 맞는 전체 레코드 수)
+
+    Raises:
+        FileNotFoundError: 결과 목록이 없음
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError(f"page and page_size must be >= 1 (got page={page}, page_size={page_size})")
+
+    directory = directory.rstrip("/") if directory else None
+
+    def matches(record: dict) -> bool:
+        if status is not None and record["status"] != status:
+            return False
+        if directory:
+            record_dir = url_directory(record["url"])
+            return record_dir == directory or record_dir.startswith(directory + "/")
+        return True
+
+    start = (page - 1) * page_size
+    items: list[dict] = []
+    total = 0
+    with open(Path(output_path) / RESULTS_FILENAME, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if not matches(record):
+                continue
+            if start <= total < start + page_size:
+                items.append(record)
+            total += 1
+    return items, total
@@ -0,0 +1,245 @@
+"""SQLite FTS5 full-text index over crawled pages."""
+
+import os
+import re
+import sqlite3
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .packed import INDEX_FILENAME as PACK_INDEX_FILENAME
+from .packed import iter_packed_pages
+
+# 출력 디렉토리 안에 저장되는 검색 인덱스 파일명
+SEARCH_INDEX_FILENAME = ".search-index.sqlite"
+
+# bm25 컬럼 가중치 (title, body): 제목에 나온 단어를 본문보다 높게
+_BM25_WEIGHTS = (5.0, 1.0)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# URL로 찾고 교체하는 docs 테이블 + docs를 content로 쓰는 FTS5 테이블 (트리거로 동기화)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    file TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(
+    title,
+    body,
+    content = 'docs',
+    content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS docs_ai AFTER INSERT ON docs BEGIN
+    INSERT INTO pages (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_ad AFTER DELETE ON docs BEGIN
+    INSERT INTO pages (pages, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_au AFTER UPDATE ON docs BEGIN
+    INSERT INTO pages (pages, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO pages (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+"""
+
+
+def _fts_query(query: str, operator: str) -> str | None:
+    """자유 텍스트를 FTS5 쿼리로 변환 (각 단어를 따옴표로 감싸 FTS 문법 문자를 무력화)"""
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    return f" {operator} ".join(f'"{token}"' for token in tokens)
+
+
+def _split_page(text: str) -> tuple[str | None, str]:
+    """저장 파일 내용을 (헤더 URL, 본문)으로 분리"""
+    first_line, _, body = text.partition("\n")
+    if first_line.startswith("# http"):
+        return first_line[2:].strip(), body.lstrip("\n")
+    return None, text
+
+
+def _title(url: str, body: str) -> str:
+    """본문의 첫 heading (없으면 URL)"""
+    for line in body.splitlines():
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+    return url
+
+
+def index_path(output_path: Path) -> Path:
+    """출력 디렉토리의 검색 인덱스 경로"""
+    return Path(output_path) / SEARCH_INDEX_FILENAME
+
+
+class SearchIndex:
+    """SQLite FTS5 검색 인덱스 (페이지 색인 + BM25 순 검색)
+
+    같은 URL을 다시 추가하면 기존 행을 교체한다. 연결은 만든 스레드에서만 쓴다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, url: str, markdown: str, file: str | None = None) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO docs (url, title, body, file) VALUES (?, ?, ?, ?)
+            ON CONFLICT (url) DO UPDATE SET title = excluded.title, body = excluded.body, file = excluded.file
+            """,
+            (url, _title(url, markdown), markdown, file),
+        )
+
+    def remove(self, url: str) -> None:
+        self._conn.execute("DELETE FROM docs WHERE url = ?", (url,))
+
+    def urls(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT url FROM docs")}
+
+    def search(self, query: str, k: int = 10) -> list[dict]:
+        """쿼리의 모든 단어를 포함한 페이지를 관련도 순으로 (없으면 일부 단어만 포함한 페이지)
+
+        Returns:
+            url, title, file, snippet, score(bm25, 작을수록 관련) dict 리스트
+        """
+        for operator in ("AND", "OR"):
+            fts_query = _fts_query(query, operator)
+            if fts_query is None:
+                return []
+
+            rows = self._conn.execute(
+                f"""
+                SELECT docs.url, docs.title, docs.file,
+                       snippet(pages, 1, '**', '**', ' … ', 24),
+                       bm25(pages, {", ".join(map(str, _BM25_WEIGHTS))}) AS rank
+                FROM pages JOIN docs ON docs.id = pages.rowid
+                WHERE pages MATCH ? ORDER BY rank LIMIT ?
+                """,
+                (fts_query, k),
+            ).fetchall()
+            if rows:
+                return [
+                    {"url": url, "title": title, "file": file, "snippet": " ".join(snippet.split()), "score": rank}
+                    for url, title, file, snippet, rank in rows
+                ]
+        return []
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _iter_saved_pages(output_path: Path) -> Iterator[tuple[str, str, str | None]]:
+    """출력 디렉토리에 저장된 페이지를 (url, 본문, 파일) 순서로 읽기
+
+    단일 파일 출력(pages.index.jsonl이 있으면)은 레코드를, 아니면 .md 파일 트리를 읽는다.
+    숨김 디렉토리(.objects 등)는 건너뛴다.
+    """
+    if (output_path / PACK_INDEX_FILENAME).exists():
+        for record in iter_packed_pages(output_path):
+            yield record["url"], record["markdown"], None
+        return
+
+    for root, dirs, files in os.walk(output_path):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if not name.endswith(".md"):
+                continue
+            path = Path(root) / name
+            url, body = _split_page(path.read_text(encoding="utf-8"))
+            yield url or str(path.relative_to(output_path)), body, str(path)
+
+
+def build_search_index(output_path: Path) -> int:
+    """출력 디렉토리의 모든 페이지로 검색 인덱스를 새로 생성
+
+    임시 파일에 만든 뒤 교체하므로 만드는 동안에도 기존 인덱스로 검색할 수 있다.
+
+    Returns:
+        색인한 페이지 수
+    """
+    output_path = Path(output_path)
+    path = index_path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 동시에 다시 만드는 다른 프로세스와 겹치지 않도록 고유한 임시 파일 (SQLite는 빈 파일을 새 DB로 연다)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+
+    count = 0
+    try:
+        with SearchIndex(tmp_path) as index:
+            for url, body, file in _iter_saved_pages(output_path):
+                index.add(url, body, file)
+                count += 1
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def update_search_index(output_path: Path, results: Iterable[dict], reindex_all: bool = False) -> int:
+    """크롤링 결과 레코드로 검색 인덱스 갱신 (.md 파일 트리 출력용)
+
+    added/changed 페이지는 다시 색인하고 removed 페이지는 지운다. unchanged 페이지는
+    인덱스에 없을 때만 추가한다. reindex_all이면 (예: dedupe로 파일 내용이 바뀐 경우)
+    결과의 모든 페이지를 다시 색인한다.
+
+    Returns:
+        색인한 페이지 수
+    """
+    count = 0
+    with SearchIndex(index_path(output_path)) as index:
+        indexed = index.urls()
+        for r in results:
+            if r["status"] == "removed":
+                index.remove(r["url"])
+                continue
+            if r["status"] == "unchanged" and r["url"] in indexed and not reindex_all:
+                continue
+
+            path = Path(r["file"])
+            if not path.exists():
+                continue
+            _, body = _split_page(path.read_text(encoding="utf-8"))
+            index.add(r["url"], body, r["file"])
+            count += 1
+    return count
+
+
+def remove_search_index(output_path: Path) -> bool:
+    """출력 디렉토리의 검색 인덱스 삭제 (다음 search_pages에서 저장된 페이지로 새로 생성됨)
+
+    Returns:
+        인덱스가 있어서 지웠으면 True
+    """
+    path = index_path(output_path)
+    existed = path.exists()
+    path.unlink(missing_ok=True)
+    return existed
+
+
+def search_pages(output_path: Path, query: str, k: int = 10) -> list[dict]:
+    """출력 디렉토리의 검색 인덱스에서 검색 (인덱스가 없으면 저장된 페이지로 먼저 생성)"""
+    path = index_path(output_path)
+    if not path.exists():
+        build_search_index(output_path)
+
+    with SearchIndex(path) as index:
+        return index.search(query, k)
@@ -0,0 +1,121 @@
+"""Bounded async writer stage that keeps disk I/O off the crawl event loop."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# 큐 종료 신호
+_STOP = object()
+
+
+class PageWriter:
+    """크롤링 루프에서 받은 페이지를 스레드 풀에서 처리(정리 + 저장)하는 단계
+
+    - submit()은 큐가 가득 차면 대기하므로 (backpressure) 메모리에 쌓이는
+      페이지 수는 max_pending으로 제한된다
+    - process는 워커 스레드에서 호출되는 동기 함수로, 결과 레코드(dict)를
+      반환하면 records에 쌓인다 (None이면 무시)
+    - on_record가 있으면 레코드가 쌓일 때마다 이벤트 루프에서 호출한다 (진행 상황 보고용)
+    - batch_size > 1이면 큐에 이미 쌓인 페이지를 batch_size개까지 묶어서 한 워커가
+      처리한다. prepare가 있으면 process 전에 묶음 전체로 한 번 호출한다
+      (예: 묶음을 프로세스 풀에 한 번에 넘겨 정리). 큐가 비어 있으면 기다리지 않고
+      있는 만큼만 묶으므로 지연은 늘지 않는다
+    - 처리 중 예외가 나면 이후 submit()/close()에서 다시 발생시킨다
+
+    async with로 사용하면 블록을 벗어날 때 (예외 포함) 큐를 모두 비운다.
+    취소되면 큐에 남은 페이지는 버리고, 이미 처리 중인 페이지만 끝까지 저장한다.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[dict], dict | None],
+        workers: int = 2,
+        max_pending: int = 32,
+        on_record: Callable[[dict], Awaitable[None]] | None = None,
+        batch_size: int = 1,
+        prepare: Callable[[list[dict]], None] | None = None,
+    ):
+        self._process = process
+        self._on_record = on_record
+        self._prepare = prepare
+        self._batch_size = max(1, batch_size)
+        self._workers = max(1, workers)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_pending))
+        self._executor: ThreadPoolExecutor | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._error: BaseException | None = None
+        self.records: list[dict] = []
+
+    async def __aenter__(self) -> "PageWriter":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close(raise_errors=exc_type is None)
+
+    def start(self) -> None:
+        """워커 스레드 풀과 큐 소비 태스크 시작"""
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="page-writer")
+        self._tasks = [asyncio.create_task(self._drain()) for _ in range(self._workers)]
+
+    async def submit(self, page: dict) -> None:
+        """페이지를 큐에 넣기 (큐가 가득 차면 빈 자리가 날 때까지 대기)"""
+        if self._error is not None:
+            raise self._error
+        await self._queue.put(page)
+
+    async def close(self, raise_errors: bool = True) -> None:
+        """남은 페이지를 모두 처리하고 워커 종료"""
+        if not self._tasks:
+            return
+
+        try:
+            for _ in self._tasks:
+                await self._queue.put(_STOP)
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            # 취소된 경우 남은 소비 태스크를 정리 (정상 종료면 이미 끝나 있음)
+            for task in self._tasks:
+                task.cancel()
+            self._tasks = []
+
+            # 워커 스레드에서 쓰던 페이지는 끝까지 저장되도록 대기
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        if raise_errors and self._error is not None:
+            raise self._error
+
+    def _process_batch(self, pages: list[dict]) -> list[dict]:
+        """워커 스레드: 묶음 준비(prepare) 후 페이지별 처리"""
+        if self._prepare is not None:
+            self._prepare(pages)
+        return [record for record in map(self._process, pages) if record is not None]
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            # 이미 쌓여 있는 페이지만 묶음에 추가 (종료 신호를 만나면 거기까지)
+            while len(batch) < self._batch_size and batch[-1] is not _STOP and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            stop = batch[-1] is _STOP
+            pages = batch[:-1] if stop else batch
+            try:
+                # 앞에서 실패했으면 남은 페이지는 버리고 큐만 비운다
+                if pages and self._error is None:
+                    records = await loop.run_in_executor(self._executor, self._process_batch, pages)
+                    for record in records:
+                        self.records.append(record)
+                        if self._on_record is not None:
+                            await self._on_record(record)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
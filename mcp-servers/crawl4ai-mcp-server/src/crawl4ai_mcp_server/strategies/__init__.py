@@ -1,5 +1,64 @@
 """Crawling strategies for extraction and content processing."""
 
-from .content import clean_navigation_content
+from .boilerplate import BoilerplateFilter, dedupe_files
+from .chunking import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_TOKENS, chunk_markdown, estimate_tokens
+from .content import (
+    DEFAULT_FOOTER_PATTERNS,
+    FooterMatcher,
+    check_footer_patterns,
+    clean_navigation_content,
+    compile_footer_patterns,
+)
+from .dom import DEFAULT_PRUNE_TAGS, check_selectors, prune_html
+from .http_fetch import FetchStats, HttpFetcher, HttpPage, detect_js_shell, supports_config
+from .parallel import DEFAULT_CLEAN_BATCH, CleaningPool
+from .pipeline import (
+    CleaningPipeline,
+    CollapseBlankLinesStage,
+    FooterCutStage,
+    HeadingTrimStage,
+    HtmlPruneStage,
+)
+from .politeness import HostScheduler, PoliteCrawler, create_host_scheduler
+from .rule_packs import get_rule_pack, list_rule_packs, register_rule_pack, resolve_pipeline, rule_pack_for_url
+from .timing import STAGES, TIMINGS_FILENAME, StageTimings
 
-__all__ = ["clean_navigation_content"]
+__all__ = [
+    "BoilerplateFilter",
+    "dedupe_files",
+    "DEFAULT_CHUNK_OVERLAP",
+    "DEFAULT_CHUNK_TOKENS",
+    "chunk_markdown",
+    "estimate_tokens",
+    "DEFAULT_FOOTER_PATTERNS",
+    "FooterMatcher",
+    "check_footer_patterns",
+    "clean_navigation_content",
+    "compile_footer_patterns",
+    "DEFAULT_PRUNE_TAGS",
+    "check_selectors",
+    "prune_html",
+    "FetchStats",
+    "HttpFetcher",
+    "HttpPage",
+    "detect_js_shell",
+    "supports_config",
+    "DEFAULT_CLEAN_BATCH",
+    "CleaningPool",
+    "CleaningPipeline",
+    "CollapseBlankLinesStage",
+    "FooterCutStage",
+    "HeadingTrimStage",
+    "HtmlPruneStage",
+    "HostScheduler",
+    "PoliteCrawler",
+    "create_host_scheduler",
+    "get_rule_pack",
+    "list_rule_packs",
+    "register_rule_pack",
+    "resolve_pipeline",
+    "rule_pack_for_url",
+    "STAGES",
+    "TIMINGS_FILENAME",
+    "StageTimings",
+]
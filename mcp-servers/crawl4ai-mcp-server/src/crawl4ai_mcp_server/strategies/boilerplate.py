@@ -0,0 +1,187 @@
+"""Cross-page boilerplate deduplication."""
+
+import hashlib
+import json
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+from ..utils.fs import write_json_atomic, write_text_atomic
+
+# 출력 디렉토리 안에 저장되는 boilerplate 지문 파일명 (증분 크롤링에서 재사용)
+BOILERPLATE_FILENAME = ".crawl-boilerplate.json"
+
+# 저장된 지문이 이 횟수의 dedupe 실행 동안 한 페이지에도 나타나지 않으면 버림
+BOILERPLATE_MAX_IDLE_RUNS = 5
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def split_blocks(markdown: str) -> list[str]:
+    """마크다운을 빈 줄 기준 블록으로 분리 (코드 펜스 안의 빈 줄은 무시)"""
+    blocks = []
+    current: list[str] = []
+    in_fence = False
+
+    for line in markdown.split("\n"):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _is_protected(block: str) -> bool:
+    """중복이어도 지우지 않는 블록 (한 줄짜리 heading, 코드 블록)
+
+    "## Parameters"처럼 여러 페이지에 같은 heading이 있는 것은 정상이고,
+    코드 예제는 같은 내용이라도 각 페이지 맥락에서 의미가 있다.
+    """
+    stripped = block.lstrip()
+    if stripped.startswith(("```", "~~~")):
+        return True
+    return "\n" not in block.strip() and stripped.startswith("#")
+
+
+def block_fingerprint(block: str) -> str:
+    """공백을 정규화한 블록 지문 (blake2b 64bit hex)"""
+    normalized = _WHITESPACE_RE.sub(" ", block).strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class BoilerplateFilter:
+    """여러 페이지에 반복되는 블록(사이드바, 버전 배너, 목차 등)을 찾아 제거
+
+    페이지마다 블록 지문을 한 번씩만 세고, threshold 비율 이상의 페이지에
+    나타난 블록을 boilerplate로 본다. 페이지 수가 min_pages보다 적으면
+    빈도가 의미 없으므로 이전에 알려진 지문(known)만 제거한다.
+    """
+
+    def __init__(self, threshold: float = 0.5, min_pages: int = 5, known: set[str] | None = None):
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.known: set[str] = set(known or ())
+        self.pages = 0
+        self._counts: dict[str, int] = {}
+
+    def add(self, markdown: str) -> None:
+        """페이지 하나의 블록 지문을 집계"""
+        self.pages += 1
+        fingerprints = {block_fingerprint(b) for b in split_blocks(markdown) if not _is_protected(b)}
+        for fp in fingerprints:
+            self._counts[fp] = self._counts.get(fp, 0) + 1
+
+    def seen(self, fingerprint: str) -> bool:
+        """집계한 페이지 중 하나라도 이 지문의 블록이 있었는지"""
+        return fingerprint in self._counts
+
+    def boilerplate(self) -> set[str]:
+        """boilerplate로 판정된 지문 (이전에 알려진 지문 포함)"""
+        found = set(self.known)
+        if self.pages >= self.min_pages:
+            # 최소 두 페이지 이상에 나타나야 반복으로 봄
+            cutoff = max(2, self.threshold * self.pages)
+            found.update(fp for fp, count in self._counts.items() if count >= cutoff)
+        return found
+
+    def strip(self, markdown: str, boilerplate: set[str]) -> str:
+        """boilerplate 블록을 제거한 마크다운 (제거할 블록이 없으면 원문 그대로)"""
+        blocks = split_blocks(markdown)
+        kept = [b for b in blocks if _is_protected(b) or block_fingerprint(b) not in boilerplate]
+        if len(kept) == len(blocks):
+            return markdown
+        return _BLANK_LINES_RE.sub("\n\n", "\n\n".join(kept))
+
+
+def load_known_boilerplate(output_path: Path) -> dict[str, int]:
+    """이전 크롤링에서 저장한 boilerplate 지문 로드 (없으면 빈 dict)
+
+    Returns:
+        지문 -> 마지막으로 나타난 뒤 지난 dedupe 실행 수
+    """
+    path = Path(output_path) / BOILERPLATE_FILENAME
+    if not path.exists():
+        return {}
+    try:
+        fingerprints = json.loads(path.read_text(encoding="utf-8")).get("fingerprints", {})
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ Ignoring unreadable boilerplate file {path}: {e}")
+        return {}
+    if isinstance(fingerprints, list):
+        # 실행 수를 기록하기 전의 형식
+        return dict.fromkeys(fingerprints, 0)
+    return {fp: int(idle) for fp, idle in fingerprints.items()}
+
+
+def dedupe_files(
+    files: list[Path],
+    output_path: Path,
+    threshold: float = 0.5,
+    min_pages: int = 5,
+    known: dict[str, int] | None = None,
+    replace: Callable[[list[Path], str], None] | None = None,
+) -> dict:
+    """저장된 마크다운 파일들에서 페이지 간 반복 블록 제거
+
+    파일을 두 번 읽는다 (집계, 제거). 전체 코퍼스를 메모리에 올리지 않는다.
+    판정된 지문은 출력 디렉토리에 저장해서 다음 증분 크롤링에서 새 페이지에도 적용한다.
+    저장된 지문 중 이번 페이지들에 나타나지 않은 것은 실행 수를 세어
+    BOILERPLATE_MAX_IDLE_RUNS번 연속으로 나타나지 않으면 버린다.
+
+    Args:
+        files: URL별 파일 경로
+        output_path: 출력 디렉토리
+        threshold: 전체 페이지 중 이 비율 이상에 나타난 블록을 반복으로 판정
+        min_pages: 빈도로 판정하는 최소 페이지 수
+        known: load_known_boilerplate 결과 (증분 크롤링)
+        replace: 바뀐 내용을 저장하는 함수 (같은 파일을 가리키는 URL별 파일들, 새 내용).
+            None이면 파일을 원자적으로 다시 쓴다. 컨텐츠 저장소를 쓰면 ContentStore.replace를
+            넘겨서 객체를 고치지 않고 새 객체에 다시 연결한다
+
+    Returns:
+        {"pages", "blocks", "files_changed", "bytes_before", "bytes_after"}
+    """
+    known = known or {}
+    boilerplate_filter = BoilerplateFilter(threshold, min_pages, set(known))
+    # 컨텐츠 저장소 링크는 실제 객체로 풀어서 같은 내용을 한 번만 셈
+    groups: dict[Path, list[Path]] = {}
+    for f in files:
+        groups.setdefault(Path(f).resolve(), []).append(Path(f))
+
+    for file_path in groups:
+        boilerplate_filter.add(file_path.read_text(encoding="utf-8"))
+
+    boilerplate = boilerplate_filter.boilerplate()
+    stats = {"pages": len(groups), "blocks": len(boilerplate), "files_changed": 0, "bytes_before": 0, "bytes_after": 0}
+
+    for file_path, url_files in groups.items():
+        original = file_path.read_text(encoding="utf-8")
+        stripped = boilerplate_filter.strip(original, boilerplate)
+        stats["bytes_before"] += len(original.encode("utf-8"))
+        stats["bytes_after"] += len(stripped.encode("utf-8"))
+
+        if stripped != original:
+            if replace is not None:
+                replace(url_files, stripped)
+            else:
+                # 쓰는 도중 중단돼도 페이지가 잘리지 않도록
+                write_text_atomic(file_path, stripped)
+            stats["files_changed"] += 1
+
+    # 이번에 나타난 지문은 0부터, 나타나지 않은 지문은 실행 수를 늘려서 오래되면 버림
+    idle_runs = {}
+    for fp in boilerplate:
+        idle = 0 if boilerplate_filter.seen(fp) else known.get(fp, 0) + 1
+        if idle < BOILERPLATE_MAX_IDLE_RUNS:
+            idle_runs[fp] = idle
+    write_json_atomic(Path(output_path) / BOILERPLATE_FILENAME, {"fingerprints": dict(sorted(idle_runs.items()))})
+    return stats
@@ -0,0 +1,183 @@
+"""Heading-aware chunking of cleaned markdown for retrieval."""
+
+import hashlib
+import re
+
+from .boilerplate import split_blocks
+
+DEFAULT_CHUNK_TOKENS = 512
+DEFAULT_CHUNK_OVERLAP = 64
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (UTF-8 4바이트 ≈ 1토큰)
+
+    토크나이저 없이 쓰는 근사치로, 영어는 약 4글자, 한글/CJK는 약 1.3글자가 1토큰이 된다.
+    """
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def chunk_id(url: str, heading_path: list[str], ordinal: int, occurrence: int = 0) -> str:
+    """청크 ID (URL + heading 경로 + 섹션 안 순번의 blake2b 64bit hex)
+
+    본문이 바뀌어도 같은 섹션의 같은 위치면 ID가 유지되고,
+    다른 섹션이 추가/삭제되어도 영향을 받지 않는다.
+    같은 페이지에 heading 경로가 같은 섹션이 여러 번 나오면 (형제 "## Example" 등)
+    occurrence(그 경로의 몇 번째 섹션인지)로 구분한다. 첫 번째 섹션은 occurrence가
+    없던 때와 같은 ID를 유지한다.
+    """
+    parts = [url, *heading_path, str(ordinal)]
+    if occurrence:
+        parts.append(f"#{occurrence}")
+    key = "\n".join(parts)
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def check_chunk_sizes(target_tokens: int, overlap_tokens: int) -> None:
+    """청크 크기 옵션 검증
+
+    Raises:
+        ValueError: target_tokens가 0 이하이거나 overlap_tokens가 [0, target_tokens) 밖
+    """
+    if target_tokens <= 0:
+        raise ValueError(f"target_tokens must be positive (got {target_tokens})")
+    if not 0 <= overlap_tokens < target_tokens:
+        raise ValueError(f"overlap_tokens must be in [0, target_tokens) (got {overlap_tokens})")
+
+
+def _sections(markdown: str) -> list[tuple[list[str], list[str]]]:
+    """마크다운을 heading 기준 섹션으로 분리 (코드 펜스 안의 #은 heading이 아님)
+
+    Returns:
+        (heading 경로, 섹션 블록 목록) 리스트. 블록에는 섹션의 heading 줄도 포함된다
+    """
+    sections: list[tuple[list[str], list[str]]] = []
+    path: list[tuple[int, str]] = []
+    current: list[str] = []
+    in_fence = False
+
+    def flush() -> None:
+        text = "\n".join(current).strip("\n")
+        if text:
+            sections.append(([title for _, title in path], split_blocks(text)))
+
+    for line in markdown.split("\n"):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            flush()
+            current = []
+            level = len(match.group(1))
+            while path and path[-1][0] >= level:
+                path.pop()
+            path.append((level, match.group(2)))
+        current.append(line)
+
+    flush()
+    return sections
+
+
+def _split_oversized(block: str, target_tokens: int) -> list[str]:
+    """목표 크기보다 큰 블록을 줄 단위로 분할 (한 줄이 더 크면 그대로 둔다)"""
+    pieces: list[str] = []
+    lines: list[str] = []
+    tokens = 0
+    for line in block.split("\n"):
+        line_tokens = estimate_tokens(line) + 1
+        if lines and tokens + line_tokens > target_tokens:
+            pieces.append("\n".join(lines))
+            lines, tokens = [], 0
+        lines.append(line)
+        tokens += line_tokens
+    if lines:
+        pieces.append("\n".join(lines))
+    return pieces
+
+
+def chunk_markdown(
+    markdown: str,
+    url: str,
+    target_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_CHUNK_OVERLAP,
+) -> list[dict]:
+    """정리된 마크다운을 heading 경계에 맞춰 검색용 청크로 분할
+
+    - 청크는 heading 경계를 넘지 않는다. 섹션이 target_tokens보다 크면 빈 줄로
+      나뉜 블록 단위로 채워서 나누고, 이어지는 청크 앞에는 직전 청크의 마지막
+      블록들을 overlap_tokens 이내로 다시 넣는다
+    - heading 줄만 있는 섹션(바로 하위 heading이 오는 경우)은 청크를 만들지 않고
+      하위 청크의 heading_path로만 남는다
+    - 블록 하나가 target_tokens보다 크면 줄 단위로 나눈다 (코드 블록 포함)
+
+    Args:
+        markdown: 정리된 마크다운 (URL 헤더 없이)
+        url: 페이지 URL (청크 ID에 사용)
+        target_tokens: 청크 목표 크기 (estimate_tokens 기준)
+        overlap_tokens: 이어지는 청크 간 겹치는 최대 토큰 수
+
+    Returns:
+        청크 dict (id, url, index, heading_path, tokens, text) 리스트 (문서 순서)
+    """
+    check_chunk_sizes(target_tokens, overlap_tokens)
+
+    chunks: list[dict] = []
+
+    # heading 경로별 섹션 수 (같은 경로가 반복되면 occurrence로 구분)
+    occurrences: dict[tuple[str, ...], int] = {}
+
+    def emit(heading_path: list[str], ordinal: int, occurrence: int, blocks: list[str]) -> None:
+        text = "\n\n".join(blocks)
+        chunks.append(
+            {
+                "id": chunk_id(url, heading_path, ordinal, occurrence),
+                "url": url,
+                "index": len(chunks),
+                "heading_path": heading_path,
+                "tokens": estimate_tokens(text),
+                "text": text,
+            }
+        )
+
+    for heading_path, section_blocks in _sections(markdown):
+        key = tuple(heading_path)
+        occurrence = occurrences.get(key, 0)
+        occurrences[key] = occurrence + 1
+        if len(section_blocks) == 1 and _HEADING_RE.match(section_blocks[0]):
+            continue
+
+        blocks = [piece for block in section_blocks for piece in _split_oversized(block, target_tokens)]
+        ordinal = 0
+        current: list[str] = []
+        tokens = 0
+        # 현재 청크에서 새로 추가된 블록이 있는지 (overlap만으로 된 청크는 만들지 않음)
+        has_new = False
+
+        for block in blocks:
+            block_tokens = estimate_tokens(block) + 1
+            if has_new and tokens + block_tokens > target_tokens:
+                emit(heading_path, ordinal, occurrence, current)
+                ordinal += 1
+
+                # 직전 청크의 끝 블록들을 overlap으로 이어 붙임
+                overlap: list[str] = []
+                overlap_size = 0
+                for prev in reversed(current):
+                    prev_tokens = estimate_tokens(prev) + 1
+                    if overlap_size + prev_tokens > overlap_tokens:
+                        break
+                    overlap.insert(0, prev)
+                    overlap_size += prev_tokens
+                current, tokens, has_new = overlap, overlap_size, False
+
+            current.append(block)
+            tokens += block_tokens
+            has_new = True
+
+        if has_new:
+            emit(heading_path, ordinal, occurrence, current)
+
+    return chunks
@@ -1,9 +1,103 @@
 """Content processing strategies."""
 
 import re
+from functools import lru_cache
 
+from .dom import DEFAULT_PRUNE_TAGS, prune_html
 
-def clean_navigation_content(markdown: str) -> str:
+
+# 하단 네비게이션/푸터 시작을 나타내는 기본 패턴
+DEFAULT_FOOTER_PATTERNS = (
+    r"Was this page helpful\?",
+    r"ON THIS PAGE",
+    r"\[Next\s+.*\]",
+    r"\[Previous\s+.*\]",
+    r"Community Forum",
+    r"Discord Server",
+    r"GitHub Samples",
+    r"FigJam.*Enterprise.*Learn",
+)
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+# 패턴 맨 앞의 전역 플래그 ((?i), (?s) 등). 합친 정규식에서는 맨 앞이 아니게 되므로 범위 그룹으로 바꿈
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+def _scope_global_flags(pattern: str) -> str:
+    """맨 앞의 전역 플래그를 범위 플래그 그룹으로 변환 ("(?i)copyright" -> "(?i:copyright)")"""
+    flags = ""
+    pos = 0
+    while match := _GLOBAL_FLAGS_RE.match(pattern, pos):
+        flags += match.group(1)
+        pos = match.end()
+    if not flags:
+        return pattern
+    # verbose 모드면 패턴 끝의 주석이 닫는 괄호를 삼키지 않도록 줄을 바꿈
+    end = "\n)" if "x" in flags else ")"
+    return f"(?{flags}:{pattern[pos:]}{end}"
+
+
+def check_footer_patterns(patterns) -> None:
+    """푸터 패턴이 정규식으로 컴파일되는지 검증
+
+    Raises:
+        ValueError: 컴파일할 수 없는 패턴 (패턴과 re.error 메시지 포함)
+    """
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid footer pattern {pattern!r}: {e}") from e
+
+
+class FooterMatcher:
+    """여러 푸터 패턴 중 하나라도 줄에 걸리는지 검사
+
+    캡처 그룹이 없는 패턴은 비캡처 그룹으로 감싼 alternation 하나로 합쳐 줄마다 한 번만
+    검사한다 (패턴별로 re.search 하는 것과 같음). 캡처 그룹이 있는 패턴은 합치면 역참조(\\1)의
+    그룹 번호가 바뀌고 같은 이름의 그룹이 충돌하므로 따로 컴파일해서 검사한다.
+    패턴 맨 앞의 전역 플래그((?i) 등)는 그 패턴에만 적용되는 범위 그룹으로 바꾼다.
+    """
+
+    def __init__(self, patterns: tuple[str, ...]):
+        combined = []
+        self._separate: list[re.Pattern] = []
+        for pattern in patterns:
+            compiled = re.compile(pattern)
+            if compiled.groups:
+                self._separate.append(compiled)
+            else:
+                combined.append(f"(?:{_scope_global_flags(pattern)})")
+        self._combined = re.compile("|".join(combined)) if combined else None
+
+    def search(self, line: str) -> bool:
+        if self._combined is not None and self._combined.search(line):
+            return True
+        return any(pattern.search(line) for pattern in self._separate)
+
+
+@lru_cache(maxsize=32)
+def compile_footer_patterns(patterns: tuple[str, ...]) -> FooterMatcher:
+    """푸터 패턴들을 FooterMatcher로 컴파일 (패턴 조합별로 캐시)
+
+    Raises:
+        ValueError: 컴파일할 수 없는 패턴
+    """
+    check_footer_patterns(patterns)
+    return FooterMatcher(patterns)
+
+
+def _resolve_footer_matcher(footer_patterns) -> FooterMatcher | re.Pattern:
+    if footer_patterns is None:
+        return compile_footer_patterns(DEFAULT_FOOTER_PATTERNS)
+    if isinstance(footer_patterns, re.Pattern):
+        return footer_patterns
+    return compile_footer_patterns(tuple(footer_patterns))
+
+
+def clean_navigation_content(markdown: str, footer_patterns=None) -> str:
     """마크다운에서 네비게이션 컨텐츠 제거
 
     제거 대상:
@@ -15,10 +109,14 @@ def clean_navigation_content(markdown: str) -> str:
 
     Args:
         markdown: 원본 마크다운 텍스트
+        footer_patterns: 푸터 패턴 (정규식 문자열 리스트 또는 컴파일된 패턴).
+            None이면 DEFAULT_FOOTER_PATTERNS 사용
 
     Returns:
         정리된 마크다운 텍스트
     """
+    footer_matcher = _resolve_footer_matcher(footer_patterns)
+
     lines = markdown.split("\n")
     content_start = 0
     content_end = len(lines)
@@ -36,53 +134,36 @@ def clean_navigation_content(markdown: str) -> str:
             content_start = i
             break
 
-    # 하단 네비게이션/푸터 제거를 위한 패턴
-    footer_patterns = [
-        r"Was this page helpful\?",
-        r"ON THIS PAGE",
-        r"\[Next\s+.*\]",
-        r"\[Previous\s+.*\]",
-        r"Community Forum",
-        r"Discord Server",
-        r"GitHub Samples",
-        r"FigJam.*Enterprise.*Learn",
-    ]
-
-    # 하단에서 푸터 시작점 찾기
+    # 하단에서 푸터 시작점 찾기 (줄마다 합쳐진 정규식 한 번만 검사)
+    search = footer_matcher.search
     for i in range(len(lines) - 1, content_start, -1):
-        line = lines[i]
-        for pattern in footer_patterns:
-            if re.search(pattern, line):
-                content_end = i
-                break
-        if content_end < len(lines):
+        if search(lines[i]):
+            content_end = i
             break
 
     result = "\n".join(lines[content_start:content_end]).strip()
 
     # 추가 정리: 연속된 빈 줄을 하나로
-    result = re.sub(r"\n{3,}", "\n\n", result)
+    result = _BLANK_LINES_RE.sub("\n\n", result)
 
     return result
 
 
-def extract_main_content(html: str) -> str:
+def extract_main_content(
+    html: str,
+    tags: tuple[str, ...] = DEFAULT_PRUNE_TAGS,
+    selectors: tuple[str, ...] = (),
+) -> str:
     """HTML에서 메인 컨텐츠만 추출
 
-    nav, header, footer, aside 태그 제거
+    nav, header, footer, aside 태그 제거 (lxml, dom.prune_html 참고)
 
     Args:
         html: 원본 HTML
+        tags: 제거할 태그 이름 (기본: nav, header, footer, aside)
+        selectors: 추가로 제거할 단순 CSS 선택자 (tag, .class, #id, tag.class, tag#id)
 
     Returns:
         정리된 HTML
     """
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 네비게이션 관련 태그 제거
-    for tag in soup.find_all(["nav", "header", "footer", "aside"]):
-        tag.decompose()
-
-    return str(soup)
+    return prune_html(html, tuple(tags), tuple(selectors))
@@ -0,0 +1,111 @@
+"""lxml-based DOM pruning."""
+
+import html as html_lib
+import re
+from functools import lru_cache
+
+# 본문이 아닌 영역으로 보고 제거하는 기본 태그
+DEFAULT_PRUNE_TAGS = ("nav", "header", "footer", "aside")
+
+# 문서 전체(<!DOCTYPE> / <html> / <head> / <body>로 시작)인지 판단. 아니면 조각으로 파싱
+_DOCUMENT_RE = re.compile(r"^\ufeff?\s*(?:<!--.*?-->\s*)*<(!doctype|html|head|body)\b", re.IGNORECASE | re.DOTALL)
+
+# 지원하는 선택자: [tag][.class | #id] (이름은 CSS 식별자)
+_SELECTOR_RE = re.compile(r"([A-Za-z][A-Za-z0-9-]*)?(?:([.#])(-?[A-Za-z_][\w-]*))?")
+
+
+def _xpath_literal(value: str) -> str:
+    """문자열을 XPath 문자열 리터럴로 (따옴표가 섞여 있으면 concat으로)"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _selector_to_xpath(selector: str) -> str:
+    """단순 CSS 선택자(tag, .class, #id, tag.class, tag#id)를 XPath로 변환
+
+    Raises:
+        ValueError: 지원하지 않는 선택자 (조합자, 속성 선택자, 여러 클래스 등)
+    """
+    match = _SELECTOR_RE.fullmatch(selector.strip())
+    if match is None or not any(match.groups()):
+        raise ValueError(f"Unsupported selector {selector!r}: use tag, .class, #id, tag.class or tag#id")
+
+    tag, marker, name = match.groups()
+    if marker == ".":
+        predicate = f"[contains(concat(' ', normalize-space(@class), ' '), {_xpath_literal(f' {name} ')})]"
+    elif marker == "#":
+        predicate = f"[@id={_xpath_literal(name)}]"
+    else:
+        predicate = ""
+    return f"//{tag or '*'}{predicate}"
+
+
+def check_selectors(selectors: tuple[str, ...]) -> None:
+    """prune 선택자가 모두 지원하는 형태인지 확인
+
+    Raises:
+        ValueError: 지원하지 않는 선택자 (선택자를 메시지에 포함)
+    """
+    for selector in selectors:
+        _selector_to_xpath(selector)
+
+
+@lru_cache(maxsize=32)
+def _compile_selectors(selectors: tuple[str, ...]):
+    from lxml.etree import XPath
+
+    return [XPath(_selector_to_xpath(s)) for s in selectors]
+
+
+def prune_html(
+    html: str,
+    tags: tuple[str, ...] = DEFAULT_PRUNE_TAGS,
+    selectors: tuple[str, ...] = (),
+) -> str:
+    """HTML에서 지정한 태그/선택자에 해당하는 요소를 제거
+
+    요소 뒤에 붙은 텍스트(tail)는 유지한다. 문서 전체를 넘기면 DOCTYPE까지 포함한
+    문서를, 조각(<div>...</div> 등)을 넘기면 <html>/<body>로 감싸지 않은 조각을 돌려준다.
+
+    Args:
+        html: 원본 HTML
+        tags: 제거할 태그 이름
+        selectors: 제거할 단순 CSS 선택자 (tag, .class, #id, tag.class, tag#id)
+
+    Returns:
+        정리된 HTML
+    """
+    import lxml.html
+
+    if not html or not html.strip():
+        return html
+
+    match = _DOCUMENT_RE.match(html)
+    document = match is not None
+    if document:
+        root = lxml.html.document_fromstring(html)
+    else:
+        # 조각은 임시 부모 아래에 파싱해서 부모 없이 다시 직렬화
+        root = lxml.html.fragment_fromstring(html, create_parent="div")
+
+    doomed = list(root.iter(*tags)) if tags else []
+    for xpath in _compile_selectors(tuple(selectors)):
+        doomed.extend(xpath(root))
+
+    for element in doomed:
+        # 루트(html)는 제거할 수 없음. 이미 떨어져 나간 서브트리 안의 요소는 제거해도 무해
+        if element.getparent() is not None:
+            element.drop_tree()
+
+    if document:
+        # 원본에 DOCTYPE이 없으면 lxml이 채운 기본값을 붙이지 않음
+        doctype = root.getroottree().docinfo.doctype if match.group(1).lower() == "!doctype" else None
+        return lxml.html.tostring(root, encoding="unicode", doctype=doctype or None)
+
+    # 부모의 text(첫 요소 앞 텍스트)와 자식들 (각 자식의 tail 포함)
+    parts = [html_lib.escape(root.text, quote=False)] if root.text else []
+    parts.extend(lxml.html.tostring(child, encoding="unicode") for child in root)
+    return "".join(parts)
@@ -0,0 +1,204 @@
+"""HTTP-only fetch tier for server-rendered pages."""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+
+import httpx
+
+# 프레임워크 루트 컨테이너가 비어 있으면 JS로 렌더링되는 셸 페이지
+_EMPTY_ROOT_RE = re.compile(
+    r"""<div[^>]*\bid\s*=\s*["'](?:root|app|__next|__nuxt|___gatsby|svelte)["'][^>]*>\s*</div>""",
+    re.IGNORECASE,
+)
+_JS_REQUIRED_RE = re.compile(r"<noscript[^>]*>[^<]*(?:enable|requires?)\s+javascript", re.IGNORECASE)
+
+# 추출된 마크다운이 이보다 짧으면 본문이 JS로 채워지는 페이지로 판단
+MIN_TEXT_CHARS = 200
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+
+@dataclass
+class FetchStats:
+    """요청을 어느 단계(HTTP / 브라우저)가 처리했는지 집계"""
+
+    http: int = 0
+    browser: int = 0
+    # 브라우저로 넘어간 이유별 횟수 (js_shell, thin_content, http_403, ...)
+    fallbacks: dict[str, int] = field(default_factory=dict)
+
+    def record(self, tier: str) -> None:
+        """요청을 처리한 단계 기록 ("http" 또는 "browser")"""
+        if tier == "http":
+            self.http += 1
+        else:
+            self.browser += 1
+
+    def record_fallback(self, reason: str) -> None:
+        self.fallbacks[reason] = self.fallbacks.get(reason, 0) + 1
+
+    def as_dict(self) -> dict:
+        total = self.http + self.browser
+        return {
+            "http": self.http,
+            "browser": self.browser,
+            "http_ratio": self.http / total if total else 0.0,
+            "fallbacks": dict(self.fallbacks),
+        }
+
+
+@dataclass
+class HttpPage:
+    """HTTP 단계에서 추출한 페이지 (CrawlResult에서 쓰는 필드만)"""
+
+    url: str
+    status_code: int
+    headers: dict
+    html: str
+    cleaned_html: str
+    markdown: str
+
+
+def detect_js_shell(html: str) -> str | None:
+    """HTML만 보고 JS 렌더링이 필요한 셸인지 판단 (필요하면 이유, 아니면 None)"""
+    if _EMPTY_ROOT_RE.search(html):
+        return "js_shell"
+    if _JS_REQUIRED_RE.search(html):
+        return "js_required"
+    return None
+
+
+def supports_config(crawler_config) -> bool:
+    """HTTP 단계로 처리할 수 있는 크롤러 설정인지 확인
+
+    JS 실행, 대기 조건, 스크롤/iframe, 스크린샷/PDF처럼 브라우저가 있어야 하는 옵션이 있거나
+    Deep Crawl 전략이 붙은 설정이면 처음부터 브라우저를 쓴다.
+    """
+    return not (
+        crawler_config.js_code
+        or crawler_config.wait_for
+        or crawler_config.scan_full_page
+        or crawler_config.process_iframes
+        or crawler_config.screenshot
+        or crawler_config.pdf
+        or crawler_config.deep_crawl_strategy
+    )
+
+
+def _extract(url: str, html: str, crawler_config) -> tuple[str, str]:
+    """크롤러 설정의 스크래핑 전략/마크다운 생성기로 추출 (브라우저 경로와 같은 처리)
+
+    Returns:
+        (cleaned_html, raw_markdown)
+    """
+    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+    params = crawler_config.__dict__.copy()
+    params.pop("url", None)
+    scraped = crawler_config.scraping_strategy.scrap(url, html, **params)
+    if scraped is None or not scraped.success:
+        return "", ""
+
+    generator = crawler_config.markdown_generator or DefaultMarkdownGenerator()
+    markdown = generator.generate_markdown(input_html=scraped.cleaned_html, base_url=url)
+    return scraped.cleaned_html, markdown.raw_markdown
+
+
+class HttpFetcher:
+    """브라우저 없이 HTTP 클라이언트로 먼저 가져오는 fetch 단계
+
+    서버 렌더링된 문서 페이지는 HTTP 응답만으로 충분하므로 Chromium을 띄우지 않는다.
+    JS 셸(빈 #root/#__next 등), 얇은 본문, HTML이 아닌 응답, 200이 아닌 응답이면
+    None을 반환하고 호출자가 브라우저로 다시 크롤링한다.
+    연결은 커넥션 풀로 재사용되므로 인스턴스를 오래 유지하는 것이 좋다.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        max_connections: int = 20,
+        min_text_chars: int = MIN_TEXT_CHARS,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.min_text_chars = min_text_chars
+        self.user_agent = user_agent
+        self.stats = FetchStats()
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                headers={
+                    "User-Agent": self.user_agent,
+                    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                },
+            )
+        return self._client
+
+    async def fetch(self, url: str, crawler_config) -> HttpPage | None:
+        """HTTP로 가져와서 추출 (브라우저가 필요하면 None, 이유는 stats.fallbacks에 기록)
+
+        잘못된 URL(httpx.InvalidURL은 HTTPError가 아님)이나 추출 실패도 예외 대신 None을
+        반환해서 그 URL만 브라우저로 넘어가게 한다.
+        """
+        try:
+            response = await self._get_client().get(url)
+        except httpx.InvalidURL:
+            return self._fallback("invalid_url")
+        except httpx.HTTPError:
+            return self._fallback("http_error")
+
+        if response.status_code != 200:
+            return self._fallback(f"http_{response.status_code}")
+
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type:
+            return self._fallback("not_html")
+
+        html = response.text
+        reason = detect_js_shell(html)
+        if reason:
+            return self._fallback(reason)
+
+        final_url = str(response.url)
+        try:
+            cleaned_html, markdown = await asyncio.to_thread(_extract, final_url, html, crawler_config)
+        except Exception:
+            return self._fallback("extract_error")
+        if len(markdown.strip()) < self.min_text_chars:
+            return self._fallback("thin_content")
+
+        self.stats.record("http")
+        # 리다이렉트되면 최종 URL을 보고 (파일 이름과 상대 링크 기준이 실제 페이지가 되도록)
+        return HttpPage(
+            url=final_url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            html=html,
+            cleaned_html=cleaned_html,
+            markdown=markdown,
+        )
+
+    def _fallback(self, reason: str) -> None:
+        # 실제 브라우저 요청은 호출자가 stats.record("browser")로 집계
+        self.stats.record_fallback(reason)
+        return None
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "HttpFetcher":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
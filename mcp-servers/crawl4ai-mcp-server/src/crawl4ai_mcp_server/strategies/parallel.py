@@ -0,0 +1,96 @@
+"""Process-pool offload for CPU-bound page cleaning and chunking."""
+
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .chunking import chunk_markdown
+from .pipeline import CleaningPipeline
+
+# PageWriter가 한 번에 워커 프로세스로 넘기는 최대 페이지 수
+DEFAULT_CLEAN_BATCH = 8
+
+
+def _clean_batch(
+    pipeline: CleaningPipeline,
+    items: list[tuple[str, str, str | None]],
+    chunk_sizes: tuple[int, int] | None,
+) -> list[tuple[str, list[dict] | None, float]]:
+    """워커 프로세스: 페이지 묶음 정리 (+ 청크 분할)
+
+    Returns:
+        페이지별 (정리된 마크다운, 청크 리스트 또는 None, 정리 시간(초))
+    """
+    results = []
+    for url, markdown, html in items:
+        start = time.perf_counter()
+        cleaned = pipeline.run(markdown, html=html, url=url)
+        seconds = time.perf_counter() - start
+        chunks = chunk_markdown(cleaned, url, *chunk_sizes) if chunk_sizes else None
+        results.append((cleaned, chunks, seconds))
+    return results
+
+
+class CleaningPool:
+    """정리 파이프라인(룰 팩)과 청크 분할을 프로세스 풀에서 실행
+
+    PageWriter 워커 스레드의 정리는 GIL을 나눠 쓰므로 큰 페이지가 많으면 코어
+    하나에 묶인다. 이 풀은 페이지를 묶음 단위로 워커 프로세스에 넘겨서
+    (pickle 왕복을 묶음당 한 번으로) 정리/청크 분할을 여러 코어로 나눈다.
+
+    워커는 forkserver(없으면 spawn)로 띄운다. 브라우저/이벤트 루프 스레드가 있는
+    프로세스를 fork하지 않기 위해서다.
+
+    Args:
+        pipeline: 정리 파이프라인 (pickle 가능해야 함)
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        chunk_sizes: (target_tokens, overlap_tokens). 지정하면 정리 직후 청크도 나눔
+
+    Raises:
+        ValueError: pipeline을 pickle할 수 없음 (람다 등을 가진 사용자 정의 단계)
+    """
+
+    def __init__(
+        self,
+        pipeline: CleaningPipeline,
+        workers: int | None = None,
+        chunk_sizes: tuple[int, int] | None = None,
+    ):
+        try:
+            pickle.dumps(pipeline)
+        except Exception as e:
+            raise ValueError(f"Rule pack {pipeline.name!r} cannot be sent to worker processes: {e}") from e
+
+        self.pipeline = pipeline
+        self.chunk_sizes = chunk_sizes
+        self.workers = workers or os.cpu_count() or 1
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+    def clean_pages(self, pages: list[dict]) -> None:
+        """페이지 묶음을 워커 프로세스에서 정리 (호출한 스레드는 끝날 때까지 대기)
+
+        각 페이지 dict에 cleaned(정리된 마크다운), clean_seconds, chunks(chunk_sizes가
+        없으면 None)를 채운다.
+        """
+        if not pages:
+            return
+        items = [(page["url"], page["markdown"], page["html"]) for page in pages]
+        results = self._executor.submit(_clean_batch, self.pipeline, items, self.chunk_sizes).result()
+        for page, (cleaned, chunks, seconds) in zip(pages, results):
+            page["cleaned"] = cleaned
+            page["clean_seconds"] = seconds
+            page["chunks"] = chunks
+
+    def close(self) -> None:
+        """워커 프로세스 종료 (진행 중인 묶음은 끝까지 처리)"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "CleaningPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
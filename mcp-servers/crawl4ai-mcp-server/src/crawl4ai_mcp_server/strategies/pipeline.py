@@ -0,0 +1,152 @@
+"""Composable content-cleaning pipeline."""
+
+import re
+
+from .content import DEFAULT_FOOTER_PATTERNS, compile_footer_patterns
+from .dom import DEFAULT_PRUNE_TAGS, check_selectors, prune_html
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+class HtmlPruneStage:
+    """HTML에서 nav/header/footer/aside 등을 제거 (lxml)
+
+    HTML 단계가 실행되면 마크다운은 정리된 HTML에서 다시 생성된다.
+    선택자는 룰 팩을 만들 때 검사하므로 지원하지 않는 선택자는 크롤링 전에 ValueError가 난다.
+    """
+
+    kind = "html"
+
+    def __init__(self, tags: tuple[str, ...] = DEFAULT_PRUNE_TAGS, selectors: tuple[str, ...] = ()):
+        self.tags = tuple(tags)
+        self.selectors = tuple(selectors)
+        check_selectors(self.selectors)
+
+    def __call__(self, html: str) -> str:
+        return prune_html(html, self.tags, self.selectors)
+
+
+class HeadingTrimStage:
+    """첫 heading 이전의 리스트/링크/빈 줄 제거"""
+
+    kind = "lines"
+
+    def __call__(self, lines: list[str]) -> list[str]:
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+
+            # 빈 줄이거나 리스트/링크인 경우 계속
+            if not stripped or stripped.startswith("*") or stripped.startswith("["):
+                continue
+
+            # 첫 번째 heading을 찾으면 시작점으로 설정
+            if stripped.startswith("#") and i > 0:
+                return lines[i:]
+
+        return lines
+
+
+class FooterCutStage:
+    """하단에서 마지막으로 푸터 패턴에 걸리는 줄부터 끝까지 제거 (첫 줄은 제외)"""
+
+    kind = "lines"
+
+    def __init__(self, patterns: tuple[str, ...] = DEFAULT_FOOTER_PATTERNS):
+        self.patterns = tuple(patterns)
+        self._matcher = compile_footer_patterns(self.patterns)
+
+    def __call__(self, lines: list[str]) -> list[str]:
+        search = self._matcher.search
+        for i in range(len(lines) - 1, 0, -1):
+            if search(lines[i]):
+                return lines[:i]
+        return lines
+
+
+class CollapseBlankLinesStage:
+    """앞뒤 공백을 제거하고 연속된 빈 줄을 하나로"""
+
+    kind = "text"
+
+    def __call__(self, text: str) -> str:
+        return _BLANK_LINES_RE.sub("\n\n", text.strip())
+
+
+class CleaningPipeline:
+    """정리 단계들을 순서대로 실행하는 파이프라인
+
+    단계 종류:
+    - "html": HTML -> HTML (실행되면 마크다운을 HTML에서 다시 생성)
+    - "lines": 줄 리스트 -> 줄 리스트 (split/join은 파이프라인이 한 번만 수행)
+    - "text": 마크다운 -> 마크다운
+
+    HTML 단계는 마크다운 단계보다 앞에 와야 한다.
+    """
+
+    def __init__(self, name: str, stages: list):
+        self.name = name
+        self.stages = list(stages)
+
+    @property
+    def needs_html(self) -> bool:
+        """HTML 단계가 있어서 페이지 HTML이 필요한지 여부"""
+        return any(stage.kind == "html" for stage in self.stages)
+
+    def with_footer_patterns(self, patterns) -> "CleaningPipeline":
+        """푸터 패턴만 바꾼 파이프라인 (푸터 단계가 없으면 그대로)"""
+        stages = [
+            FooterCutStage(tuple(patterns)) if isinstance(stage, FooterCutStage) else stage
+            for stage in self.stages
+        ]
+        return CleaningPipeline(f"{self.name}+footer", stages)
+
+    def run(self, markdown: str, html: str | None = None, url: str = "") -> str:
+        """파이프라인 실행
+
+        Args:
+            markdown: 크롤러가 생성한 원본 마크다운
+            html: 페이지 HTML (HTML 단계가 있을 때만 사용, 없으면 HTML 단계 생략)
+            url: 페이지 URL (마크다운 재생성 시 상대 링크 기준)
+
+        Returns:
+            정리된 마크다운 텍스트
+        """
+        text = markdown
+        lines = None
+        html_changed = False
+
+        for stage in self.stages:
+            if stage.kind == "html":
+                if html is not None:
+                    html = stage(html)
+                    html_changed = True
+                continue
+
+            if html_changed:
+                text = html_to_markdown(html, url)
+                html_changed = False
+
+            if stage.kind == "lines":
+                if lines is None:
+                    lines = text.split("\n")
+                lines = stage(lines)
+            else:
+                if lines is not None:
+                    text = "\n".join(lines)
+                    lines = None
+                text = stage(text)
+
+        if html_changed:
+            text = html_to_markdown(html, url)
+        if lines is not None:
+            text = "\n".join(lines)
+
+        return text
+
+
+def html_to_markdown(html: str, url: str = "") -> str:
+    """HTML을 crawl4ai 기본 마크다운 생성기로 변환"""
+    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+    result = DefaultMarkdownGenerator().generate_markdown(input_html=html, base_url=url)
+    return result.raw_markdown
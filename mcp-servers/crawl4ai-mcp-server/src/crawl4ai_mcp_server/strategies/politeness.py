@@ -0,0 +1,266 @@
+"""Per-host politeness scheduling and adaptive rate limiting."""
+
+import asyncio
+import time
+import urllib.request
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from ..utils.memory import process_tree_rss
+
+# 이 상태 코드를 받으면 호스트가 과부하라고 보고 backoff
+THROTTLE_STATUS_CODES = (429, 503)
+
+# max_memory_mb 초과 시 메모리 사용량을 다시 확인하는 간격 (초)
+MEMORY_POLL_INTERVAL = 0.5
+
+
+class _HostState:
+    """호스트별 스케줄링 상태"""
+
+    def __init__(self, max_concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()
+        # 요청 시작 간 최소 간격 (초). floor 아래로는 내려가지 않는다
+        self.floor = delay
+        self.delay = delay
+        self.next_start = 0.0
+        self.robots_checked = False
+
+
+class HostScheduler:
+    """호스트별 동시성/간격 제한 + AIMD 방식 적응형 속도 조절
+
+    - 호스트당 동시 요청 수 제한 (max_per_host)
+    - 호스트당 요청 시작 간 최소 간격 (min_delay, robots.txt Crawl-delay 중 큰 값)
+    - 429/503을 받으면 간격을 backoff_factor배로 늘리고 (multiplicative decrease),
+      성공할 때마다 recovery_step초씩 줄인다 (additive increase)
+    - 전체 동시 요청 수 제한 (max_concurrency)
+    - 메모리 상한 (max_memory_mb): 이 프로세스와 브라우저 프로세스의 RSS 합이 넘으면
+      진행 중인 요청이 끝날 때까지 새 요청을 시작하지 않는다 (진행 중인 요청이 없으면 시작)
+
+    여러 크롤링 작업이 하나의 스케줄러를 공유하면 호스트 제한도 함께 적용된다.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 2,
+        min_delay: float = 0.0,
+        respect_crawl_delay: bool = True,
+        max_concurrency: int = 10,
+        backoff_factor: float = 2.0,
+        recovery_step: float = 0.1,
+        max_delay: float = 60.0,
+        max_retries: int = 3,
+        user_agent: str = "*",
+        max_memory_mb: int | None = None,
+    ):
+        self.max_per_host = max(1, max_per_host)
+        self.min_delay = max(0.0, min_delay)
+        self.respect_crawl_delay = respect_crawl_delay
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.user_agent = user_agent
+        self.max_memory_mb = max_memory_mb
+        self._global = asyncio.Semaphore(max(1, max_concurrency))
+        self._hosts: dict[str, _HostState] = {}
+        self._in_flight = 0
+        self._memory_paused = False
+        self._memory_sample = 0
+        self._memory_sampled_at = float("-inf")
+        # 메모리 상한 때문에 시작이 늦춰진 요청 수
+        self.memory_waits = 0
+
+    def _host_state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.max_per_host, self.min_delay)
+            self._hosts[host] = state
+        return state
+
+    async def _apply_robots_delay(self, url: str, state: _HostState) -> None:
+        """호스트의 robots.txt Crawl-delay를 최소 간격에 반영 (호스트당 한 번)"""
+        if state.robots_checked:
+            return
+        state.robots_checked = True
+
+        if not self.respect_crawl_delay:
+            return
+
+        crawl_delay = await asyncio.to_thread(_fetch_crawl_delay, url, self.user_agent)
+        if crawl_delay:
+            state.floor = max(state.floor, crawl_delay)
+            state.delay = max(state.delay, state.floor)
+            print(f"🤖 {urlparse(url).netloc}: robots.txt Crawl-delay {crawl_delay}s")
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """요청 하나를 보낼 수 있을 때까지 대기 (전체/호스트 동시성 + 간격 + 메모리 상한)"""
+        host = urlparse(url).netloc
+        state = self._host_state(host)
+
+        async with state.semaphore:
+            async with state.lock:
+                await self._apply_robots_delay(url, state)
+
+                wait = state.next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                state.next_start = time.monotonic() + state.delay
+
+            await self._wait_for_memory()
+
+            # 간격 대기 중에는 전체 슬롯을 잡지 않아 다른 호스트 요청이 막히지 않음
+            async with self._global:
+                self._in_flight += 1
+                try:
+                    yield
+                finally:
+                    self._in_flight -= 1
+
+    async def _wait_for_memory(self) -> None:
+        """메모리 사용량이 max_memory_mb 아래로 내려갈 때까지 대기"""
+        if not self.max_memory_mb:
+            return
+
+        limit = self.max_memory_mb * 1024 * 1024
+        waited = False
+        while self._in_flight and await self._memory_used() > limit:
+            if not waited:
+                waited = True
+                self.memory_waits += 1
+                if not self._memory_paused:
+                    self._memory_paused = True
+                    print(f"🧠 Memory above {self.max_memory_mb} MB, holding new requests")
+            await asyncio.sleep(MEMORY_POLL_INTERVAL)
+        self._memory_paused = False
+
+    async def _memory_used(self) -> int:
+        """프로세스 트리 RSS (대기 중인 요청이 많아도 MEMORY_POLL_INTERVAL마다 한 번만 측정)"""
+        now = time.monotonic()
+        if now - self._memory_sampled_at >= MEMORY_POLL_INTERVAL:
+            self._memory_sampled_at = now
+            self._memory_sample = await asyncio.to_thread(process_tree_rss)
+        return self._memory_sample
+
+    def feedback(self, url: str, status_code: int | None, headers: dict | None = None) -> bool:
+        """응답 결과로 호스트 간격 조정
+
+        Returns:
+            과부하 응답(429/503)이면 True (호출자가 재시도 여부 판단)
+        """
+        state = self._host_state(urlparse(url).netloc)
+
+        if status_code in THROTTLE_STATUS_CODES:
+            retry_after = _parse_retry_after(headers)
+            backoff = max(state.delay * self.backoff_factor, state.floor, 1.0)
+            state.delay = min(max(backoff, retry_after or 0.0), self.max_delay)
+            state.next_start = max(state.next_start, time.monotonic() + state.delay)
+            print(f"🐢 {urlparse(url).netloc}: HTTP {status_code}, delay -> {state.delay:.1f}s")
+            return True
+
+        state.delay = max(state.floor, state.delay - self.recovery_step)
+        return False
+
+
+def create_host_scheduler(
+    max_per_host: int = None,
+    min_delay: float = None,
+    respect_crawl_delay: bool = False,
+) -> HostScheduler | None:
+    """CLI/MCP 옵션으로 HostScheduler 생성
+
+    아무 옵션도 지정하지 않으면 None (crawl4ai 기본 디스패처 사용).
+    하나라도 지정하면 429/503 AIMD backoff도 함께 활성화된다.
+    """
+    if not max_per_host and not min_delay and not respect_crawl_delay:
+        return None
+
+    return HostScheduler(
+        max_per_host=max_per_host or 2,
+        min_delay=min_delay or 0.0,
+        respect_crawl_delay=respect_crawl_delay,
+    )
+
+
+class PoliteCrawler:
+    """HostScheduler를 거쳐 URL마다 crawler.arun을 호출하는 AsyncWebCrawler 래퍼
+
+    Deep Crawl 전략은 레벨마다 crawler.arun_many를 호출하므로, 전략에 이 래퍼를
+    넘기면 모든 요청이 스케줄러를 거친다. 나머지 속성은 원래 크롤러로 위임한다.
+    """
+
+    def __init__(self, crawler, scheduler: HostScheduler):
+        self._crawler = crawler
+        self._scheduler = scheduler
+
+    def __getattr__(self, name):
+        return getattr(self._crawler, name)
+
+    async def _crawl_one(self, url: str, config, **kwargs):
+        attempt = 0
+        while True:
+            async with self._scheduler.slot(url):
+                container = await self._crawler.arun(url, config=config, **kwargs)
+
+            # arun은 CrawlResultContainer를 반환하므로 첫 결과를 꺼냄
+            result = getattr(container, "_results", [container])[0]
+
+            throttled = self._scheduler.feedback(url, result.status_code, result.response_headers)
+            if not throttled or attempt >= self._scheduler.max_retries:
+                return result
+            attempt += 1
+
+    async def arun_many(self, urls: list[str], config=None, dispatcher=None, **kwargs):
+        """crawler.arun_many와 같은 형태로 반환 (config.stream이면 async generator)"""
+        if config is not None and config.stream:
+            return self._stream(urls, config, **kwargs)
+
+        return list(await asyncio.gather(*(self._crawl_one(url, config, **kwargs) for url in urls)))
+
+    async def _stream(self, urls: list[str], config, **kwargs):
+        tasks = [asyncio.create_task(self._crawl_one(url, config, **kwargs)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 멈추면 (예: max_pages 도달) 남은 요청 취소
+            for task in tasks:
+                task.cancel()
+
+
+def _fetch_crawl_delay(url: str, user_agent: str) -> float | None:
+    """robots.txt의 Crawl-delay 조회 (실패하면 None)"""
+    parsed = urlparse(url)
+    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+    try:
+        with urllib.request.urlopen(robots_url, timeout=10) as response:
+            lines = response.read().decode("utf-8", errors="replace").splitlines()
+    except Exception:
+        return None
+
+    parser = RobotFileParser(robots_url)
+    parser.parse(lines)
+    delay = parser.crawl_delay(user_agent)
+    return float(delay) if delay else None
+
+
+def _parse_retry_after(headers: dict | None) -> float | None:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) 파싱"""
+    for key, value in (headers or {}).items():
+        if key.lower() != "retry-after":
+            continue
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    return None
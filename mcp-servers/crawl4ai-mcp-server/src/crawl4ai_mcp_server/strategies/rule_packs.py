@@ -0,0 +1,135 @@
+"""Per-domain rule packs for the cleaning pipeline."""
+
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+from .pipeline import (
+    CleaningPipeline,
+    CollapseBlankLinesStage,
+    FooterCutStage,
+    HeadingTrimStage,
+    HtmlPruneStage,
+)
+
+# 사이트와 무관하게 자주 쓰이는 문서 사이트 푸터 패턴
+GENERIC_FOOTER_PATTERNS = (
+    r"Was this page helpful\?",
+    r"ON THIS PAGE",
+    r"\[Next\s+.*\]",
+    r"\[Previous\s+.*\]",
+    r"Community Forum",
+    r"Discord Server",
+    r"GitHub Samples",
+)
+
+# Figma 도움말 센터 하단 링크 묶음
+FIGMA_FOOTER_PATTERNS = (r"FigJam.*Enterprise.*Learn",)
+
+DEFAULT_RULE_PACK = "default"
+
+_RULE_PACKS: dict[str, Callable[[], CleaningPipeline]] = {}
+_DOMAIN_PACKS: dict[str, str] = {}
+_PIPELINES: dict[str, CleaningPipeline] = {}
+
+
+def register_rule_pack(
+    name: str,
+    factory: Callable[[], CleaningPipeline],
+    domains: tuple[str, ...] = (),
+) -> None:
+    """룰 팩 등록
+
+    Args:
+        name: 룰 팩 이름 (CLI --rule-pack 등에서 사용)
+        factory: CleaningPipeline을 만드는 함수 (처음 사용할 때 한 번 호출)
+        domains: 자동으로 이 룰 팩을 쓸 도메인 (서브도메인 포함)
+    """
+    _RULE_PACKS[name] = factory
+    _PIPELINES.pop(name, None)
+    for domain in domains:
+        _DOMAIN_PACKS[domain.lower()] = name
+
+
+def list_rule_packs() -> list[str]:
+    """등록된 룰 팩 이름 목록"""
+    return sorted(_RULE_PACKS)
+
+
+def get_rule_pack(name: str) -> CleaningPipeline:
+    """이름으로 룰 팩 파이프라인 조회
+
+    Raises:
+        ValueError: 등록되지 않은 이름
+    """
+    pipeline = _PIPELINES.get(name)
+    if pipeline is None:
+        factory = _RULE_PACKS.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown rule pack: {name!r} (available: {', '.join(list_rule_packs())})")
+        pipeline = _PIPELINES[name] = factory()
+    return pipeline
+
+
+def rule_pack_for_url(url: str) -> str:
+    """URL의 호스트에 맞는 룰 팩 이름 (없으면 "default")"""
+    host = (urlparse(url).hostname or "").lower()
+    parts = host.split(".")
+
+    # 가장 구체적인 도메인부터 확인 (help.figma.com -> figma.com)
+    for i in range(len(parts) - 1):
+        name = _DOMAIN_PACKS.get(".".join(parts[i:]))
+        if name is not None:
+            return name
+    return DEFAULT_RULE_PACK
+
+
+def resolve_pipeline(
+    url: str,
+    rule_pack: str | None = None,
+    footer_patterns: list[str] | None = None,
+) -> CleaningPipeline:
+    """크롤링에 쓸 정리 파이프라인 결정
+
+    Args:
+        url: 시작 URL (rule_pack이 None이면 도메인으로 룰 팩 선택)
+        rule_pack: 룰 팩 이름 (None이면 자동 선택)
+        footer_patterns: 지정 시 룰 팩의 푸터 패턴을 이 패턴으로 교체
+    """
+    pipeline = get_rule_pack(rule_pack or rule_pack_for_url(url))
+    if footer_patterns:
+        pipeline = pipeline.with_footer_patterns(footer_patterns)
+    return pipeline
+
+
+register_rule_pack(
+    "default",
+    lambda: CleaningPipeline(
+        "default",
+        [HeadingTrimStage(), FooterCutStage(GENERIC_FOOTER_PATTERNS), CollapseBlankLinesStage()],
+    ),
+)
+
+register_rule_pack(
+    "figma",
+    lambda: CleaningPipeline(
+        "figma",
+        [
+            HeadingTrimStage(),
+            FooterCutStage(GENERIC_FOOTER_PATTERNS + FIGMA_FOOTER_PATTERNS),
+            CollapseBlankLinesStage(),
+        ],
+    ),
+    domains=("figma.com",),
+)
+
+# 사이드바/헤더가 마크다운에 섞여 들어오는 사이트용: HTML 단계에서 먼저 제거
+register_rule_pack(
+    "semantic",
+    lambda: CleaningPipeline(
+        "semantic",
+        [HtmlPruneStage(), HeadingTrimStage(), FooterCutStage(GENERIC_FOOTER_PATTERNS), CollapseBlankLinesStage()],
+    ),
+)
+
+# 정리 최소화 (빈 줄만 정리)
+register_rule_pack("minimal", lambda: CleaningPipeline("minimal", [CollapseBlankLinesStage()]))
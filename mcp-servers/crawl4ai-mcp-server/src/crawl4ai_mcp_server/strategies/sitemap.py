@@ -0,0 +1,193 @@
+"""Streaming sitemap discovery and parsing."""
+
+import zlib
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timezone
+from typing import NamedTuple
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+import httpx
+
+from ..utils.url import canonical_prefix, canonicalize_url, matches_prefix
+
+# 사이트맵 인덱스가 가리키는 하위 사이트맵을 최대 몇 개까지 따라갈지
+MAX_SITEMAPS = 1000
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SitemapEntry(NamedTuple):
+    """사이트맵의 <url> 항목"""
+
+    url: str
+    lastmod: str | None = None
+
+
+def parse_lastmod(value: str | None) -> float | None:
+    """W3C datetime(<lastmod>)을 epoch 초로 변환 (날짜만 있으면 UTC 자정, 실패하면 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _drain(parser: XMLPullParser):
+    """파싱된 <url>/<sitemap> 요소를 (종류, loc, lastmod)로 꺼내고 요소는 비움"""
+    for _, element in parser.read_events():
+        kind = _local_name(element.tag)
+        if kind not in ("url", "sitemap"):
+            continue
+
+        loc = lastmod = None
+        for child in element:
+            name = _local_name(child.tag)
+            if name == "loc":
+                loc = (child.text or "").strip()
+            elif name == "lastmod":
+                lastmod = (child.text or "").strip() or None
+
+        # 큰 사이트맵에서도 메모리가 늘지 않도록 처리한 요소는 비움
+        element.clear()
+        if loc:
+            yield kind, loc, lastmod
+
+
+async def _iter_sitemap_document(client: httpx.AsyncClient, url: str):
+    """사이트맵 문서 하나를 받으면서 파싱 (gzip이면 스트리밍 해제)"""
+    parser = XMLPullParser(events=("end",))
+    decompressor = None
+    first_chunk = True
+
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            if first_chunk:
+                first_chunk = False
+                # .xml.gz는 Content-Encoding 없이 gzip 바이트 그대로 오는 경우가 많음
+                if chunk.startswith(_GZIP_MAGIC):
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+            parser.feed(decompressor.decompress(chunk) if decompressor else chunk)
+            for item in _drain(parser):
+                yield item
+
+    if decompressor is not None:
+        parser.feed(decompressor.flush())
+    parser.close()
+    for item in _drain(parser):
+        yield item
+
+
+async def iter_sitemap(
+    sitemap_urls: list[str],
+    client: httpx.AsyncClient,
+    max_sitemaps: int = MAX_SITEMAPS,
+) -> AsyncIterator[SitemapEntry]:
+    """사이트맵(인덱스 포함)의 URL 항목을 받는 즉시 yield
+
+    사이트맵 인덱스의 하위 사이트맵은 큐에 넣어 순서대로 처리한다.
+    읽지 못한 사이트맵은 경고만 출력하고 건너뛴다.
+    """
+    queue = deque(sitemap_urls)
+    seen: set[str] = set()
+
+    while queue and len(seen) < max_sitemaps:
+        sitemap_url = queue.popleft()
+        if sitemap_url in seen:
+            continue
+        seen.add(sitemap_url)
+
+        try:
+            async with aclosing(_iter_sitemap_document(client, sitemap_url)) as items:
+                async for kind, loc, lastmod in items:
+                    if kind == "sitemap":
+                        queue.append(loc)
+                    else:
+                        yield SitemapEntry(loc, lastmod)
+        except (httpx.HTTPError, ParseError, zlib.error) as e:
+            print(f"⚠️ Skipping sitemap {sitemap_url}: {e}")
+
+
+async def discover_sitemaps(start_url: str, client: httpx.AsyncClient) -> list[str]:
+    """크롤링할 사이트맵 URL 결정
+
+    시작 URL 자체가 사이트맵(.xml, .xml.gz)이면 그대로 사용하고, 아니면
+    robots.txt의 Sitemap: 항목, 그것도 없으면 /sitemap.xml을 사용한다.
+    """
+    parts = urlsplit(start_url)
+    if parts.path.endswith((".xml", ".xml.gz")):
+        return [start_url]
+
+    origin = f"{parts.scheme}://{parts.netloc}"
+    sitemaps = []
+    try:
+        response = await client.get(f"{origin}/robots.txt")
+        if response.status_code == 200:
+            for line in response.text.splitlines():
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "sitemap" and value.strip():
+                    sitemaps.append(value.strip())
+    except httpx.HTTPError:
+        pass
+
+    return sitemaps or [f"{origin}/sitemap.xml"]
+
+
+async def collect_sitemap_entries(
+    start_url: str,
+    url_prefix: str | None = None,
+    max_pages: int | None = None,
+    client: httpx.AsyncClient | None = None,
+    lowercase_path: bool = False,
+) -> list[SitemapEntry]:
+    """시작 URL의 사이트맵에서 크롤링할 URL 목록 수집
+
+    시작 URL과 같은 호스트, url_prefix로 시작하는 URL만 남기고 정규화된 URL
+    기준으로 중복을 제거한다. max_pages개가 모이면 남은 사이트맵은 받지 않는다.
+    lowercase_path면 중복 판정과 프리픽스 비교에서 경로 대소문자를 무시한다.
+
+    Returns:
+        사이트맵에 적힌 URL과 lastmod 리스트 (사이트맵 순서). 정규화된 URL은 리다이렉트나
+        404가 날 수 있으므로 요청에는 원래 URL을 쓴다
+    """
+    host = urlsplit(canonicalize_url(start_url)).netloc
+    prefix = canonical_prefix(url_prefix, lowercase_path) if url_prefix else None
+
+    owns_client = client is None
+    if owns_client:
+        client = httpx.AsyncClient(follow_redirects=True, timeout=30.0)
+
+    entries: dict[str, SitemapEntry] = {}
+    try:
+        sitemap_urls = await discover_sitemaps(start_url, client)
+        print(f"🗺️ Reading sitemap: {', '.join(sitemap_urls)}")
+
+        # max_pages에서 멈추면 받던 사이트맵 응답도 바로 닫도록 aclosing 사용
+        async with aclosing(iter_sitemap(sitemap_urls, client)) as sitemap_entries:
+            async for entry in sitemap_entries:
+                key = canonicalize_url(entry.url, lowercase_path=lowercase_path)
+                if urlsplit(key).netloc != host or key in entries:
+                    continue
+                if prefix and not matches_prefix(key, prefix, lowercase_path):
+                    continue
+
+                entries[key] = SitemapEntry(entry.url.strip(), entry.lastmod)
+                if max_pages and len(entries) >= max_pages:
+                    break
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    return list(entries.values())
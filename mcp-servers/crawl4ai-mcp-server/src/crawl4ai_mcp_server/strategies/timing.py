@@ -0,0 +1,245 @@
+"""Per-page stage timings (fetch, scrape, clean, write) for crawls."""
+
+import bisect
+import contextvars
+import math
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+
+STAGES = ("fetch", "scrape", "clean", "write")
+
+# 출력 디렉토리 안에 저장되는 단계별 시간 집계 파일명
+TIMINGS_FILENAME = ".crawl-timings.json"
+
+# 히스토그램 버킷 상한 (ms, 마지막 버킷은 그보다 큰 값 전부)
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# 현재 크롤링의 StageTimings (crawl4ai 내부에서 만드는 태스크에도 상속됨)
+_active: contextvars.ContextVar["StageTimings | None"] = contextvars.ContextVar("stage_timings", default=None)
+
+# scrape 단계를 기록 중인 페이지 URL (마크다운 생성 시간을 같은 페이지에 더하기 위해)
+_page_url: contextvars.ContextVar[str | None] = contextvars.ContextVar("stage_page_url", default=None)
+
+
+class StageHistogram:
+    """한 단계의 소요 시간 분포 (정확한 백분위수를 위해 샘플도 보관)"""
+
+    def __init__(self):
+        self.samples: list[float] = []
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, seconds * 1000)] += 1
+
+    def percentile(self, q: float) -> float:
+        """nearest-rank 백분위수 (초, 샘플이 없으면 0)"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1, math.ceil(len(ordered) * q / 100) - 1))
+        return ordered[rank]
+
+    def summary(self) -> dict:
+        total = sum(self.samples)
+        count = len(self.samples)
+        labels = [f"<={bound}ms" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}ms"]
+        return {
+            "count": count,
+            "total_ms": round(total * 1000, 1),
+            "mean_ms": round(total / count * 1000, 2) if count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "max_ms": round(max(self.samples, default=0.0) * 1000, 2),
+            "histogram": {label: n for label, n in zip(labels, self.buckets) if n},
+        }
+
+
+class StageTimings:
+    """크롤링 한 번의 페이지별 단계 시간 집계
+
+    - fetch: 브라우저 탐색 + HTML 수신 (crawler_strategy.crawl)
+    - scrape: crawl4ai의 HTML 정리(스크래핑 전략) + 마크다운 생성
+    - clean: 정리 파이프라인 (룰 팩)
+    - write: 저장 (파일 / 컨텐츠 저장소 / 단일 파일 / 매니페스트 / 청크)
+
+    fetch/scrape는 크롤러 안에서 URL별로 모아 두었다가 take()로 꺼내고,
+    clean/write와 함께 page_done()으로 확정한다. on_page가 있으면 페이지마다
+    {url, fetch, scrape, clean, write}(초) dict로 호출한다 (PageWriter 워커 스레드에서 호출).
+    """
+
+    def __init__(self, on_page: Callable[[dict], None] | None = None):
+        self.on_page = on_page
+        self.stages = {stage: StageHistogram() for stage in STAGES}
+        self.pages = 0
+        self._pending: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def add_pending(self, url: str, stage: str, seconds: float) -> None:
+        """크롤러 안에서 측정한 단계 시간을 URL별로 누적"""
+        with self._lock:
+            stages = self._pending.setdefault(url, {})
+            stages[stage] = stages.get(stage, 0.0) + seconds
+
+    def take(self, url: str, redirected_url: str | None = None) -> dict[str, float]:
+        """URL의 누적된 fetch/scrape 시간을 꺼냄 (없으면 빈 dict)
+
+        fetch는 요청 URL로, scrape는 크롤러가 넘기는 URL로 기록되므로 리다이렉트된
+        페이지는 두 URL에 나뉘어 있을 수 있다. redirected_url의 기록도 함께 꺼내서 합친다
+        (남겨 두면 _pending이 계속 커짐).
+        """
+        with self._lock:
+            stages = self._pending.pop(url, {})
+            if redirected_url and redirected_url != url:
+                for stage, seconds in self._pending.pop(redirected_url, {}).items():
+                    stages[stage] = stages.get(stage, 0.0) + seconds
+            return stages
+
+    def page_done(self, url: str, stages: dict[str, float]) -> None:
+        """페이지 하나의 단계 시간을 히스토그램에 반영"""
+        with self._lock:
+            self.pages += 1
+            for stage, seconds in stages.items():
+                self.stages[stage].add(seconds)
+        if self.on_page is not None:
+            try:
+                self.on_page({"url": url, **stages})
+            except Exception as e:
+                # 메트릭 수집 실패로 크롤링이 멈추지 않도록
+                print(f"⚠️ Stage timing hook failed: {e}")
+
+    def report(self) -> dict:
+        """JSON으로 저장할 수 있는 집계 결과"""
+        with self._lock:
+            return {
+                "pages": self.pages,
+                "wall_ms": round((time.perf_counter() - self._started) * 1000, 1),
+                "stages": {stage: hist.summary() for stage, hist in self.stages.items()},
+            }
+
+    def format_summary(self) -> str:
+        """단계별 한 줄 요약 (count / p50 / p95 / 합계)"""
+        lines = []
+        for stage, hist in self.stages.items():
+            s = hist.summary()
+            if s["count"]:
+                lines.append(
+                    f"{stage:<6} n={s['count']:<5} p50 {s['p50_ms']:>8.1f} ms  p95 {s['p95_ms']:>8.1f} ms  "
+                    f"total {s['total_ms'] / 1000:>7.2f} s"
+                )
+        return "\n".join(lines)
+
+    @contextmanager
+    def activate(self):
+        """with 블록 안에서 instrument_crawler / timed_config의 측정값을 이 객체에 기록"""
+        token = _active.set(self)
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+
+class _TimedScrapingStrategy:
+    """스크래핑 전략 래퍼 (scrap 시간을 scrape 단계로 기록)"""
+
+    def __init__(self, inner):
+        self._inner = inner
+
+    def __getattr__(self, name):
+        # copy/pickle로 만든 빈 인스턴스에서 무한 재귀하지 않도록
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    @property
+    def logger(self):
+        return self._inner.logger
+
+    @logger.setter
+    def logger(self, value):
+        self._inner.logger = value
+
+    def scrap(self, url: str, html: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._inner.scrap(url, html, **kwargs)
+        finally:
+            _page_url.set(url)
+            _record(url, "scrape", time.perf_counter() - start)
+
+    async def ascrap(self, url: str, html: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await self._inner.ascrap(url, html, **kwargs)
+        finally:
+            _page_url.set(url)
+            _record(url, "scrape", time.perf_counter() - start)
+
+
+class _TimedMarkdownGenerator:
+    """마크다운 생성기 래퍼 (생성 시간을 같은 페이지의 scrape 단계에 더함)"""
+
+    def __init__(self, inner):
+        self._inner = inner
+
+    def __getattr__(self, name):
+        # copy/pickle로 만든 빈 인스턴스에서 무한 재귀하지 않도록
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    def generate_markdown(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._inner.generate_markdown(*args, **kwargs)
+        finally:
+            url = _page_url.get()
+            if url is not None:
+                _record(url, "scrape", time.perf_counter() - start)
+
+
+def _record(url: str, stage: str, seconds: float) -> None:
+    timings = _active.get()
+    if timings is not None:
+        timings.add_pending(url, stage, seconds)
+
+
+def timed_config(crawler_config):
+    """스크래핑 전략과 마크다운 생성기를 시간 측정 래퍼로 감싼 설정 사본"""
+    from crawl4ai import DefaultMarkdownGenerator, LXMLWebScrapingStrategy
+
+    scraping = crawler_config.scraping_strategy or LXMLWebScrapingStrategy()
+    markdown = crawler_config.markdown_generator or DefaultMarkdownGenerator()
+    if isinstance(scraping, _TimedScrapingStrategy):
+        return crawler_config
+    return crawler_config.clone(
+        scraping_strategy=_TimedScrapingStrategy(scraping),
+        markdown_generator=_TimedMarkdownGenerator(markdown),
+    )
+
+
+def instrument_crawler(crawler) -> None:
+    """크롤러의 fetch(crawler_strategy.crawl) 시간을 활성 StageTimings에 기록하도록 설정
+
+    크롤러 인스턴스에 한 번만 적용되고, 활성 StageTimings가 없는 호출(다른 도구의
+    크롤링 등)에는 영향이 없다. 풀에서 공유하는 크롤러도 크롤링마다 자기 객체에 기록된다.
+    """
+    strategy = crawler.crawler_strategy
+    crawl = strategy.crawl
+    if getattr(crawl, "_stage_timed", False):
+        return
+
+    async def timed_crawl(url, *args, **kwargs):
+        if _active.get() is None:
+            return await crawl(url, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return await crawl(url, *args, **kwargs)
+        finally:
+            _record(url, "fetch", time.perf_counter() - start)
+
+    timed_crawl._stage_timed = True
+    strategy.crawl = timed_crawl
@@ -1,6 +1,18 @@
 """Utility functions for crawling."""
 
 from .domain import extract_domain, extract_output_dir_name
+from .fs import write_json_atomic, write_text_atomic
 from .path import url_to_filepath
+from .url import canonical_prefix, canonicalize_url, extract_canonical_link, matches_prefix
 
-__all__ = ["extract_domain", "extract_output_dir_name", "url_to_filepath"]
+__all__ = [
+    "canonical_prefix",
+    "canonicalize_url",
+    "extract_canonical_link",
+    "extract_domain",
+    "extract_output_dir_name",
+    "matches_prefix",
+    "url_to_filepath",
+    "write_json_atomic",
+    "write_text_atomic",
+]
@@ -0,0 +1,41 @@
+"""Filesystem utilities."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """텍스트 파일을 원자적으로 저장
+
+    같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체하므로
+    쓰는 도중 프로세스가 죽어도 기존 파일이 깨지지 않는다.
+
+    Args:
+        path: 저장할 파일 경로
+        text: 저장할 내용 (UTF-8)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """JSON 파일을 원자적으로 저장 (write_text_atomic 참고)
+
+    Args:
+        path: 저장할 파일 경로
+        data: JSON으로 직렬화할 데이터
+    """
+    write_text_atomic(path, json.dumps(data, ensure_ascii=False, indent=2))
@@ -0,0 +1,18 @@
+"""Process memory measurement."""
+
+import psutil
+
+
+def process_tree_rss() -> int:
+    """현재 프로세스와 모든 하위 프로세스(브라우저 등)의 RSS 합 (바이트)
+
+    측정 중 종료된 하위 프로세스는 건너뛴다.
+    """
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total
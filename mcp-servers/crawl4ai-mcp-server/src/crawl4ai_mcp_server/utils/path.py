@@ -1,14 +1,40 @@
 """Path conversion utilities."""
 
+import hashlib
+import re
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+from .url import canonicalize_url
+
+# 파일명에 그대로 쓰기 어려운 쿼리 문자
+_UNSAFE_QUERY_CHARS_RE = re.compile(r"[^A-Za-z0-9._=,-]")
+_MAX_QUERY_SUFFIX = 64
+
+
+def _query_suffix(query: str) -> str:
+    """쿼리를 파일명 접미사로 변환 (a=1&b=2 -> a=1,b=2, 다른 문자가 있거나 길면 해시 추가)"""
+    # 정규화된 쿼리에서 ","는 %2C로 인코딩되어 있으므로 "&" -> ","는 충돌하지 않음
+    query = query.replace("&", ",")
+    safe = _UNSAFE_QUERY_CHARS_RE.sub("_", query)
+    if safe == query and len(safe) <= _MAX_QUERY_SUFFIX:
+        return safe
+
+    # 치환으로 서로 다른 쿼리가 같은 이름이 되지 않도록 원래 쿼리의 해시를 붙임
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()[:8]
+    return f"{safe[:_MAX_QUERY_SUFFIX - 9]}-{digest}"
 
 
 def url_to_filepath(url: str, base_dir: Path) -> Path:
     """URL을 파일 경로로 변환
 
+    URL은 먼저 canonicalize_url로 정규화되므로 호스트 대소문자, fragment,
+    추적 파라미터, 트레일링 슬래시, index.html 차이는 같은 파일이 된다.
+    의미 있는 쿼리는 파일명에 포함되어 서로 덮어쓰지 않는다.
+
     https://docs.crawl4ai.com/core/deep-crawling/ -> base_dir/core/deep-crawling.md
     https://docs.crawl4ai.com/ -> base_dir/index.md
+    https://docs.crawl4ai.com/blog?page=2 -> base_dir/blog__page=2.md
 
     Args:
         url: 변환할 URL
@@ -17,10 +43,14 @@ def url_to_filepath(url: str, base_dir: Path) -> Path:
     Returns:
         파일 경로 (Path 객체)
     """
-    url_path = urlparse(url).path.strip("/")
+    parts = urlsplit(canonicalize_url(url))
+    url_path = parts.path.strip("/")
 
     if not url_path:
         url_path = "index"
 
+    if parts.query:
+        url_path = f"{url_path}__{_query_suffix(parts.query)}"
+
     file_path = base_dir / f"{url_path}.md"
     return file_path
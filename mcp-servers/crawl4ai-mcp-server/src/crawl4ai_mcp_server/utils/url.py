@@ -0,0 +1,135 @@
+"""URL canonicalization utilities."""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# 추적용으로만 쓰이고 내용에 영향이 없는 쿼리 파라미터
+# (ref는 GitHub의 브랜치 선택처럼 내용을 바꾸는 사이트가 있어서 넣지 않음)
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "ref_src",
+    }
+)
+TRACKING_PREFIXES = ("utm_",)
+
+# 디렉토리 인덱스로 취급하는 파일명 (/docs/index.html -> /docs)
+INDEX_FILES = ("index.html", "index.htm", "index.php")
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+_SLASHES_RE = re.compile(r"/{2,}")
+_LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_REL_CANONICAL_RE = re.compile(r"""\brel\s*=\s*["']?[^"'>]*\bcanonical\b""", re.IGNORECASE)
+_HREF_RE = re.compile(r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str, base: str | None = None, lowercase_path: bool = False) -> str:
+    """URL을 정규 형태로 변환
+
+    - 상대 URL은 base 기준으로 절대 URL로 변환
+    - scheme/호스트 소문자, 기본 포트(:80, :443) 제거 (IPv6 호스트는 대괄호 유지)
+    - fragment(#...) 제거
+    - 추적 파라미터(utm_*, fbclid 등) 제거 후 쿼리 정렬
+    - 중복 슬래시, index.html 제거, 트레일링 슬래시 제거 (루트는 "/")
+
+    https://Docs.Example.com:443/guide/index.html?utm_source=x&b=2&a=1#intro
+    -> https://docs.example.com/guide?a=1&b=2
+
+    Args:
+        url: 변환할 URL
+        base: 상대 URL의 기준 URL
+        lowercase_path: 경로도 소문자로 변환 (대소문자를 구분하지 않는 사이트용)
+
+    Returns:
+        정규화된 URL
+    """
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        # hostname은 IPv6 주소의 대괄호를 벗기므로 다시 감쌈
+        host = f"[{host}]"
+    if parts.port is not None and str(parts.port) != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = _SLASHES_RE.sub("/", parts.path or "/")
+    for index_file in INDEX_FILES:
+        if path.endswith("/" + index_file):
+            path = path[: -len(index_file)]
+            break
+    if len(path) > 1:
+        path = path.rstrip("/")
+    if lowercase_path:
+        path = path.lower()
+
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k)]
+    query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def canonical_prefix(prefix: str, lowercase_path: bool = False) -> str:
+    """URL 프리픽스를 canonicalize_url과 같은 형태로 (끝의 "/"는 유지)"""
+    canonical = canonicalize_url(prefix, lowercase_path=lowercase_path)
+    if prefix.rstrip().endswith("/") and not canonical.endswith("/"):
+        canonical += "/"
+    return canonical
+
+
+def matches_prefix(url: str, prefix: str, lowercase_path: bool = False) -> bool:
+    """정규화된 URL이 canonical_prefix(prefix)로 시작하는지 확인
+
+    프리픽스가 "/"로 끝나면 그 디렉토리 자체(트레일링 슬래시가 제거된 URL)도 포함한다.
+    lowercase_path는 프리픽스를 만들 때와 같은 값을 넘긴다.
+    """
+    canonical = canonicalize_url(url, lowercase_path=lowercase_path)
+    return canonical.startswith(prefix) or canonical + "/" == prefix
+
+
+def extract_canonical_link(html: str | None, base_url: str, lowercase_path: bool = False) -> str | None:
+    """HTML의 <link rel="canonical" href="...">를 정규화해서 반환 (없으면 None)
+
+    <head>만 보면 되므로 </head> 이전까지만 검사한다. 다른 호스트를 가리키는
+    canonical은 미러/신디케이션일 수 있으므로 무시한다.
+    """
+    if not html:
+        return None
+
+    head_end = html.find("</head>")
+    head = html[:head_end] if head_end != -1 else html[:65536]
+
+    for tag in _LINK_TAG_RE.findall(head):
+        if not _REL_CANONICAL_RE.search(tag):
+            continue
+        match = _HREF_RE.search(tag)
+        if not match:
+            return None
+        href = next(group for group in match.groups() if group is not None)
+        if not href.strip():
+            return None
+
+        canonical = canonicalize_url(href, base=base_url, lowercase_path=lowercase_path)
+        if urlsplit(canonical).netloc != urlsplit(canonicalize_url(base_url)).netloc:
+            return None
+        return canonical
+
+    return None
@@ -0,0 +1,68 @@
+"""Tests for cross-page boilerplate removal."""
+
+import json
+
+from crawl4ai_mcp_server.storage.content_store import ContentStore
+from crawl4ai_mcp_server.storage.manifest import content_hash
+from crawl4ai_mcp_server.strategies.boilerplate import (
+    BOILERPLATE_FILENAME,
+    BOILERPLATE_MAX_IDLE_RUNS,
+    dedupe_files,
+    load_known_boilerplate,
+)
+
+BANNER = "You are reading the docs for v2."
+
+
+def _page(url: str, body: str) -> str:
+    return f"# {url}\n\n{body}\n\n{BANNER}\n"
+
+
+def test_content_store_objects_are_relinked_not_rewritten(tmp_path):
+    store = ContentStore(tmp_path)
+    files = []
+    for i in range(4):
+        url = f"https://docs.example.com/p{i}"
+        body = f"page {i}\n\n{BANNER}\n"
+        store.put(content_hash(body), f"# {url}\n\n{body}")
+        files.append(store.link(tmp_path / f"p{i}.md", content_hash(body)))
+    # 같은 객체를 가리키는 두 번째 URL
+    files.append(store.link(tmp_path / "p0-alias.md", content_hash(f"page 0\n\n{BANNER}\n")))
+
+    stats = dedupe_files(files, tmp_path, min_pages=2, replace=store.replace)
+
+    assert stats["files_changed"] == 4
+    assert (tmp_path / "p0.md").read_text() == (tmp_path / "p0-alias.md").read_text()
+    assert BANNER not in (tmp_path / "p0.md").read_text()
+    # 모든 객체는 이름과 내용 해시가 일치
+    for obj in store.objects_path.glob("*/*.md"):
+        assert content_hash(obj.read_text().partition("\n\n")[2]) == obj.stem
+    assert store.gc() == 4
+
+
+def test_known_fingerprints_expire_when_they_stop_recurring(tmp_path):
+    files = []
+    for i in range(3):
+        path = tmp_path / f"p{i}.md"
+        path.write_text(_page(f"https://docs.example.com/p{i}", f"page {i}"))
+        files.append(path)
+    dedupe_files(files, tmp_path, min_pages=2)
+    known = load_known_boilerplate(tmp_path)
+    assert list(known.values()) == [0]
+
+    # 배너가 없어진 뒤의 증분 실행들
+    fresh = tmp_path / "new.md"
+    fresh.write_text("# https://docs.example.com/new\n\nnew page\n")
+    for run in range(1, BOILERPLATE_MAX_IDLE_RUNS):
+        dedupe_files([fresh], tmp_path, min_pages=2, known=known)
+        known = load_known_boilerplate(tmp_path)
+        assert list(known.values()) == [run]
+
+    dedupe_files([fresh], tmp_path, min_pages=2, known=known)
+    assert json.loads((tmp_path / BOILERPLATE_FILENAME).read_text()) == {"fingerprints": {}}
+
+
+def test_legacy_fingerprint_list_is_loaded(tmp_path):
+    (tmp_path / BOILERPLATE_FILENAME).write_text(json.dumps({"fingerprints": ["abc"]}))
+
+    assert load_known_boilerplate(tmp_path) == {"abc": 0}
@@ -0,0 +1,117 @@
+"""Tests for saving and resuming deep crawl checkpoints."""
+
+import asyncio
+
+from crawl4ai_mcp_server.storage.checkpoint import CrawlCheckpoint, checkpoint_path
+from crawl4ai_mcp_server.storage.chunks import ChunkWriter, iter_chunks
+from crawl4ai_mcp_server.storage.packed import iter_packed_pages, open_pack_writer
+
+START = "https://docs.example.com/"
+
+
+def _checkpoint(tmp_path, strategy: str) -> CrawlCheckpoint:
+    return CrawlCheckpoint(checkpoint_path(tmp_path / "out"), START, strategy, interval=0)
+
+
+def _save(checkpoint: CrawlCheckpoint, state: dict, processed=()) -> None:
+    for url in processed:
+        checkpoint.mark_processed(url)
+    asyncio.run(checkpoint.on_state_change(state))
+
+
+def test_best_first_requeues_unfinished_batch_ahead_of_queue(tmp_path):
+    # crawl4ai 큐는 점수를 음수로 저장 (작을수록 먼저)
+    state = {
+        "strategy_type": "best_first",
+        "visited": [START, f"{START}a", f"{START}b"],
+        "queue_items": [
+            {"score": -0.9, "depth": 1, "url": f"{START}c", "parent_url": START},
+            {"score": -0.2, "depth": 1, "url": f"{START}d", "parent_url": START},
+        ],
+        "depths": {START: 0, f"{START}a": 1, f"{START}b": 1, f"{START}c": 1, f"{START}d": 1},
+        "pages_crawled": 1,
+    }
+    _save(_checkpoint(tmp_path, "best_first"), state, processed=[START])
+
+    resumed = _checkpoint(tmp_path, "best_first")
+    loaded = resumed.load()
+
+    assert loaded["visited"] == [START]
+    requeued = {item["url"]: item for item in loaded["queue_items"][:2]}
+    assert set(requeued) == {f"{START}a", f"{START}b"}
+    assert all(item["score"] == -0.9 and item["depth"] == 1 for item in requeued.values())
+    queue = sorted((i["score"], i["depth"], i["url"]) for i in loaded["queue_items"])
+    assert [url for _, _, url in queue[:2]] == [f"{START}a", f"{START}b"]
+    assert resumed.processed == {START}
+
+
+def test_bfs_keeps_unfinished_level_in_pending(tmp_path):
+    state = {
+        "strategy_type": "bfs",
+        "visited": [START, f"{START}a", f"{START}b", f"{START}c"],
+        "pending": [{"url": f"{START}c", "parent_url": f"{START}a"}],
+        "depths": {START: 0, f"{START}a": 1, f"{START}b": 1, f"{START}c": 2},
+        "pages_crawled": 2,
+    }
+    _save(_checkpoint(tmp_path, "bfs"), state, processed=[START, f"{START}a"])
+
+    loaded = _checkpoint(tmp_path, "bfs").load()
+
+    assert [item["url"] for item in loaded["pending"]] == [f"{START}b", f"{START}c"]
+    assert loaded["visited"] == state["visited"]
+
+
+def test_sitemap_checkpoint_restores_processed_urls(tmp_path):
+    checkpoint = _checkpoint(tmp_path, "sitemap")
+    _save(checkpoint, {"strategy_type": "sitemap", "pages_crawled": 0}, processed=[f"{START}a", f"{START}b"])
+
+    resumed = _checkpoint(tmp_path, "sitemap")
+
+    assert resumed.load()["strategy_type"] == "sitemap"
+    assert resumed.processed == {f"{START}a", f"{START}b"}
+
+
+def test_checkpoint_for_other_strategy_is_ignored(tmp_path):
+    _save(_checkpoint(tmp_path, "bfs"), {"strategy_type": "bfs", "visited": [START]}, processed=[START])
+
+    other = _checkpoint(tmp_path, "dfs")
+
+    assert other.load() is None
+    assert other.processed == set()
+
+
+def _page(url: str) -> dict:
+    return {"url": url, "depth": 0, "score": 0.0, "fetched_at": "", "content_hash": "", "markdown": f"# {url}\n\nbody"}
+
+
+def test_pack_and_chunks_resume_after_stop(tmp_path):
+    output = tmp_path / "out"
+    output.mkdir()
+    checkpoint = _checkpoint(tmp_path, "bfs")
+    a, b = f"{START}a", f"{START}b"
+
+    # 첫 실행: a를 저장한 뒤 중단 (core의 예외 처리 순서: 청크 close, pack close, flush)
+    pack = open_pack_writer(output, "jsonl")
+    chunks = ChunkWriter(output, 200, 0)
+    pack.write(_page(a), on_saved=lambda: checkpoint.mark_processed(a))
+    chunks.write(a, "pages.jsonl", _page(a)["markdown"])
+    chunks.close()
+    pack.close()
+    asyncio.run(checkpoint.on_state_change({"strategy_type": "bfs", "visited": [START, a, b], "pending": []}))
+
+    resumed = _checkpoint(tmp_path, "bfs")
+    state = resumed.load()
+    assert resumed.processed == {a}
+    assert [item["url"] for item in state["pending"]] == [START, b]
+
+    # 이어서 크롤링: 기존 pack과 청크 임시 파일에 추가
+    pack = open_pack_writer(output, "jsonl", resume=True)
+    chunks = ChunkWriter(output, 200, 0, resume=True)
+    pack.write(_page(b), on_saved=lambda: resumed.mark_processed(b))
+    chunks.write(b, "pages.jsonl", _page(b)["markdown"])
+    pack.close()
+    chunks.finish()
+
+    assert [page["url"] for page in iter_packed_pages(output)] == [a, b]
+    assert [chunk["url"] for chunk in iter_chunks(output)] == [a, b]
+    assert resumed.processed == {a, b}
@@ -0,0 +1,28 @@
+"""Tests for heading-aware chunking."""
+
+from crawl4ai_mcp_server.strategies.chunking import chunk_id, chunk_markdown
+
+URL = "https://docs.example.com/guide"
+
+
+def test_repeated_sibling_headings_get_distinct_ids():
+    markdown = "# Guide\n\n## Example\n\nfirst example\n\n## Other\n\ntext\n\n## Example\n\nsecond example\n"
+
+    chunks = chunk_markdown(markdown, URL)
+    examples = [c for c in chunks if c["heading_path"] == ["Guide", "Example"]]
+
+    assert len(examples) == 2
+    assert examples[0]["id"] != examples[1]["id"]
+    assert len({c["id"] for c in chunks}) == len(chunks)
+
+
+def test_first_occurrence_keeps_its_id():
+    chunks = chunk_markdown("# Guide\n\n## Example\n\nfirst example\n", URL)
+
+    assert chunks[-1]["id"] == chunk_id(URL, ["Guide", "Example"], 0)
+
+
+def test_ids_are_stable_across_runs():
+    markdown = "# Guide\n\n## Example\n\na\n\n## Example\n\nb\n"
+
+    assert [c["id"] for c in chunk_markdown(markdown, URL)] == [c["id"] for c in chunk_markdown(markdown, URL)]
@@ -0,0 +1,41 @@
+"""Tests for markdown footer cleanup."""
+
+import pytest
+
+from crawl4ai_mcp_server.strategies.content import clean_navigation_content, compile_footer_patterns
+
+
+def test_inline_global_flag_applies_to_its_pattern_only():
+    matcher = compile_footer_patterns(("(?i)copyright", "Next"))
+
+    assert matcher.search("COPYRIGHT 2024")
+    assert matcher.search("Next page")
+    assert not matcher.search("next page")
+
+
+def test_footer_pattern_with_inline_flag_cuts_footer():
+    markdown = "# Title\n\nbody\n\nCopyright 2024\nlinks"
+
+    assert clean_navigation_content(markdown, ["(?i)COPYRIGHT"]) == "# Title\n\nbody"
+
+
+def test_invalid_footer_pattern_raises_value_error():
+    with pytest.raises(ValueError, match="Invalid footer pattern"):
+        compile_footer_patterns(("(unclosed",))
+
+
+def test_backreferences_keep_their_own_group_numbers():
+    matcher = compile_footer_patterns(("(a)\\1", "(b)\\1"))
+
+    assert matcher.search("xbb")
+    assert matcher.search("aa")
+    assert not matcher.search("ab")
+
+
+def test_patterns_may_reuse_group_names():
+    matcher = compile_footer_patterns(("(?P<x>Next)", "(?P<x>Prev)ious", "Footer"))
+
+    assert matcher.search("Previous page")
+    assert matcher.search("Next")
+    assert matcher.search("Footer")
+    assert not matcher.search("body")
@@ -0,0 +1,74 @@
+"""Tests for the deep crawl strategies' link handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+from crawl4ai_mcp_server.configs.deep_crawl import create_bfs_strategy, create_dfs_strategy
+
+
+def _page(url: str, *hrefs: str, html: str = "") -> SimpleNamespace:
+    return SimpleNamespace(url=url, html=html, links={"internal": [{"href": h} for h in hrefs]}, metadata={})
+
+
+def _discover(strategy, page, visited=None):
+    visited = set() if visited is None else visited
+    next_level, depths = [], {}
+    asyncio.run(strategy.link_discovery(page, page.url, 0, visited, next_level, depths))
+    return [url for url, _ in next_level], depths, visited
+
+
+def test_links_are_fetched_by_their_original_url():
+    strategy = create_bfs_strategy("docs.example.com", max_depth=2)
+    page = _page(
+        "https://docs.example.com/",
+        "/guide/",
+        "/api/index.html",
+        "https://github.com/org/repo/tree/x?ref=dev",
+        "/blog?ref=main#top",
+    )
+
+    urls, depths, visited = _discover(strategy, page)
+
+    assert urls == [
+        "https://docs.example.com/guide/",
+        "https://docs.example.com/api/index.html",
+        "https://docs.example.com/blog?ref=main",
+    ]
+    assert depths == dict.fromkeys(urls, 1)
+    assert set(urls) <= visited
+
+
+def test_canonical_duplicates_are_queued_once():
+    strategy = create_bfs_strategy("docs.example.com", max_depth=3)
+    first, _, visited = _discover(strategy, _page("https://docs.example.com/", "/guide/", "/guide/index.html", "/Guide"))
+    second, _, _ = _discover(
+        strategy,
+        _page("https://docs.example.com/guide/", "/guide", "/guide/?utm_source=x", "/guide/api"),
+        visited,
+    )
+
+    assert first == ["https://docs.example.com/guide/", "https://docs.example.com/Guide"]
+    assert second == ["https://docs.example.com/guide/api"]
+
+
+def test_lowercase_paths_dedupes_case_but_keeps_link_case():
+    strategy = create_dfs_strategy("docs.example.com", max_depth=2, lowercase_paths=True)
+    strategy._dfs_seen = {"https://docs.example.com"}
+
+    urls, _, _ = _discover(strategy, _page("https://docs.example.com/", "/Docs/Intro", "/docs/intro"))
+
+    assert urls == ["https://docs.example.com/Docs/Intro"]
+
+
+def test_rel_canonical_target_is_not_queued():
+    strategy = create_bfs_strategy("docs.example.com", max_depth=2)
+    page = _page(
+        "https://docs.example.com/v2/intro",
+        "/intro",
+        "/other",
+        html='<link rel="canonical" href="https://docs.example.com/intro">',
+    )
+
+    urls, _, _ = _discover(strategy, page)
+
+    assert urls == ["https://docs.example.com/other"]
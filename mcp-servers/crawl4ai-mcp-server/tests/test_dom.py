@@ -0,0 +1,25 @@
+"""Tests for lxml DOM pruning."""
+
+import pytest
+
+from crawl4ai_mcp_server.strategies.dom import prune_html
+from crawl4ai_mcp_server.strategies.pipeline import HtmlPruneStage
+
+
+@pytest.mark.parametrize("selector", ["div", ".sidebar", "#toc", "div.sidebar", "div#toc"])
+def test_supported_selectors_prune(selector):
+    html = '<div class="sidebar" id="toc">menu</div><p>body</p>'
+
+    assert prune_html(html, tags=(), selectors=(selector,)) == "<p>body</p>"
+
+
+@pytest.mark.parametrize("selector", ["div > p", "[role=nav]", "a.b.c", "div.'x'", "#a'b", "", "div p"])
+def test_unsupported_selector_raises_with_selector_name(selector):
+    with pytest.raises(ValueError, match="Unsupported selector"):
+        HtmlPruneStage(selectors=(selector,))
+
+
+def test_class_selector_matches_whole_class_name():
+    html = '<div class="sidebar-item">keep</div><div class="nav sidebar">drop</div>'
+
+    assert prune_html(html, tags=(), selectors=(".sidebar",)) == '<div class="sidebar-item">keep</div>'
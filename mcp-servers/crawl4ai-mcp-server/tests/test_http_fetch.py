@@ -0,0 +1,41 @@
+"""Tests for the HTTP-only fetch tier."""
+
+import asyncio
+
+import httpx
+from crawl4ai import CrawlerRunConfig
+
+from crawl4ai_mcp_server.strategies.http_fetch import HttpFetcher
+
+_PAGE = "<html><body><main><h1>Guide</h1><p>" + "Server rendered documentation text. " * 20 + "</p></main></body></html>"
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/old":
+        return httpx.Response(301, headers={"location": "https://docs.example.com/new"})
+    return httpx.Response(200, headers={"content-type": "text/html"}, text=_PAGE)
+
+
+def _fetch(url: str):
+    async def run():
+        fetcher = HttpFetcher()
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler), follow_redirects=True)
+        async with fetcher:
+            return await fetcher.fetch(url, CrawlerRunConfig()), fetcher.stats
+
+    return asyncio.run(run())
+
+
+def test_invalid_url_falls_back_to_browser():
+    page, stats = _fetch("http://[::1")
+
+    assert page is None
+    assert stats.fallbacks == {"invalid_url": 1}
+
+
+def test_redirect_reports_final_url():
+    page, stats = _fetch("https://docs.example.com/old")
+
+    assert page is not None
+    assert page.url == "https://docs.example.com/new"
+    assert stats.http == 1
@@ -0,0 +1,91 @@
+"""Tests for incremental crawl manifest transitions."""
+
+from crawl4ai_mcp_server.core import count_statuses
+from crawl4ai_mcp_server.storage.manifest import CrawlManifest, content_hash
+
+A = "https://docs.example.com/a"
+B = "https://docs.example.com/b"
+C = "https://docs.example.com/c"
+
+
+def _write(manifest: CrawlManifest, url: str, text: str) -> str:
+    path = manifest.output_path / f"{url.rsplit('/', 1)[1]}.md"
+    path.write_text(text, encoding="utf-8")
+    return manifest.record(url, path, content_hash(text), {"ETag": f'"{text}"'})
+
+
+def test_first_crawl_adds_every_page(tmp_path):
+    manifest = CrawlManifest.load(tmp_path)
+
+    assert [_write(manifest, url, "v1") for url in (A, B)] == ["added", "added"]
+
+
+def test_recrawl_reports_changed_unchanged_and_removed(tmp_path):
+    first = CrawlManifest.load(tmp_path)
+    for url in (A, B, C):
+        _write(first, url, "v1")
+    first.save()
+
+    manifest = CrawlManifest.load(tmp_path)
+    results = []
+
+    # 검증자가 같으면 unchanged
+    assert manifest.validators_match(A, {"etag": '"v1"'})
+    manifest.mark_unchanged(A, {"etag": '"v1"'})
+    results.append({"url": A, "status": "unchanged"})
+
+    # 검증자는 없지만 내용 해시가 같아도 unchanged
+    assert not manifest.validators_match(B, {})
+    assert manifest.hash_matches(B, content_hash("v1"))
+    manifest.mark_unchanged(B)
+    results.append({"url": B, "status": "unchanged"})
+
+    # 내용이 바뀐 페이지
+    assert not manifest.hash_matches(C, content_hash("v2"))
+    results.append({"url": C, "status": _write(manifest, C, "v2")})
+
+    assert manifest.prune_unseen() == []
+    assert count_statuses(results) == {"added": 0, "changed": 1, "unchanged": 2, "removed": 0}
+
+
+def test_unseen_pages_are_removed_but_files_kept(tmp_path):
+    first = CrawlManifest.load(tmp_path)
+    for url in (A, B):
+        _write(first, url, "v1")
+    first.save()
+
+    manifest = CrawlManifest.load(tmp_path)
+    manifest.mark_unchanged(A)
+    removed = manifest.prune_unseen()
+    manifest.save()
+
+    assert removed == [{"url": B, "file": str(tmp_path / "b.md")}]
+    assert (tmp_path / "b.md").exists()
+    assert set(CrawlManifest.load(tmp_path).entries) == {A}
+    records = [{"url": A, "status": "unchanged"}] + [{"url": r["url"], "status": "removed"} for r in removed]
+    assert count_statuses(records) == {"added": 0, "changed": 0, "unchanged": 1, "removed": 1}
+
+
+def test_seen_pages_survive_pruning(tmp_path):
+    # 실패했거나 이전 실행(resume)에서 처리한 페이지는 removed로 잡지 않음
+    first = CrawlManifest.load(tmp_path)
+    for url in (A, B):
+        _write(first, url, "v1")
+    first.save()
+
+    manifest = CrawlManifest.load(tmp_path)
+    manifest.mark_seen(A)
+    manifest.mark_seen(B)
+
+    assert manifest.prune_unseen() == []
+
+
+def test_missing_file_is_not_fresh_or_unchanged(tmp_path):
+    manifest = CrawlManifest.load(tmp_path)
+    _write(manifest, A, "v1")
+    (tmp_path / "a.md").unlink()
+
+    assert not manifest.is_fresh(A, 0.0)
+    assert not manifest.validators_match(A, {"etag": '"v1"'})
+    assert not manifest.hash_matches(A, content_hash("v1"))
+    assert _write(manifest, A, "v1") == "changed"
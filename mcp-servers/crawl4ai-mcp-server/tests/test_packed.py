@@ -0,0 +1,73 @@
+"""Tests for single-file packed output."""
+
+import pytest
+
+from crawl4ai_mcp_server.storage.packed import (
+    INDEX_FILENAME,
+    iter_packed_pages,
+    load_pack_index,
+    open_pack_writer,
+)
+
+
+def _record(url: str) -> dict:
+    return {"url": url, "depth": 0, "score": 0.0, "fetched_at": "", "content_hash": "", "markdown": f"# {url}"}
+
+
+def test_jsonl_marks_saved_after_write(tmp_path):
+    saved = []
+    pack = open_pack_writer(tmp_path, "jsonl")
+    pack.write(_record("https://a.com/x"), on_saved=lambda: saved.append("https://a.com/x"))
+
+    assert saved == ["https://a.com/x"]
+    pack.close()
+    assert [r["url"] for r in iter_packed_pages(tmp_path)] == ["https://a.com/x"]
+
+
+def test_parquet_marks_saved_only_after_footer(tmp_path):
+    pytest.importorskip("pyarrow")
+    saved = []
+    pack = open_pack_writer(tmp_path, "parquet")
+    pack.write(_record("https://a.com/x"), on_saved=lambda: saved.append("https://a.com/x"))
+
+    assert saved == []
+    assert not (tmp_path / INDEX_FILENAME).read_text()
+    pack.close()
+    assert saved == ["https://a.com/x"]
+    assert [r["url"] for r in iter_packed_pages(tmp_path)] == ["https://a.com/x"]
+
+
+def test_parquet_resume_drops_unfinished_part(tmp_path):
+    pytest.importorskip("pyarrow")
+    pack = open_pack_writer(tmp_path, "parquet")
+    pack.write(_record("https://a.com/x"))
+    pack.close()
+
+    # 강제 종료로 footer 없이 남은 파일
+    (tmp_path / "pages.1.parquet").write_bytes(b"PAR1")
+
+    pack = open_pack_writer(tmp_path, "parquet", resume=True)
+    pack.write(_record("https://a.com/y"))
+    pack.close()
+
+    assert load_pack_index(tmp_path)["https://a.com/y"]["file"] == "pages.1.parquet"
+    assert [r["url"] for r in iter_packed_pages(tmp_path)] == ["https://a.com/x", "https://a.com/y"]
+
+
+def test_jsonl_resume_drops_partial_record(tmp_path):
+    pack = open_pack_writer(tmp_path, "jsonl")
+    pack.write(_record("https://a.com/x"))
+    pack.close()
+
+    # 강제 종료로 반쯤 써진 레코드와 인덱스 줄
+    with open(tmp_path / "pages.jsonl", "ab") as f:
+        f.write(b'{"url": "https://a.com/cut", "mark')
+    with open(tmp_path / INDEX_FILENAME, "a") as f:
+        f.write('{"url": "https://a.com/cut", "fi')
+
+    pack = open_pack_writer(tmp_path, "jsonl", resume=True)
+    pack.write(_record("https://a.com/y"))
+    pack.close()
+
+    assert [r["url"] for r in iter_packed_pages(tmp_path)] == ["https://a.com/x", "https://a.com/y"]
+    assert set(load_pack_index(tmp_path)) == {"https://a.com/x", "https://a.com/y"}
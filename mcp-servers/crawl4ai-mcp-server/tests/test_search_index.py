@@ -0,0 +1,29 @@
+"""Tests for the full-text search index."""
+
+from crawl4ai_mcp_server.storage.search_index import index_path, remove_search_index, search_pages
+
+
+def _write_page(output_path, name, url, body):
+    (output_path / name).write_text(f"# {url}\n\n{body}\n", encoding="utf-8")
+
+
+def test_search_builds_index_from_saved_pages(tmp_path):
+    _write_page(tmp_path, "intro.md", "https://docs.example.com/intro", "# Intro\n\nInstall the crawler")
+
+    hits = search_pages(tmp_path, "install")
+
+    assert [hit["url"] for hit in hits] == ["https://docs.example.com/intro"]
+    assert index_path(tmp_path).exists()
+
+
+def test_removed_index_is_rebuilt_with_recrawled_pages(tmp_path):
+    _write_page(tmp_path, "intro.md", "https://docs.example.com/intro", "# Intro\n\nInstall the crawler")
+    search_pages(tmp_path, "install")
+
+    # 색인 없이 다시 크롤링해서 페이지가 바뀐 경우
+    _write_page(tmp_path, "intro.md", "https://docs.example.com/intro", "# Intro\n\nConfigure the browser")
+    assert remove_search_index(tmp_path)
+
+    assert search_pages(tmp_path, "install") == []
+    assert [hit["url"] for hit in search_pages(tmp_path, "browser")] == ["https://docs.example.com/intro"]
+    assert not remove_search_index(tmp_path / "missing")
@@ -0,0 +1,21 @@
+"""Tests for per-page stage timings."""
+
+from crawl4ai_mcp_server.strategies.timing import StageTimings
+
+
+def test_take_merges_stages_recorded_under_redirect_target():
+    timings = StageTimings()
+    timings.add_pending("https://a.com/old", "fetch", 1.0)
+    timings.add_pending("https://a.com/new", "scrape", 0.5)
+
+    assert timings.take("https://a.com/old", "https://a.com/new") == {"fetch": 1.0, "scrape": 0.5}
+    assert timings._pending == {}
+
+
+def test_take_without_redirect():
+    timings = StageTimings()
+    timings.add_pending("https://a.com/x", "fetch", 1.0)
+    timings.add_pending("https://a.com/x", "fetch", 0.5)
+
+    assert timings.take("https://a.com/x", "https://a.com/x") == {"fetch": 1.5}
+    assert timings.take("https://a.com/x") == {}
@@ -0,0 +1,34 @@
+"""Tests for URL canonicalization."""
+
+from crawl4ai_mcp_server.utils.url import canonical_prefix, canonicalize_url, extract_canonical_link, matches_prefix
+
+
+def test_ipv6_host_keeps_brackets():
+    assert canonicalize_url("http://[::1]:8000/x") == "http://[::1]:8000/x"
+    assert canonicalize_url("HTTP://[FE80::1]:80/docs/") == "http://[fe80::1]/docs"
+
+
+def test_ipv6_relative_link_resolves_against_base():
+    assert canonicalize_url("../y", base="http://[::1]:8000/a/b") == "http://[::1]:8000/y"
+
+
+def test_path_case_is_kept_by_default():
+    assert canonicalize_url("https://Docs.Example.com/Guide/Intro") == "https://docs.example.com/Guide/Intro"
+
+
+def test_lowercase_path_matches_prefix_case_insensitively():
+    prefix = canonical_prefix("https://docs.example.com/API/", lowercase_path=True)
+
+    assert prefix == "https://docs.example.com/api/"
+    assert matches_prefix("https://docs.example.com/Api/Auth", prefix, lowercase_path=True)
+    assert not matches_prefix("https://docs.example.com/Api/Auth", canonical_prefix("https://docs.example.com/API/"))
+
+
+def test_lowercase_path_applies_to_canonical_link():
+    html = '<head><link rel="canonical" href="/Docs/Intro"></head>'
+
+    assert extract_canonical_link(html, "https://docs.example.com/x", lowercase_path=True) == "https://docs.example.com/docs/intro"
+
+
+def test_ref_param_is_kept():
+    assert canonicalize_url("https://github.com/o/r/blob/x?ref=dev&utm_source=a") == "https://github.com/o/r/blob/x?ref=dev"